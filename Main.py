@@ -25,6 +25,15 @@ def main():
     parser.add_argument('-s', '--owl', help='yes/no - removing OWL Semantics from knowledge graph', required=True)
     parser.add_argument('-m', '--nde', help='yes/no - adding node metadata to knowledge graph', required=True)
     parser.add_argument('-o', '--out', help='name/path to directory where to write knowledge graph', required=True)
+    parser.add_argument('-w', '--wrk', help='number of processes used to build edges and decode OWL-NETS classes '
+                                            '(default=1)', type=int, default=1, required=False)
+    parser.add_argument('--resume', help='resume the build from the last step with a valid checkpoint',
+                        action='store_true', required=False)
+    parser.add_argument('--checkpoint', help='write a checkpoint after each build step so the build can be resumed '
+                                             '(each holds a copy of the graph and needs extra disk space)',
+                        action='store_true', required=False)
+    parser.add_argument('-d', '--sto', help='graph store backend: "memory" or "integer" (default="memory")',
+                        default='memory', required=False)
     args = parser.parse_args()
 
     ######################
@@ -82,19 +91,31 @@ def main():
                           node_data=args.nde,
                           inverse_relations=args.rel,
                           decode_owl=args.owl,
-                          write_location=args.out)
+                          write_location=args.out,
+                          workers=args.wrk,
+                          resume=args.resume,
+                          store=args.sto,
+                          checkpoint=args.checkpoint)
     elif args.kg == 'post-closure':
         kg = PostClosureBuild(construction=args.app,
                               node_data=args.nde,
                               inverse_relations=args.rel,
                               decode_owl=args.owl,
-                              write_location=args.out)
+                              write_location=args.out,
+                              workers=args.wrk,
+                              resume=args.resume,
+                              store=args.sto,
+                              checkpoint=args.checkpoint)
     else:
         kg = FullBuild(construction=args.app,
                        node_data=args.nde,
                        inverse_relations=args.rel,
                        decode_owl=args.owl,
-                       write_location=args.out)
+                       write_location=args.out,
+                       workers=args.wrk,
+                       resume=args.resume,
+                       store=args.sto,
+                       checkpoint=args.checkpoint)
     kg.construct_knowledge_graph()
 
     end = time.time(); timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Synthetic-Scale Benchmarks.
+
+Runs the build pipeline over synthetic data generated by benchmarks/synthetic_data.py and times each component
+(CreatesEdgeList, KGBuilder, OwlNets, maps_ids_to_integers, and convert_to_networkx). The results are written as JSON,
+together with the benchmark configuration and the commit they were run on, so that runs can be compared across commits
+with the --compare option. See benchmarks/README.md for usage.
+"""
+
+# import needed libraries
+import argparse
+import contextlib
+import datetime
+import glob
+import json
+import os
+import os.path
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+from typing import Any, Callable, Dict, List, Optional
+from xml.sax import SAXParseException
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # KGBuilder finds owltools from the root
+
+import rdflib  # type: ignore  # noqa: E402
+
+import pkt_kg.knowledge_graph  # noqa: E402
+from benchmarks.synthetic_data import generates_benchmark_data, sizes  # noqa: E402
+from pkt_kg.__version__ import __version__  # noqa: E402
+from pkt_kg.edge_list import CreatesEdgeList  # noqa: E402
+from pkt_kg.knowledge_graph import PartialBuild  # noqa: E402
+from pkt_kg.owlnets import OwlNets  # noqa: E402
+from pkt_kg.utils import convert_to_networkx, gets_resource_usage, maps_ids_to_integers  # noqa: E402
+
+
+def gets_commit() -> Optional[str]:
+    """Returns the hash of the checked out git commit or None if it can not be found."""
+
+    try: return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError): return None
+
+
+def times_component(func: Callable, setup: Optional[Callable] = None, repeats: int = 3, verbose: bool = False) -> Dict:
+    """Runs a benchmark component several times and measures the wall time, CPU time, and peak RSS delta of each run.
+    The setup function is run (untimed) before each run and its result is passed to the component.
+
+    Args:
+        func: A function containing the component to time.
+        setup: A function that prepares the input of a run (default=None).
+        repeats: An integer containing the number of runs (default=3).
+        verbose: A bool indicating whether or not to show the output printed by the component (default=False).
+
+    Returns:
+        A dictionary containing the measurements for each run, the median and minimum wall time, the median CPU time,
+        the largest peak RSS delta, and the result returned by the last run.
+    """
+
+    runs: List = []; result = None
+    for _ in range(repeats):
+        arg = setup() if setup is not None else None
+        with open(os.devnull, 'w') as devnull:
+            with contextlib.ExitStack() as stack:
+                if not verbose: stack.enter_context(contextlib.redirect_stdout(devnull))
+                if not verbose: stack.enter_context(contextlib.redirect_stderr(devnull))
+                start_cpu, start_rss = gets_resource_usage(); start = time.perf_counter()
+                result = func(arg) if setup is not None else func()
+                wall = time.perf_counter() - start; cpu, rss = gets_resource_usage()
+        runs += [{'wall_time_sec': round(wall, 4), 'cpu_time_sec': round(cpu - start_cpu, 4),
+                  'peak_rss_delta_mb': round(rss - start_rss, 2)}]
+    walls = [x['wall_time_sec'] for x in runs]
+
+    return {'runs': runs, 'wall_time_sec': round(statistics.median(walls), 4), 'min_wall_time_sec': min(walls),
+            'cpu_time_sec': round(statistics.median([x['cpu_time_sec'] for x in runs]), 4),
+            'peak_rss_delta_mb': max(x['peak_rss_delta_mb'] for x in runs), 'result': result}
+
+
+def runs_benchmarks(config: Dict, work_dir: str, verbose: bool = False) -> Dict:
+    """Generates the synthetic data and benchmarks each pipeline component.
+
+    Args:
+        config: A dictionary containing the benchmark configuration (see main).
+        work_dir: A string pointing to a directory to write the synthetic data and build outputs to.
+        verbose: A bool indicating whether or not to show the output printed by the components (default=False).
+
+    Returns:
+        A dictionary keyed by component name containing the measurements for the component.
+    """
+
+    results: Dict = dict(); repeats = config['repeats']
+    if os.path.exists(work_dir): shutil.rmtree(work_dir)
+    start = time.perf_counter()
+    data_files, ontology_triples = generates_benchmark_data(work_dir, config['classes'], config['genes'],
+                                                            config['edges'], config['seed'])
+    print('Generated Synthetic Data ({} ontology triples) in {:.2f} seconds'.format(
+        ontology_triples, time.perf_counter() - start))
+
+    # CREATES EDGE LIST -- the master edge list is removed before each run so every edge type is processed
+    def sets_up_edge_list() -> CreatesEdgeList:
+        for f in glob.glob(work_dir + '/edge_sources/Master_Edge_List_Dict.json'): os.remove(f)
+        return CreatesEdgeList(data_files=data_files, source_file=work_dir + '/edge_sources/resource_info.txt')
+    res = times_component(lambda x: x.creates_knowledge_graph_edges() or x, sets_up_edge_list, repeats, verbose)
+    edge_info = res.pop('result').source_info
+    edge_count = sum(len(v['edge_list']) for k, v in edge_info.items() if k != 'entity_namespaces')
+    results['CreatesEdgeList'] = dict(res, input_edges=edge_count)
+    print('CreatesEdgeList: {} seconds'.format(results['CreatesEdgeList']['wall_time_sec']))
+
+    # KGBUILDER -- a partial build (relations, merged ontology, node metadata, graph split, and edges) from a fresh copy
+    # of the resources directory, so that no checkpoints, caches, or previous outputs are reused
+    def sets_up_kg_builder() -> PartialBuild:
+        if os.path.exists(work_dir + '/build'): shutil.rmtree(work_dir + '/build')
+        shutil.copytree(work_dir + '/resources', work_dir + '/build')
+        return PartialBuild(construction=config['approach'], node_data=config['node_data'],
+                            inverse_relations=config['inverse_relations'], decode_owl='yes',
+                            write_location=work_dir + '/build/knowledge_graphs', workers=config['workers'],
+                            store=config['store'])
+    res = times_component(lambda x: x.construct_knowledge_graph() or x, sets_up_kg_builder, repeats, verbose)
+    kg = res.pop('result'); results['KGBuilder'] = dict(res, input_triples=ontology_triples)
+    print('KGBuilder: {} seconds'.format(results['KGBuilder']['wall_time_sec']))
+
+    # OWLNETS -- decodes the logic graph written by the partial build
+    logic_file = glob.glob(kg.write_location + '/*_LogicOnly.owl')[0]
+    try: logic_triples = list(rdflib.Graph().parse(logic_file, format='xml'))
+    except SAXParseException: logic_triples = list(rdflib.Graph().parse(logic_file, format='turtle'))  # rdflib>=6
+    store = 'Integer' if config['store'] == 'integer' else 'default'
+
+    def sets_up_owl_nets() -> OwlNets:
+        graph = rdflib.Graph(store=store); graph.addN((s, p, o, graph) for s, p, o in logic_triples)
+        return OwlNets(graph, kg.write_location, kg.full_kg, config['approach'], kg.owl_tools, config['workers'])
+    res = times_component(lambda x: x.run_owl_nets(), sets_up_owl_nets, repeats, verbose)
+    owl_nets_graph = res.pop('result')[0]; results['OwlNets'] = dict(res, input_triples=len(logic_triples))
+    print('OwlNets: {} seconds'.format(results['OwlNets']['wall_time_sec']))
+
+    # MAPS IDS TO INTEGERS AND CONVERT TO NETWORKX -- run over the OWL-NETS graph
+    f_name = kg.full_kg[:-4] + '_Benchmark_Triples_Integers.txt'
+    res = times_component(lambda: maps_ids_to_integers(owl_nets_graph, kg.write_location, f_name,
+                                                       f_name[:-5] + '_Identifier_Map.json'), None, repeats, verbose)
+    res.pop('result'); results['maps_ids_to_integers'] = dict(res, input_triples=len(owl_nets_graph))
+    print('maps_ids_to_integers: {} seconds'.format(results['maps_ids_to_integers']['wall_time_sec']))
+    graph = rdflib.Graph(); graph.addN((s, p, o, graph) for s, p, o in owl_nets_graph)
+    res = times_component(lambda: convert_to_networkx(kg.write_location, kg.full_kg[:-4] + '_Benchmark', graph),
+                          None, repeats, verbose)
+    res.pop('result'); results['convert_to_networkx'] = dict(res, input_triples=len(graph))
+    print('convert_to_networkx: {} seconds'.format(results['convert_to_networkx']['wall_time_sec']))
+    for component in results.values():
+        count = component.get('input_triples', component.get('input_edges'))
+        component['throughput_per_sec'] = round(count / component['wall_time_sec'], 2) \
+            if component['wall_time_sec'] > 0 else None
+
+    return results
+
+
+def compares_results(results: Dict, previous: Dict) -> None:
+    """Prints the median wall time of each component in two benchmark results and the ratio between them.
+
+    Args:
+        results: A dictionary containing the current benchmark results.
+        previous: A dictionary containing the benchmark results to compare against.
+
+    Returns:
+        None.
+    """
+
+    config, previous_config = [{k: v for k, v in x['config'].items() if k != 'repeats'} for x in [results, previous]]
+    if config != previous_config:
+        print('WARNING: The benchmark configurations differ: {} vs. {}'.format(previous_config, config))
+    old = (previous['environment']['commit'] or 'previous')[:8]
+    new = (results['environment']['commit'] or 'current')[:8]
+    print('\n{:<22}{:>12}{:>12}{:>10}'.format('Component', old, new, 'Ratio'))
+    for component, res in results['results'].items():
+        if component in previous['results']:
+            before, after = previous['results'][component]['wall_time_sec'], res['wall_time_sec']
+            ratio = '{:.2f}x'.format(after / before) if before > 0 else 'NA'
+            print('{:<22}{:>12.3f}{:>12.3f}{:>10}'.format(component, before, after, ratio))
+
+    return None
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmarks pkt_kg over synthetic data.')
+    parser.add_argument('-z', '--size', help='benchmark size: "small", "medium", or "large" (default="small")',
+                        default='small', choices=list(sizes.keys()))
+    parser.add_argument('-c', '--classes', help='number of ontology classes (overrides --size)', type=int)
+    parser.add_argument('-n', '--genes', help='number of genes (overrides --size)', type=int)
+    parser.add_argument('-e', '--edges', help='number of edges per edge type (overrides --size)', type=int)
+    parser.add_argument('-a', '--app', help='construction approach: "subclass" or "instance" (default="subclass")',
+                        default='subclass', choices=['subclass', 'instance'])
+    parser.add_argument('-r', '--rel', help='yes/no - adding inverse relations (default="no")', default='no')
+    parser.add_argument('-m', '--nde', help='yes/no - adding node metadata (default="yes")', default='yes')
+    parser.add_argument('-w', '--wrk', help='number of processes used to build edges and decode OWL-NETS classes '
+                                            '(default=1)', type=int, default=1)
+    parser.add_argument('-d', '--sto', help='graph store backend: "memory" or "integer" (default="memory")',
+                        default='memory')
+    parser.add_argument('-p', '--repeats', help='number of times each component is run (default=3)', type=int,
+                        default=3)
+    parser.add_argument('-s', '--seed', help='random seed for the synthetic data (default=1)', type=int, default=1)
+    parser.add_argument('-t', '--tmp', help='directory for synthetic data and build outputs',
+                        default='benchmarks/tmp')
+    parser.add_argument('-o', '--out', help='file to write the results to (default=benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='results file from a previous run to compare against')
+    parser.add_argument('--verbose', help='show the output printed by each component', action='store_true')
+    args = parser.parse_args()
+
+    config: Dict[str, Any] = dict(sizes[args.size], size=args.size)
+    for key in ['classes', 'genes', 'edges']:
+        if getattr(args, key) is not None: config[key] = getattr(args, key); config['size'] = 'custom'
+    config.update({'approach': args.app, 'inverse_relations': args.rel, 'node_data': args.nde, 'workers': args.wrk,
+                   'store': args.sto, 'repeats': args.repeats, 'seed': args.seed})
+    # OWL Tools (Java) is only used to reformat the serialized graph, so it is skipped when it can not be run
+    owl_tools = os.path.exists('./pkt_kg/libs/owltools') and shutil.which('java') is not None
+    if not owl_tools: pkt_kg.knowledge_graph.ontology_file_formatter = lambda *args, **kwargs: None
+    environment = {'commit': gets_commit(), 'pkt_kg': __version__, 'python': platform.python_version(),
+                   'rdflib': rdflib.__version__, 'platform': platform.platform(), 'cpus': os.cpu_count(),
+                   'owltools_formatting': owl_tools, 'date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    print('Running Benchmarks: {}'.format(config))
+
+    results = {'config': config, 'environment': environment, 'results': runs_benchmarks(config, args.tmp,
+                                                                                        args.verbose)}
+    out_file = args.out or 'benchmarks/results/{}_{}.json'.format((environment['commit'] or 'local')[:8],
+                                                                  config['size'])
+    if os.path.dirname(out_file) != '': os.makedirs(os.path.dirname(out_file), exist_ok=True)
+    with open(out_file, 'w') as out: json.dump(results, out, indent=2)
+    print('Results written to: {}'.format(out_file))
+    if args.compare:
+        with open(args.compare, 'r') as _file: compares_results(results, json.load(_file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Synthetic Benchmark Data.
+
+Generates Ontologies
+* generates_class_ids
+* generates_ontology
+
+Generates Edge Data
+* generates_edges
+* writes_edge_sources
+* writes_build_resources
+
+Generates All Benchmark Inputs
+* generates_benchmark_data
+"""
+
+# import needed libraries
+import json
+import os
+import os.path
+import pickle
+import random
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef  # type: ignore
+from rdflib.collection import Collection  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+from typing import Dict, List, Tuple
+
+# set global attributes
+obo = Namespace('http://purl.obolibrary.org/obo/')
+oboinowl = Namespace('http://www.geneontology.org/formats/oboInOwl#')
+gene_ns = 'http://www.ncbi.nlm.nih.gov/gene/'
+ontology_prefixes = ['PHN', 'CHM', 'ANA']  # synthetic phenotype, chemical, and anatomy ontologies
+relations = {'RO_0002200': 'has phenotype', 'RO_0002434': 'interacts with', 'RO_0002435': 'genetically interacts with',
+             'RO_0002606': 'is substance that treats', 'RO_0003302': 'causes or contributes to condition',
+             'RO_0004004': 'has material basis in', 'RO_0004014': 'is material basis of'}
+inverse_relations = {'RO_0004004': 'RO_0004014'}
+
+# benchmark sizes -- number of ontology classes (split across the ontologies), genes, and edges per edge type
+sizes = {'small': {'classes': 3000, 'genes': 1000, 'edges': 2000},
+         'medium': {'classes': 30000, 'genes': 10000, 'edges': 20000},
+         'large': {'classes': 150000, 'genes': 40000, 'edges': 100000}}
+
+
+def generates_class_ids(n_classes: int) -> Dict[str, List[str]]:
+    """Creates OBO-style class identifiers (e.g. PHN_0000001) split evenly across the synthetic ontologies.
+
+    Args:
+        n_classes: An integer containing the total number of classes.
+
+    Returns:
+        A dictionary keyed by ontology prefix with a list of class identifiers as the value.
+    """
+
+    per_ont = max(n_classes // len(ontology_prefixes), 1)
+
+    return {p: ['{}_{:07d}'.format(p, i + 1) for i in range(per_ont)] for p in ontology_prefixes}
+
+
+def generates_ontology(class_ids: Dict[str, List[str]], seed: int = 1, restriction_rate: float = 0.3,
+                       intersection_rate: float = 0.05, union_rate: float = 0.02, axiom_rate: float = 0.1) -> Graph:
+    """Generates a merged OBO-style ontology containing a class hierarchy for each synthetic ontology rooted at
+    BFO_0000001 ('Entity'), existential restrictions, owl:intersectionOf and owl:unionOf equivalent class axioms,
+    annotations (labels, definitions, synonyms, and database cross-references), and owl:Axiom annotations on class
+    definitions.
+
+    Args:
+        class_ids: A dictionary keyed by ontology prefix with a list of class identifiers as the value.
+        seed: An integer used to seed the random number generator (default=1).
+        restriction_rate: A float containing the fraction of classes with an existential restriction.
+        intersection_rate: A float containing the fraction of classes with an owl:intersectionOf equivalent class.
+        union_rate: A float containing the fraction of classes with an owl:unionOf equivalent class.
+        axiom_rate: A float containing the fraction of classes whose definition is annotated with an owl:Axiom.
+
+    Returns:
+        graph: An RDFLib Graph object.
+    """
+
+    rand = random.Random(seed); graph = Graph(); all_classes = [x for y in class_ids.values() for x in y]
+    graph.add((URIRef(obo + 'pkt_benchmark.owl'), RDF.type, OWL.Ontology))
+    graph.add((obo.BFO_0000001, RDF.type, OWL.Class)); graph.add((obo.BFO_0000001, RDFS.label, Literal('entity')))
+    for rel, label in relations.items():
+        graph.add((obo[rel], RDF.type, OWL.ObjectProperty)); graph.add((obo[rel], RDFS.label, Literal(label)))
+    for prefix, classes in class_ids.items():
+        for i, cls_id in enumerate(classes):
+            cls = obo[cls_id]; label = '{} class {}'.format(prefix.lower(), i + 1)
+            graph.add((cls, RDF.type, OWL.Class)); graph.add((cls, RDFS.label, Literal(label)))
+            definition = Literal('A synthetic {} class used for benchmarking.'.format(prefix.lower()))
+            graph.add((cls, obo.IAO_0000115, definition))
+            graph.add((cls, oboinowl.hasExactSynonym, Literal(label + ' synonym')))
+            graph.add((cls, oboinowl.hasDbXref, Literal('SYN:{}'.format(i + 1))))
+            # class hierarchy -- each class has a parent created before it and some have a second parent
+            parents = [obo.BFO_0000001] if i == 0 else [obo[classes[rand.randrange(i)]]]
+            if i > 1 and rand.random() < 0.1: parents += [obo[classes[rand.randrange(i)]]]
+            for parent in parents: graph.add((cls, RDFS.subClassOf, parent))
+            # existential restriction
+            if rand.random() < restriction_rate:
+                rest = BNode(); graph.add((cls, RDFS.subClassOf, rest)); graph.add((rest, RDF.type, OWL.Restriction))
+                graph.add((rest, OWL.onProperty, obo[rand.choice(list(relations))]))
+                graph.add((rest, OWL.someValuesFrom, obo[rand.choice(all_classes)]))
+            # equivalent classes built from owl:intersectionOf and owl:unionOf
+            if rand.random() < intersection_rate:
+                equiv, rest = BNode(), BNode(); graph.add((cls, OWL.equivalentClass, equiv))
+                graph.add((equiv, RDF.type, OWL.Class)); graph.add((rest, RDF.type, OWL.Restriction))
+                graph.add((rest, OWL.onProperty, obo[rand.choice(list(relations))]))
+                graph.add((rest, OWL.someValuesFrom, obo[rand.choice(all_classes)]))
+                members = BNode(); Collection(graph, members, [parents[0], rest])
+                graph.add((equiv, OWL.intersectionOf, members))
+            if rand.random() < union_rate:
+                equiv, members = BNode(), BNode(); graph.add((cls, OWL.equivalentClass, equiv))
+                graph.add((equiv, RDF.type, OWL.Class))
+                Collection(graph, members, [obo[x] for x in rand.sample(all_classes, 2)])
+                graph.add((equiv, OWL.unionOf, members))
+            # owl:Axiom annotation on the definition
+            if rand.random() < axiom_rate:
+                axiom = BNode(); graph.add((axiom, RDF.type, OWL.Axiom))
+                graph.add((axiom, OWL.annotatedSource, cls)); graph.add((axiom, OWL.annotatedProperty, obo.IAO_0000115))
+                graph.add((axiom, OWL.annotatedTarget, definition))
+                graph.add((axiom, oboinowl.hasDbXref, Literal('PMID:{}'.format(rand.randrange(1, 10 ** 7)))))
+
+    return graph
+
+
+def generates_edges(class_ids: Dict[str, List[str]], n_genes: int, n_edges: int, seed: int = 1) -> Dict:
+    """Generates the edge lists for four edge types that cover each edge data type: gene-phenotype (entity-class),
+    phenotype-gene (class-entity), chemical-phenotype (class-class), and gene-gene (entity-entity).
+
+    Args:
+        class_ids: A dictionary keyed by ontology prefix with a list of class identifiers as the value.
+        n_genes: An integer containing the number of genes.
+        n_edges: An integer containing the number of edges generated for each edge type.
+        seed: An integer used to seed the random number generator (default=1).
+
+    Returns:
+        A dictionary keyed by edge type with a list of unique edges (i.e. tuples of two node identifiers) as the value.
+    """
+
+    rand = random.Random(seed); genes = [str(x + 1) for x in range(n_genes)]
+    phenotypes, chemicals = class_ids['PHN'], class_ids['CHM']
+    edge_nodes = {'gene-phenotype': (genes, phenotypes), 'phenotype-gene': (phenotypes, genes),
+                  'chemical-phenotype': (chemicals, phenotypes), 'gene-gene': (genes, genes)}
+    edges: Dict = dict()
+    for edge_type, (subjects, objects) in edge_nodes.items():
+        edge_set: Dict = dict()
+        for _ in range(n_edges): edge_set[(rand.choice(subjects), rand.choice(objects))] = None
+        edges[edge_type] = list(edge_set)
+
+    return edges
+
+
+def writes_edge_sources(edges: Dict, write_location: str, seed: int = 1) -> Dict[str, str]:
+    """Writes the edge data files, an identifier mapping file, and a resource_info.txt file that CreatesEdgeList
+    processes back into the generated edge lists. The gene-phenotype edges contain an evidence score column, where
+    extra rows that fail the evidence criteria are added, and the chemical-phenotype edges use MeSH-style identifiers
+    which are mapped to the chemical ontology classes.
+
+    Args:
+        edges: A dictionary keyed by edge type with a list of edges as the value (see generates_edges).
+        write_location: A string pointing to the directory to write the files to.
+        seed: An integer used to seed the random number generator (default=1).
+
+    Returns:
+        A dictionary keyed by edge type with the path to its edge data file as the value.
+    """
+
+    rand = random.Random(seed); os.makedirs(write_location, exist_ok=True); data_files = dict()
+    chemicals = sorted({x[0] for x in edges['chemical-phenotype']})
+    mesh_map = {x: 'MESH_D{:06d}'.format(i + 1) for i, x in enumerate(chemicals)}
+    with open(write_location + '/MESH_CHM_MAP.txt', 'w') as out:
+        out.write('mesh_id\tchm_id\n'); out.write(''.join('{}\t{}\n'.format(v, k) for k, v in mesh_map.items()))
+    for edge_type, edge_list in edges.items():
+        data_files[edge_type] = write_location + '/{}_synthetic.txt'.format(edge_type)
+        with open(data_files[edge_type], 'w') as out:
+            if edge_type == 'gene-phenotype':
+                out.write('gene_id\tphenotype_id\tscore\n')
+                for s, o in edge_list: out.write('{}\t{}\t{}\n'.format(s, o, round(rand.uniform(0.5, 1.0), 3)))
+                for s, o in edge_list[:len(edge_list) // 10]:  # rows removed by the evidence criteria
+                    out.write('{}\t{}\t{}\n'.format(s, 'PHN_9999999', round(rand.uniform(0.0, 0.4), 3)))
+            elif edge_type == 'chemical-phenotype':
+                out.write('mesh_id\tphenotype_id\n')
+                out.write(''.join(mesh_map[s] + '\t' + o + '\n' for s, o in edge_list))
+            else:
+                out.write('subject_id\tobject_id\n'); out.write(''.join(s + '\t' + o + '\n' for s, o in edge_list))
+    info = ['gene-phenotype|;;|entity-class|RO_0003302|{0}|{1}|t|0;1|None|2;>=;0.5|None',
+            'phenotype-gene|;;|class-entity|RO_0004004|{1}|{0}|t|0;1|None|None|None',
+            'chemical-phenotype|;;|class-class|RO_0002606|{1}|{1}|t|0;1|0:{2}/MESH_CHM_MAP.txt|None|None',
+            'gene-gene|;;|entity-entity|RO_0002435|{0}|{0}|t|0;1|None|None|None']
+    with open(write_location + '/resource_info.txt', 'w') as out:
+        out.write('\n'.join(x.format(gene_ns, str(obo), write_location) for x in info))
+
+    return data_files
+
+
+def writes_build_resources(graph: Graph, edges: Dict, class_ids: Dict[str, List[str]], n_genes: int,
+                           write_location: str, seed: int = 1) -> None:
+    """Writes a resources directory in the layout KGBuilder expects: the ontology (also written as the merged
+    ontology, so that no merging is needed), the Master_Edge_List_Dict.json, relations data, node metadata for all
+    genes and relations, and a subclass_construction_map.pkl that maps genes to ontology classes (a small number of
+    genes are left unmapped so that subclass errors are exercised).
+
+    Args:
+        graph: An RDFLib Graph object containing the ontology.
+        edges: A dictionary keyed by edge type with a list of edges as the value (see generates_edges).
+        class_ids: A dictionary keyed by ontology prefix with a list of class identifiers as the value.
+        n_genes: An integer containing the number of genes.
+        write_location: A string pointing to the resources directory to write to.
+        seed: An integer used to seed the random number generator (default=1).
+
+    Returns:
+        None.
+    """
+
+    rand = random.Random(seed)
+    for d in ['construction_approach', 'knowledge_graphs', 'node_data', 'ontologies', 'relations_data']:
+        os.makedirs(write_location + '/' + d, exist_ok=True)
+    graph.serialize(write_location + '/ontologies/pkt_benchmark_with_imports.owl', format='xml')
+    graph.serialize(write_location + '/knowledge_graphs/PheKnowLator_MergedOntologies.owl', format='xml')
+    # master edge list
+    edge_info = {'gene-phenotype': ('entity-class', 'RO_0003302', [gene_ns, str(obo)]),
+                 'phenotype-gene': ('class-entity', 'RO_0004004', [str(obo), gene_ns]),
+                 'chemical-phenotype': ('class-class', 'RO_0002606', [str(obo), str(obo)]),
+                 'gene-gene': ('entity-entity', 'RO_0002435', [gene_ns, gene_ns])}
+    master_edges: Dict = {k: {'source_labels': ';;', 'data_type': v[0], 'edge_relation': v[1], 'uri': v[2],
+                              'delimiter': 't', 'column_idx': '0;1', 'identifier_maps': 'None',
+                              'evidence_criteria': 'None', 'filter_criteria': 'None',
+                              'edge_list': [list(x) for x in edges[k]]} for k, v in edge_info.items()}
+    master_edges['entity_namespaces'] = {'gene': gene_ns}
+    with open(write_location + '/Master_Edge_List_Dict.json', 'w') as out: json.dump(master_edges, out)
+    # relations data
+    with open(write_location + '/relations_data/RELATIONS_LABELS.txt', 'w') as out:
+        out.write('Label\tRelation\n' + '\n'.join('{}\t{}'.format(v, obo + k) for k, v in relations.items()))
+    with open(write_location + '/relations_data/INVERSE_RELATIONS.txt', 'w') as out:
+        out.write('Relation\tInverse_Relation\n')
+        out.write('\n'.join('{}\t{}'.format(k, v) for k, v in inverse_relations.items()))
+    # node metadata
+    nodes = {gene_ns + str(x + 1): {'Label': 'GENE{}'.format(x + 1), 'Description': 'Synthetic gene {}.'.format(x + 1),
+                                    'Synonym': 'SYNGENE{}|G{}'.format(x + 1, x + 1)} for x in range(n_genes)}
+    rels = {obo + k: {'Label': v, 'Description': 'None', 'Synonym': 'None'} for k, v in relations.items()}
+    with open(write_location + '/node_data/node_metadata_dict.pkl', 'wb') as out:
+        pickle.dump({'nodes': nodes, 'relations': rels}, out)
+    # subclass construction map
+    all_classes = [x for y in class_ids.values() for x in y]
+    subclass_map = {str(x + 1): rand.sample(all_classes, rand.choice([1, 2])) for x in range(n_genes)
+                    if rand.random() > 0.02}
+    with open(write_location + '/construction_approach/subclass_construction_map.pkl', 'wb') as out:
+        pickle.dump(subclass_map, out)
+
+    return None
+
+
+def generates_benchmark_data(write_location: str, n_classes: int, n_genes: int, n_edges: int,
+                             seed: int = 1) -> Tuple[Dict[str, str], int]:
+    """Generates all of the benchmark inputs under a directory: the edge sources processed by CreatesEdgeList (under
+    "edge_sources") and the resources used by KGBuilder (under "resources").
+
+    Args:
+        write_location: A string pointing to the directory to write to.
+        n_classes: An integer containing the total number of ontology classes.
+        n_genes: An integer containing the number of genes.
+        n_edges: An integer containing the number of edges generated for each edge type.
+        seed: An integer used to seed the random number generator (default=1).
+
+    Returns:
+        data_files: A dictionary keyed by edge type with the path to its edge data file as the value.
+        ontology_triples: An integer containing the number of triples in the ontology.
+    """
+
+    class_ids = generates_class_ids(n_classes)
+    graph = generates_ontology(class_ids, seed)
+    edges = generates_edges(class_ids, n_genes, n_edges, seed)
+    data_files = writes_edge_sources(edges, write_location + '/edge_sources', seed)
+    writes_build_resources(graph, edges, class_ids, n_genes, write_location + '/resources', seed)
+
+    return data_files, len(graph)
@@ -291,32 +291,23 @@ class OntologyCleaner(object):
 
         return None
 
-    def path_finder(self, triples: List, master_triples: Set) -> Set:
+    def path_finder(self, triples: List, master_triples: Set, bnode_index: Optional[BNodeIndex] = None) -> Set:
         """Method takes a triple an RDFLib graph object and searches the graph to return all triples associated with
-        BNodes in the input triple list.
+        BNodes in the input triple list (i.e. every triple of the anonymous structures the BNodes belong to).
 
         Args:
             triples: A list of triples where each item in the list is an RDFLib object.
             master_triples: None or a list of triples where each item in the list is an RDFLib object.
+            bnode_index: A BNodeIndex of ont_graph. If None, the index is built from ont_graph (default=None).
 
         Returns:
             triple_list: A set of triples, where each item in the list is an RDFLib object.
         """
 
-        if len(triples) != 0 and len([x for x in triples if isinstance(x[0], BNode)]) > 0:
-            s, p, o = triples.pop(0)
-            if isinstance(s, BNode) and (s, p, o) not in master_triples:
-                master_triples |= {(s, p, o)}
-                out_edges = set(self.ont_graph.triples((s, None, None)))
-                in_edges = set(self.ont_graph.triples((None, None, s)))
-                new_trips = [x for x in out_edges | in_edges if x not in triples and x not in master_triples]
-                new_bnodes = [x for x in new_trips if isinstance(x[2], BNode)]
-                if len(new_trips) > 0 and len(new_bnodes) > 0:  triples += new_trips
-                else: master_triples |= set(new_trips)
-            else:
-                if (s, p, o) not in master_triples: master_triples |= {(s, p, o)}
-            return self.path_finder(triples, master_triples)
-        else: return master_triples | set(triples)
+        bnode_index = BNodeIndex(self.ont_graph) if bnode_index is None else bnode_index
+        bnodes = [x for y in triples for x in y[0::2] if isinstance(x, BNode)]
+
+        return master_triples | set(triples) | bnode_index.gets_component_triples(bnodes)
 
     def removes_deprecated_obsolete_entities(self) -> None:
         """Identifies and removes all deprecated and obsolete classes.
@@ -333,10 +324,11 @@ class OntologyCleaner(object):
         obs_oth = set([x[0] for x in self.ont_graph if
                        (str(x[2]).startswith('OBSOLETE. ') or
                         str(x[2]).lower().startswith('obsolete ')) and x[0] not in obs_cls | dep_cls])
+        bnode_index = BNodeIndex(self.ont_graph)  # removing triples never adds to the anonymous structures
         for node in tqdm(dep_cls | obs_cls | obs_oth):
             axioms = set(self.ont_graph.triples((node, None, None))) | set(self.ont_graph.triples((None, None, node)))
             bnode_triples = set([x for x in axioms if isinstance(x[0], BNode)])
-            triples = self.path_finder(list(bnode_triples), set())
+            triples = self.path_finder(list(bnode_triples), set(), bnode_index)
             self.ont_graph = remove_edges_from_graph(self.ont_graph, axioms | triples)
 
         self.ontology_info[key]['Deprecated'] = dep_cls if len(dep_cls) > 0 else 'None'
@@ -7,12 +7,11 @@ import hashlib
 import logging.config
 import os
 import os.path
-import pickle
 
 from rdflib import Graph, Namespace, BNode, Literal, URIRef  # type: ignore
 from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
 from tqdm import tqdm  # type: ignore
-from typing import Any, Dict, IO, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from pkt_kg.utils import *
 
@@ -20,6 +19,10 @@ from pkt_kg.utils import *
 obo = Namespace('http://purl.obolibrary.org/obo/')
 pkt = Namespace('https://github.com/callahantiff/PheKnowLator/pkt/')
 pkt_bnode = Namespace('https://github.com/callahantiff/PheKnowLator/pkt/bnode/')
+# rdflib terms used for every edge, resolved once (rdflib namespace attribute lookups are slow inside of loops)
+rdf_type, rdfs_subclass = RDF.type, RDFS.subClassOf
+owl_class, owl_individual, owl_property = OWL.Class, OWL.NamedIndividual, OWL.ObjectProperty
+owl_restriction, owl_some_values, owl_on_property = OWL.Restriction, OWL.someValuesFrom, OWL.onProperty
 # logging
 log_dir, log, log_config = 'builds/logs', 'pkt_build_log.log', glob.glob('**/logging.ini', recursive=True)
 try:
@@ -51,7 +54,7 @@ class KGConstructionApproach(object):
     """
 
     def __init__(self, write_location: str) -> None:
-        self.subclass_dict: Dict = dict()
+        self.subclass_dict: Mapping = dict()
         self.subclass_error: Dict = dict()
 
         # WRITE LOCATION
@@ -68,9 +71,8 @@ class KGConstructionApproach(object):
         elif os.stat(glob.glob(file_name)[0]).st_size == 0:
             log_str = 'The input file: {} is empty'.format(glob.glob(file_name)[0])
             logger.error('TypeError: ' + log_str); raise TypeError(log_str)
-        else:
-            with open(glob.glob(file_name)[0], 'rb') as filepath:  # type: IO[Any]
-                self.subclass_dict = pickle.load(filepath, encoding='bytes')
+        else:  # the pickled map is converted to a memory-mapped index, which is shared by processes using the map
+            self.subclass_dict = loads_subclass_map_index(glob.glob(file_name)[0])
 
     def maps_node_to_class(self, edge_type: str, entity: str, edge: List) -> Optional[List]:
         """Takes an entity and checks whether or not it exists in a dictionary of subclass content, such that keys
@@ -93,17 +95,33 @@ class KGConstructionApproach(object):
             non-class entity node is returned.
         """
 
-        e_type = edge_type
-        if entity not in self.subclass_dict.keys():
+        e_type = edge_type; subclass_map = self.subclass_dict.get(entity)
+        if subclass_map is None:
             if self.subclass_error and e_type in self.subclass_error.keys(): self.subclass_error[e_type] += [entity]
             else: self.subclass_error[e_type] = [entity]
-            subclass_map = None
-        else: subclass_map = self.subclass_dict[entity]
 
         return subclass_map
 
     @staticmethod
-    def subclass_core_constructor(node1: URIRef, node2: URIRef, relation: URIRef, inv_relation: URIRef) -> Tuple:
+    def declares_triple(triple: Tuple, declared: Optional[Set] = None) -> Tuple:
+        """Returns a typing triple (e.g. (node, RDF.type, OWL.Class)) unless it has already been declared.
+
+        Args:
+            triple: A tuple containing a typing triple.
+            declared: A set of the typing triples that have already been emitted (default=None). The triple is added
+                to the set. If None, the triple is always returned.
+
+        Returns:
+            A tuple containing the triple, or an empty tuple if the triple is in declared.
+        """
+
+        if declared is None: return triple,
+        elif triple in declared: return tuple()
+        else: declared.add(triple); return triple,
+
+    @staticmethod
+    def subclass_core_constructor(node1: URIRef, node2: URIRef, relation: URIRef, inv_relation: Optional[URIRef],
+                                  n3_func: Callable = n3, declared: Optional[Set] = None) -> Tuple:
         """Core subclass-based edge construction method. Constructs a single edge between to ontology classes as well as
         verifies if the user wants an inverse edge created and if so, then this edge is also added to the knowledge
         graph. Note that a Bnode is used for subclass construction versus the UUID hash + pkt namespace that is used
@@ -118,39 +136,42 @@ class KGConstructionApproach(object):
             relation: A URIRef object containing an owl:ObjectProperty.
             inv_relation: A string containing an inverse relation identifier (i.e. RO_0002200) or None (i.e.
                 indicating no inverse relation).
+            n3_func: A function that serializes a node to an n-triples string (default=n3).
+            declared: A set of the typing triples already emitted, which are not emitted again (default=None; see
+                declares_triple).
 
         Returns:
             A list of tuples representing new edges to add to the knowledge graph.
         """
 
-        rel_core = n3(node1) + n3(relation) + n3(node2)
+        rel_core = n3_func(node1) + n3_func(relation) + n3_func(node2)
         u1 = URIRef(pkt + 'N' + hashlib.md5(rel_core.encode()).hexdigest())
-        u2 = URIRef(pkt_bnode + 'N' + hashlib.md5((rel_core + n3(OWL.Restriction)).encode()).hexdigest())
-
-        new_edge_inverse_rel: Tuple = tuple()
-        new_edge_rel_only: Tuple = ((node1, RDF.type, OWL.Class),
-                                    (u1, RDFS.subClassOf, node1),
-                                    (u1, RDF.type, OWL.Class),
-                                    (u1, RDFS.subClassOf, u2),
-                                    (u2, RDF.type, OWL.Restriction),
-                                    (u2, OWL.someValuesFrom, node2),
-                                    (node2, RDF.type, OWL.Class),
-                                    (u2, OWL.onProperty, relation),
-                                    (relation, RDF.type, OWL.ObjectProperty))
+        u2 = URIRef(pkt_bnode + 'N' + hashlib.md5((rel_core + n3_func(owl_restriction)).encode()).hexdigest())
+
+        declares = KGConstructionApproach.declares_triple; new_edge_inverse_rel: Tuple = tuple()
+        new_edge_rel_only: Tuple = declares((node1, rdf_type, owl_class), declared) + \
+            ((u1, rdfs_subclass, node1),
+             (u1, rdf_type, owl_class),
+             (u1, rdfs_subclass, u2),
+             (u2, rdf_type, owl_restriction),
+             (u2, owl_some_values, node2)) + \
+            declares((node2, rdf_type, owl_class), declared) + \
+            ((u2, owl_on_property, relation),) + \
+            declares((relation, rdf_type, owl_property), declared)
         if inv_relation:
-            inv_rel_core = n3(node2) + n3(inv_relation) + n3(node1)
+            inv_rel_core = n3_func(node2) + n3_func(inv_relation) + n3_func(node1)
             u3 = URIRef(pkt + 'N' + hashlib.md5(inv_rel_core.encode()).hexdigest())
-            u4 = URIRef(pkt_bnode + 'N' + hashlib.md5((inv_rel_core + n3(OWL.Restriction)).encode()).hexdigest())
-
-            new_edge_inverse_rel = ((node2, RDF.type, OWL.Class),
-                                    (u3, RDFS.subClassOf, node2),
-                                    (u3, RDF.type, OWL.Class),
-                                    (u3, RDFS.subClassOf, u4),
-                                    (u4, RDF.type, OWL.Restriction),
-                                    (u4, OWL.someValuesFrom, node1),
-                                    (node1, RDF.type, OWL.Class),
-                                    (u4, OWL.onProperty, inv_relation),
-                                    (inv_relation, RDF.type, OWL.ObjectProperty))
+            u4 = URIRef(pkt_bnode + 'N' + hashlib.md5((inv_rel_core + n3_func(owl_restriction)).encode()).hexdigest())
+
+            new_edge_inverse_rel = declares((node2, rdf_type, owl_class), declared) + \
+                ((u3, rdfs_subclass, node2),
+                 (u3, rdf_type, owl_class),
+                 (u3, rdfs_subclass, u4),
+                 (u4, rdf_type, owl_restriction),
+                 (u4, owl_some_values, node1)) + \
+                declares((node1, rdf_type, owl_class), declared) + \
+                ((u4, owl_on_property, inv_relation),) + \
+                declares((inv_relation, rdf_type, owl_property), declared)
 
         return new_edge_rel_only + new_edge_inverse_rel
 
@@ -174,33 +195,15 @@ class KGConstructionApproach(object):
             edges: A set of tuples containing new edges to add to the knowledge graph.
         """
 
-        res = finds_node_type(edge_info); uri1, uri2 = edge_info['uri']; edges: List = []
-        rel = URIRef(obo + edge_info['rel'])
-        irel = URIRef(obo + edge_info['inv_rel']) if edge_info['inv_rel'] is not None else None
-        if res['cls1'] and res['cls2']:  # class-class edges
-            edges = list(self.subclass_core_constructor(URIRef(res['cls1']), URIRef(res['cls2']), rel, irel))
-        elif res['cls1'] and res['ent1']:  # entity-class/class-entity edges
-            x = res['ent1'].replace(uri2, '') if edge_info['n1'] == 'class' else res['ent1'].replace(uri1, '')
-            mapped_node = self.maps_node_to_class(edge_type, x, edge_info['edges'])
-            if mapped_node:  # get entity mappings to current classes from subclass_construction_map
-                edges = [x for y in [((URIRef(res['ent1']), RDFS.subClassOf, URIRef(obo + i)),) +
-                                     ((URIRef(obo + i), RDF.type, OWL.Class),) for i in mapped_node] for x in y]
-                ent_order = ['cls1', 'ent1'] if edge_info['n1'] == 'class' else ['ent1', 'cls1']  # determine node order
-                edges += self.subclass_core_constructor(URIRef(res[ent_order[0]]), URIRef(res[ent_order[1]]), rel, irel)
-        else:  # entity-entity edges
-            mapped_node1 = self.maps_node_to_class(edge_type, res['ent1'].replace(uri1, ''), edge_info['edges'])
-            mapped_node2 = self.maps_node_to_class(edge_type, res['ent2'].replace(uri2, ''), edge_info['edges'])
-            if mapped_node1 and mapped_node2:  # get entity mappings to current classes from subclass_construction_map
-                edges += [x for y in [((URIRef(res['ent1']), RDFS.subClassOf, URIRef(obo + i)),) +
-                                      ((URIRef(obo + i), RDF.type, OWL.Class),) for i in mapped_node1] for x in y]
-                edges += [x for y in [((URIRef(res['ent2']), RDFS.subClassOf, URIRef(obo + i)),) +
-                                      ((URIRef(obo + i), RDF.type, OWL.Class),) for i in mapped_node2] for x in y]
-                edges += self.subclass_core_constructor(URIRef(res['ent1']), URIRef(res['ent2']), rel, irel)
+        edges = self.subclass_bulk_constructor(edge_type, [edge_info['edges'][0]], [edge_info['edges'][1]],
+                                               [edge_info['n1'], edge_info['n2']], edge_info['uri'],
+                                               edge_info['rel'], edge_info['inv_rel'])[0]
 
         return edges
 
     @staticmethod
-    def instance_core_constructor(node1: URIRef, node2: URIRef, relation: URIRef, inv_relation: URIRef) -> Tuple:
+    def instance_core_constructor(node1: URIRef, node2: URIRef, relation: URIRef, inv_relation: Optional[URIRef],
+                                  n3_func: Callable = n3, declared: Optional[Set] = None) -> Tuple:
         """Core instance-based edge construction method. Constructs a single edge between two ontology classes as
         well as verifies if the user wants an inverse edge created and if so, then this edge is also added to the
         knowledge graph.
@@ -214,6 +217,9 @@ class KGConstructionApproach(object):
             relation: A URIRef object containing an owl:ObjectProperty.
             inv_relation: A string containing the identifier for an inverse relation (i.e. RO_0002200) or None
                 (i.e. indicator of no inverse relation).
+            n3_func: A function that serializes a node to an n-triples string (default=n3).
+            declared: A set of the typing triples already emitted, which are not emitted again (default=None; see
+                declares_triple).
 
         Returns:
             A list of tuples representing new edges to add to the knowledge graph.
@@ -221,15 +227,17 @@ class KGConstructionApproach(object):
 
         # select hash relation - if rel and inv rel take first in alphabetical order else use rel
         rels = sorted([relation, inv_relation])[0] if inv_relation is not None else [relation][0]
-        rel_core = n3(node1) + n3(rels) + n3(node2)
+        rel_core = n3_func(node1) + n3_func(rels) + n3_func(node2)
         u1 = URIRef(pkt + 'N' + hashlib.md5((rel_core + 'subject').encode()).hexdigest())
         u2 = URIRef(pkt + 'N' + hashlib.md5((rel_core + 'object').encode()).hexdigest())
 
-        new_edge_inverse_rel: Tuple = tuple()
-        new_edge_rel_only: Tuple = ((u1, RDF.type, node1), (u1, RDF.type, OWL.NamedIndividual),
-                                    (u2, RDF.type, node2), (u2, RDF.type, OWL.NamedIndividual),
-                                    (u1, relation, u2), (relation, RDF.type, OWL.ObjectProperty))
-        if inv_relation: new_edge_inverse_rel = ((u2, inv_relation, u1), (inv_relation, RDF.type, OWL.ObjectProperty))
+        declares = KGConstructionApproach.declares_triple; new_edge_inverse_rel: Tuple = tuple()
+        new_edge_rel_only: Tuple = ((u1, rdf_type, node1), (u1, rdf_type, owl_individual),
+                                    (u2, rdf_type, node2), (u2, rdf_type, owl_individual),
+                                    (u1, relation, u2)) + declares((relation, rdf_type, owl_property), declared)
+        if inv_relation:
+            new_edge_inverse_rel = ((u2, inv_relation, u1),) + \
+                declares((inv_relation, rdf_type, owl_property), declared)
 
         return new_edge_rel_only + new_edge_inverse_rel
 
@@ -249,30 +257,99 @@ class KGConstructionApproach(object):
             edges: A set of tuples containing new edges to add to the knowledge graph.
         """
 
-        res = finds_node_type(edge_info); uri1, uri2 = edge_info['uri']; edges: List = []
-        rel = URIRef(obo + edge_info['rel'])
-        irel = URIRef(obo + edge_info['inv_rel']) if edge_info['inv_rel'] is not None else None
-        if res['cls1'] and res['cls2']:  # class-class edges
-            edges = list(self.instance_core_constructor(URIRef(res['cls1']), URIRef(res['cls2']), rel, irel))
-        elif res['cls1'] and res['ent1']:  # class-entity/entity-class edges
-            x = res['ent1'].replace(uri2, '') if edge_info['n1'] == 'class' else res['ent1'].replace(uri1, '')
-            mapped_node = self.maps_node_to_class(edge_type, x, edge_info['edges'])
-            if mapped_node:  # get entity mappings to current classes from subclass_construction_map
-                edges = [x for y in [((URIRef(res['ent1']), RDFS.subClassOf, URIRef(obo + i)),) +
-                                     ((URIRef(obo + i), RDF.type, OWL.Class),) +
-                                     ((URIRef(res['ent1']), RDF.type, OWL.Class),) for i in mapped_node] for x in y]
-                ent_order = ['cls1', 'ent1'] if edge_info['n1'] == 'class' else ['ent1', 'cls1']  # determine node order
-                edges += self.instance_core_constructor(URIRef(res[ent_order[0]]), URIRef(res[ent_order[1]]), rel, irel)
-        else:  # entity-entity edges
-            mapped_node1 = self.maps_node_to_class(edge_type, res['ent1'].replace(uri1, ''), edge_info['edges'])
-            mapped_node2 = self.maps_node_to_class(edge_type, res['ent2'].replace(uri2, ''), edge_info['edges'])
-            if mapped_node1 and mapped_node2:  # get entity mappings to current classes from subclass_construction_map
-                edges += [x for y in [((URIRef(res['ent1']), RDFS.subClassOf, URIRef(obo + i)),) +
-                                      ((URIRef(obo + i), RDF.type, OWL.Class),) +
-                                      ((URIRef(res['ent1']), RDF.type, OWL.Class),) for i in mapped_node1] for x in y]
-                edges += [x for y in [((URIRef(res['ent2']), RDFS.subClassOf, URIRef(obo + i)),) +
-                                      ((URIRef(obo + i), RDF.type, OWL.Class),) +
-                                      ((URIRef(res['ent2']), RDF.type, OWL.Class),) for i in mapped_node2] for x in y]
-                edges += self.instance_core_constructor(URIRef(res['ent1']), URIRef(res['ent2']), rel, irel)
+        edges = self.instance_bulk_constructor(edge_type, [edge_info['edges'][0]], [edge_info['edges'][1]],
+                                               [edge_info['n1'], edge_info['n2']], edge_info['uri'],
+                                               edge_info['rel'], edge_info['inv_rel'])[0]
 
         return edges
+
+    def bulk_constructor(self, edge_type: str, subjects: List[str], objects: List[str], node_types: List[str],
+                         uri: List[str], rel: str, inv_rel: Optional[str], approach: str,
+                         declared: Optional[Set] = None) -> List[List]:
+        """Builds the edges for all of the edges of an edge type at once, where the edges are passed as parallel lists
+        of subject and object identifiers. The per-edge work is reduced by resolving the edge type's node types,
+        relations, and namespaces once, getting each URIRef from the build's term pool (see pkt_kg.utils.TermPool),
+        serializing each node to n-triples (which is hashed to create the pkt nodes) once per unique node, and creating
+        the subclass map triples once per unique entity. The triples and pkt node identifiers are the same as those
+        created by subclass_constructor and instance_constructor. Entities missing from the subclass_dict are logged
+        for each edge (see maps_node_to_class).
+
+        Assumption: All ontology class nodes use the obo namespace.
+
+        Args:
+            edge_type: A string containing the name of the edge_type (e.g. "gene-disease", "chemical-gene").
+            subjects: A list of subject node identifiers (e.g. ['CHEBI_81395', '2']).
+            objects: A list of object node identifiers, one for each subject (e.g. ['DOID_12858', 'HP_0000716']).
+            node_types: A list of the subject and object node types (e.g. ['class', 'entity']).
+            uri: A list of the subject and object namespaces (e.g. ['https://www.ncbi.nlm.nih.gov/gene/',
+                'http://purl.obolibrary.org/obo/']).
+            rel: A string containing the relation identifier (e.g. 'RO_0002606').
+            inv_rel: A string containing the inverse relation identifier (e.g. 'RO_0002615') or None.
+            approach: A string containing the construction approach (i.e. "subclass" or "instance").
+            declared: A set of the typing triples already emitted (default=None). When a set is passed, each node and
+                relation typing triple and each entity's subclass map triples are only emitted the first time they
+                are needed, rather than in the batch of every edge that uses them (see declares_triple).
+
+        Returns:
+            batches: A list containing a list of the triples created for each edge, in the order of the input edges
+                (the list is empty for edges with an entity missing from the subclass_dict).
+        """
+
+        node = term_pool.interns_uri; serialized: Dict = dict(); mapped_triples: Dict = dict(); batches: List = []
+        relation = node(obo + rel); inv_relation = node(obo + inv_rel) if inv_rel is not None else None
+        core = self.subclass_core_constructor if approach == 'subclass' else self.instance_core_constructor
+        declares = self.declares_triple
+
+        def n3_func(x: URIRef) -> str:
+            n3_str = serialized.get(x)
+            if n3_str is None: n3_str = serialized[x] = n3(x)
+            return n3_str
+
+        def maps_entity(ent: str, ent_uri: str, edge: List) -> Optional[List]:
+            mapped_node = self.maps_node_to_class(edge_type, ent.replace(ent_uri, ''), edge)
+            if mapped_node and ent not in mapped_triples:  # subclass map triples for the entity
+                typed = ((node(ent), rdf_type, owl_class),) if approach == 'instance' else tuple()
+                mapped_triples[ent] = [x for y in [((node(ent), rdfs_subclass, node(obo + i)),) +
+                                                   ((node(obo + i), rdf_type, owl_class),) + typed
+                                                   for i in mapped_node] for x in y]
+            return mapped_triples[ent] if mapped_node else None
+
+        def declares_entity(mapped: List) -> List:  # the first triple of an entity's map triples marks it as declared
+            if declared is None: return mapped
+            elif mapped[0] in declared: return []
+            else: return [x for y in mapped for x in declares(y, declared)]
+
+        n1, n2 = [x == 'class' for x in node_types]
+        for s, o in zip(subjects, objects):
+            node1, node2 = uri[0] + s, uri[1] + o
+            if n1 and n2:  # class-class edges
+                batches += [list(core(node(node1), node(node2), relation, inv_relation, n3_func, declared))]
+            elif n1 or n2:  # class-entity/entity-class edges
+                mapped = maps_entity(node2, uri[1], [s, o]) if n1 else maps_entity(node1, uri[0], [s, o])
+                if mapped:
+                    batches += [declares_entity(mapped) + list(core(node(node1), node(node2), relation, inv_relation,
+                                                                    n3_func, declared))]
+                else: batches += [[]]
+            else:  # entity-entity edges
+                mapped1, mapped2 = maps_entity(node1, uri[0], [s, o]), maps_entity(node2, uri[1], [s, o])
+                if mapped1 and mapped2:
+                    mapped1, mapped2 = declares_entity(mapped1), declares_entity(mapped2)
+                    batches += [mapped1 + mapped2 + list(core(node(node1), node(node2), relation, inv_relation,
+                                                              n3_func, declared))]
+                else: batches += [[]]
+
+        return batches
+
+    def subclass_bulk_constructor(self, edge_type: str, subjects: List[str], objects: List[str],
+                                  node_types: List[str], uri: List[str], rel: str, inv_rel: Optional[str],
+                                  declared: Optional[Set] = None) -> List:
+        """Adds all of the edges of an edge type for the subclass construction approach (see bulk_constructor)."""
+
+        return self.bulk_constructor(edge_type, subjects, objects, node_types, uri, rel, inv_rel, 'subclass', declared)
+
+    def instance_bulk_constructor(self, edge_type: str, subjects: List[str], objects: List[str],
+                                  node_types: List[str], uri: List[str], rel: str, inv_rel: Optional[str],
+                                  declared: Optional[Set] = None) -> List:
+        """Adds all of the edges of an edge type for the instance construction approach (see bulk_constructor)."""
+
+        return self.bulk_constructor(edge_type, subjects, objects, node_types, uri, rel, inv_rel, 'instance', declared)
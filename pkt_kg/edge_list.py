@@ -14,6 +14,8 @@ from difflib import SequenceMatcher
 from tqdm import tqdm  # type: ignore
 from typing import Any, Dict, IO, List, Optional, TextIO, Tuple, Union
 
+from pkt_kg.utils import fingerprints_files
+
 # logging
 log_dir, log, log_config = 'builds/logs', 'pkt_build_log.log', glob.glob('**/logging.ini', recursive=True)
 try:
@@ -334,11 +336,31 @@ class CreatesEdgeList(object):
 
         return None
 
+    def fingerprints_edge_type(self, edge_type: str) -> str:
+        """Creates a fingerprint for an edge type from the content of its edge data file, the content of any of its
+        identifier mapping files, and its row in resource_info.txt.
+
+        Args:
+            edge_type: A string containing the name of an edge type (e.g. 'chemical-disease').
+
+        Returns:
+            A string containing an md5 hash of the edge type's inputs.
+        """
+
+        info = {k: v for k, v in self.source_info[edge_type].items() if k not in ['edge_list', 'fingerprint']}
+        map_files = [x.split(':')[1] for x in info['identifier_maps'].split(';') if ':' in x]
+
+        fingerprint = fingerprints_files([self.data_files[edge_type]] + map_files, json.dumps(info, sort_keys=True))
+
+        return fingerprint
+
     def creates_knowledge_graph_edges(self) -> None:
         """Generates edge lists for each edge type in an input dictionary. In order to generate the edge list,
         the function performs six steps: (1) read in data; (2) apply filtering and evidence criteria; (3) reduce data
         to specific columns, remove duplicates, and ensure proper formatting of column data; (4) update node column
-        values; (5) rename nodes; and (6) map identifiers.
+        values; (5) rename nodes; and (6) map identifiers. Each edge type is fingerprinted (see fingerprints_edge_type)
+        and edge types whose fingerprint matches the one recorded in an existing Master_Edge_List_Dict.json reuse the
+        edge list from that file instead of being processed again.
 
         Returns:
             source_info: A dictionary that contains all of the master information for each edge type resource. For
@@ -351,8 +373,20 @@ class CreatesEdgeList(object):
 
         logger.info('*' * 10 + 'PKT STEP: GENERATING KNOWLEDGE GRAPH MASTER EDGE LIST' + '*' * 10)
 
+        master_edges = '/'.join(self.source_file.split('/')[:-1]) + '/Master_Edge_List_Dict.json'
+        if os.path.exists(master_edges) and os.stat(master_edges).st_size != 0:
+            with open(master_edges, 'r') as _file: previous_info = json.load(_file)
+        else: previous_info = dict()
+
         for edge_type in tqdm(self.source_info.keys()):
             log_str = '### Processing Edge: {}'.format(edge_type); print('\n\n' + log_str); logger.info(log_str)
+            fingerprint = self.fingerprints_edge_type(edge_type)
+            self.source_info[edge_type]['fingerprint'] = fingerprint
+            if previous_info.get(edge_type, dict()).get('fingerprint') == fingerprint:
+                log_str = '*** Edge Data Unchanged, Reusing Previous Edge List ***'
+                print(log_str); logger.info(log_str)
+                self.source_info[edge_type]['edge_list'] = [tuple(x) for x in previous_info[edge_type]['edge_list']]
+                continue
 
             # STEP 1: Read Data
             log_str = '*** Reading Edge Data ***'; print(log_str); logger.info(log_str)
@@ -393,7 +427,7 @@ class CreatesEdgeList(object):
 
         # add source entity namespaces and save a copy of the final master edge list
         self.gets_entity_namespaces()
-        with open('/'.join(self.source_file.split('/')[:-1]) + '/Master_Edge_List_Dict.json', 'w') as filepath:
+        with open(master_edges, 'w') as filepath:
             json.dump(self.source_info, filepath)
 
         return None
@@ -6,6 +6,7 @@ import copy
 import glob
 import json
 import logging.config
+import multiprocessing
 import networkx  # type: ignore
 import os
 import os.path
@@ -19,7 +20,7 @@ from collections import Counter  # type: ignore
 from rdflib import Graph, Namespace, URIRef, BNode  # type: ignore
 from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
 from tqdm import tqdm  # type: ignore
-from typing import Any, Callable, Dict, IO, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from pkt_kg.__version__ import __version__
 from pkt_kg.construction_approaches import KGConstructionApproach
@@ -39,6 +40,61 @@ except FileNotFoundError:
 logger = logging.getLogger(__name__)
 logging.config.fileConfig(log_config[0], disable_existing_loggers=False, defaults={'log_file': log_dir + '/' + log})
 
+# edge construction state shared with worker processes (see KGBuilder.creates_new_edges)
+edge_worker_state: Dict = dict()
+
+
+def initializes_edge_worker(state: Dict) -> None:
+    """Stores the state needed to construct edges in a worker process.
+
+    Args:
+        state: A dictionary containing a KGBuilder copy without a graph ("builder"), a KGConstructionApproach
+            instance ("kg_bld"), and the node metadata function ("node_metadata_func").
+
+    Returns:
+        None.
+    """
+
+    edge_worker_state.update(state)
+
+    return None
+
+
+def constructs_edge_type_in_worker(task: Tuple) -> Tuple:
+    """Builds the triples for a single edge type inside of a worker process.
+
+    Args:
+        task: A tuple containing an edge type, its edge list, and its inverse relation identifier or None.
+
+    Returns:
+        A tuple containing the edge type, the results of KGBuilder.constructs_edge_type, and a list of the node
+        identifiers that could not be found in the subclass_dict for the edge type (or None).
+    """
+
+    edge_type, edge_list, invrel = task; kg_bld = edge_worker_state['kg_bld']
+    results = edge_worker_state['builder'].constructs_edge_type(edge_type, edge_list, invrel, kg_bld,
+                                                                edge_worker_state['node_metadata_func'])
+
+    return (edge_type,) + results + (kg_bld.subclass_error.pop(edge_type, None),)
+
+
+def writes_metadata_output(meta: Metadata, node_int_map: Dict, graph: Union[Graph, Set], details: Dict) -> None:
+    """Writes the node metadata file of a graph and records the step's telemetry (see KGBuilder.outputs_metadata).
+
+    Args:
+        meta: A Metadata instance whose full_kg attribute contains the name of the graph.
+        node_int_map: A dictionary where keys are node and relation identifiers and values are integers.
+        graph: A set of RDFLib Graph object triples or an RDFLib Graph.
+        details: A dictionary of information to include in the step's telemetry record.
+
+    Returns:
+        None.
+    """
+
+    with records_build_step('metadata_output', len(graph), details): meta.output_metadata(node_int_map, graph)
+
+    return None
+
 
 class KGBuilder(object):
     """Class creates a semantic knowledge graph (KG). The class is designed to facilitate two KG construction
@@ -57,6 +113,15 @@ class KGBuilder(object):
             knowledge graph.
         decode_owl: A string containing "yes" or "no" indicating whether owl semantics should be removed.
         write_location: An optional string passed to specify the primary directory to write to.
+        workers: An integer specifying the number of processes used to build edge types, decode OWL-NETS classes, and
+            write node metadata in parallel (default=1).
+        resume: A bool indicating whether or not to restart the build from the last step with a valid checkpoint.
+            Resuming also writes checkpoints for the remaining steps.
+        store: A string containing the graph store backend, either "memory" (the default RDFLib store) or "integer"
+            (pkt_kg.utils.IntegerStore, an integer-encoded store with subject, predicate, and object indexes).
+        checkpoint: A bool indicating whether or not to write a checkpoint after each checkpointed build step, so that
+            a later build can be resumed (default=False). Each checkpoint holds a copy of the full knowledge graph, so
+            this needs extra memory while it is written and extra disk space in write_location/checkpoints.
 
     Raises:
         ValueError: If the formatting of kg_version is incorrect (i.e. not "v.#.#.#").
@@ -67,18 +132,28 @@ class KGBuilder(object):
         TypeError: If construction, inverse_relations, node_data, and decode_owl are not strings.
         ValueError: If relations_data, node_data and decode_owl_semantics do not contain "yes" or "no".
         ValueError: If construction does not contain "instance" or "subclass".
+        ValueError: If workers is not a positive integer.
+        TypeError: If resume or checkpoint is not a bool.
+        ValueError: If store does not contain "memory" or "integer".
     """
 
     __metaclass__ = ABCMeta
 
     def __init__(self, construction: str, node_data: str, inverse_relations: str, decode_owl: str,
-                 write_location: str = os.path.abspath('./resources/knowledge_graphs')) -> None:
+                 write_location: str = os.path.abspath('./resources/knowledge_graphs'), workers: int = 1,
+                 resume: bool = False, store: str = 'memory', checkpoint: bool = False) -> None:
+
+        # GRAPH STORE
+        if store not in ['memory', 'integer']:
+            log_str = 'store must be "memory" or "integer"'; logger.error('ValueError: ' + log_str)
+            raise ValueError(log_str)
+        else: self.graph_store: str = 'Integer' if store == 'integer' else 'default'
 
         self.build: str = self.gets_build_type().lower().split()[0]
-        self.graph: Graph = Graph()
+        self.graph: Graph = Graph(store=self.graph_store)
         self.kg_version: str = 'v' + __version__
-        self.obj_properties: Set = set()
         self.ont_classes: Set = set()
+        self.registry: EntityRegistry = EntityRegistry()
         self.owl_tools: str = './pkt_kg/libs/owltools'
         self.relations_dict: Dict = dict()
         self.write_location: str = write_location
@@ -131,7 +206,7 @@ class KGBuilder(object):
         elif node_data == 'yes' and len(node_dir) == 0:
             log_str = 'node_data directory is empty'; logger.error('TypeError: ' + log_str); raise TypeError(log_str)
         elif node_data == 'yes' and len(node_dir) != 0:
-            self.node_data: Optional[List] = node_dir; self.node_dict: Optional[Dict] = dict()
+            self.node_data: Optional[List] = node_dir; self.node_dict: Optional[Union[Dict, NodeMetadataStore]] = dict()
         else: self.node_data, self.node_dict = None, None
 
         # OWL SEMANTICS
@@ -143,8 +218,48 @@ class KGBuilder(object):
             self.decode_owl: Optional[str] = decode_owl; owl_kg = '_noOWL'
         else: self.decode_owl, owl_kg = None, '_OWL'
 
+        # PARALLEL EDGE CONSTRUCTION
+        if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+            log_str = 'workers must be a positive integer'; logger.error('ValueError: ' + log_str)
+            raise ValueError(log_str)
+        else: self.workers: int = workers
+
+        # BUILD CHECKPOINTS
+        if not isinstance(resume, bool):
+            log_str = 'resume must be a bool'; logger.error('TypeError: ' + log_str); raise TypeError(log_str)
+        else: self.resume: bool = resume; self.checkpoint_dir: str = self.write_location + '/checkpoints'
+        if not isinstance(checkpoint, bool):
+            log_str = 'checkpoint must be a bool'; logger.error('TypeError: ' + log_str); raise TypeError(log_str)
+        else: self.checkpoint: bool = checkpoint or resume
+        self.edge_cache_dir: str = self.write_location + '/edge_cache'
+
         # KG FILE NAME
         self.full_kg: str = '/PheKnowLator_' + self.kg_version + '_' + self.build + '_' + const + rel + owl_kg + '.owl'
+        self.telemetry: Dict = {'build': self.build, 'filename': self.full_kg}  # details added to telemetry records
+
+    @property
+    def obj_properties(self) -> Set:
+        """The set of object properties in the knowledge graph, maintained by the entity registry."""
+
+        return self.registry.object_properties
+
+    @obj_properties.setter
+    def obj_properties(self, object_properties: Set) -> None:
+
+        self.registry.object_properties = set(object_properties)
+
+    def registers_graph_entities(self) -> None:
+        """Builds the registry of classes, object properties, and individuals from the current knowledge graph. The
+        ontology classes that edges are checked against (i.e. ont_classes) are the classes present before any edges are
+        added, while the registry is updated as edge triples are added to the knowledge graph.
+
+        Returns:
+            None.
+        """
+
+        self.registry = EntityRegistry(self.graph); self.ont_classes = set(self.registry.classes)
+
+        return None
 
     def reverse_relation_processor(self) -> None:
         """Creates and converts a Pandas DataFrame to a specific dictionary depending on whether it contains
@@ -185,8 +300,8 @@ class KGBuilder(object):
             raise TypeError(log_str)
         else:
             if object_property not in self.obj_properties:
-                self.graph.add((object_property, RDF.type, OWL.ObjectProperty))
-                self.obj_properties = gets_object_properties(self.graph)  # refresh list of object properties
+                triple = (object_property, RDF.type, OWL.ObjectProperty)
+                self.graph.add(triple); self.registry.updates_registry([triple])
             else:
                 pass
 
@@ -246,25 +361,126 @@ class KGBuilder(object):
         return inverse_rel
 
     @staticmethod
-    def gets_edge_statistics(edge_type: str, results: Set, nodes: List) -> None:
+    def gets_edge_statistics(edge_type: str, results: Iterable, nodes: List) -> None:
         """Calculates the number of nodes and edges created from the build process.
 
         Args:
             edge_type: A string point to a specific edge type (e.g. 'chemical-disease).
-            results: A set of tuples representing the complete set of triples generated from the construction process.
-            nodes: A list of sets of tuples containing the raw node identifiers.
+            results: An iterable of tuples representing the complete set of triples generated from the construction
+                process.
+            nodes: A list of two sets (or FingerprintSets) containing the raw node identifiers.
 
         Returns:
             None
         """
 
         n1, n2 = edge_type.split('-')[0], edge_type.split('-')[1]
-        stats = [len(set(results)), len(nodes[0]), n1, len(nodes[1]), n2]
+        stats = [len(FingerprintSet(results)), len(nodes[0]), n1, len(nodes[1]), n2]
         stats_str = 'Edges: {}; Nodes: {} {}(s), {} {}(s)'.format(stats[0], stats[1], stats[2], stats[3], stats[4])
         print(stats_str); logger.info(stats_str)
 
         return None
 
+    def constructs_edge_type(self, edge_type: str, edge_list: List, invrel: Optional[str],
+                             kg_bld: KGConstructionApproach, node_metadata_func: Callable) -> Tuple:
+        """Builds all of the triples for a single edge type in batched passes over its edge list. The ontology class
+        check and the node metadata lookup are first resolved once per unique node identifier and then applied to the
+        full edge list, after which the construction approach's bulk constructor is run over all of the remaining
+        edges (see KGConstructionApproach.bulk_constructor). A telemetry record is written for the edge type (see
+        pkt_kg.utils.records_build_step).
+
+        Args:
+            edge_type: A string point to a specific edge type (e.g. 'chemical-disease).
+            edge_list: A list of edges, where each edge is a list of two node identifiers (e.g. [['2', 'HP_0000716']]).
+            invrel: A string containing an inverse relation identifier (i.e. RO_0002200) or None.
+            kg_bld: A KGConstructionApproach instance.
+            node_metadata_func: A function that adds metadata for non-ontology classes to a knowledge graph.
+
+        Returns:
+            res: A list of unique tuples containing the triples created for the edge type.
+            meta_edges: A list of unique tuples containing the node metadata triples created for the edge type.
+            node1: A FingerprintSet of the subject node identifiers that were used to create edges.
+            node2: A FingerprintSet of the object node identifiers that were used to create edges.
+        """
+
+        details = dict(self.telemetry, edge_type=edge_type)
+        with records_build_step('edge_type', len(edge_list), details) as record:
+            s_type, o_type = self.edge_dict[edge_type]['data_type'].split('-'); node_types = [s_type, o_type]
+            rel, uri = self.edge_dict[edge_type]['edge_relation'], self.edge_dict[edge_type]['uri']
+            res: Dict = dict(); meta_edges: Dict = dict()
+            # PASS 1: ontology class check -- class-class edges assume obo namespace (see check_ontology_class_nodes)
+            cls_ns = [obo, obo] if node_types == ['class', 'class'] else uri
+            cls_ids = [{x[i] for x in edge_list} if node_types[i] == 'class' else set() for i in range(2)]
+            cls_found = [{x for x in cls_ids[i] if URIRef(cls_ns[i] + x) in self.ont_classes} for i in range(2)]
+            # PASS 2: node metadata lookup -- once per unique non-class entity
+            meta_ids = [{x[i] for x in edge_list} if node_types[i] != 'class' else set() for i in range(2)]
+            node_meta = [{x: node_metadata_func(ent=[uri[i] + x], e_type=[node_types[i]]) for x in meta_ids[i]}
+                         for i in range(2)]
+            # PASS 3: construct the edges passing both checks in bulk
+            if self.construct_approach == 'subclass': constructor = kg_bld.subclass_bulk_constructor
+            else: constructor = kg_bld.instance_bulk_constructor
+            edges: List = []; meta_pos = [i for i in range(2) if node_types[i] != 'class']; emitted: Set = set()
+            for edge in tqdm(edge_list):
+                if all(edge[i] in cls_found[i] for i in range(2) if node_types[i] == 'class'):
+                    has_meta = any(node_meta[i][edge[i]] is not None for i in meta_pos)
+                    if (self.node_data is None and not has_meta) or node_types == ['class', 'class'] \
+                            or (self.node_data is not None and has_meta):
+                        edges += [edge]
+                        for i in [i for i in meta_pos if node_meta[i][edge[i]] is not None]:
+                            if (i, edge[i]) not in emitted:  # an entity's metadata is only added for its first edge
+                                emitted.add((i, edge[i])); meta_edges.update(dict.fromkeys(node_meta[i][edge[i]]))
+            batches = constructor(edge_type, [x[0] for x in edges], [x[1] for x in edges], node_types, uri, rel, invrel,
+                                  set())  # typing triples are only emitted once for the edge type
+            for batch in batches: res.update(dict.fromkeys(batch))  # keeps insertion order
+            node1, node2 = FingerprintSet(x[0] for x in edges), FingerprintSet(x[1] for x in edges)
+            record['output_triples'] = len(res)
+
+        return list(res), list(meta_edges), node1, node2
+
+    def loads_edge_cache(self, edge_type: str, invrel: Optional[str]) -> Tuple:
+        """Creates the key for an edge type's cached triples and loads them if they were written by a previous build.
+        The key combines the edge type's fingerprint (recorded by CreatesEdgeList), its inverse relation, the subclass
+        map, and the inputs of the "split" build step (see gets_checkpoint_key). Edge types without a fingerprint are
+        not cached.
+
+        Args:
+            edge_type: A string point to a specific edge type (e.g. 'chemical-disease).
+            invrel: A string containing an inverse relation identifier (i.e. RO_0002200) or None.
+
+        Returns:
+            A tuple containing the cache key (None if the edge type is not cached) and a tuple of the cached results
+            of constructs_edge_type plus the edge type's subclass_dict errors (None if there is no valid cache).
+        """
+
+        fingerprint = self.edge_dict[edge_type].get('fingerprint')
+        if fingerprint is None: return None, None
+        sub_map, split_key = glob.glob(self.res_dir + '/construction_*/*.pkl'), self.gets_checkpoint_key('split')
+        cache_key = fingerprints_files(sub_map, split_key, edge_type, fingerprint, str(invrel))
+        cache_file = self.edge_cache_dir + '/' + edge_type + '_' + cache_key + '.pkl'
+        if not os.path.exists(cache_file): return cache_key, None
+        else:
+            with open(cache_file, 'rb') as _file: return cache_key, pickle.load(_file)
+
+    def writes_edge_cache(self, edge_type: str, cache_key: str, results: Tuple) -> None:
+        """Saves the triples built for an edge type so that later builds can reuse them when its inputs are unchanged.
+        Any previously cached results for the edge type are removed.
+
+        Args:
+            edge_type: A string point to a specific edge type (e.g. 'chemical-disease).
+            cache_key: A string containing the edge type's cache key (see loads_edge_cache).
+            results: A tuple containing the results of constructs_edge_type and the edge type's subclass_dict errors.
+
+        Returns:
+            None.
+        """
+
+        if not os.path.exists(self.edge_cache_dir): os.mkdir(self.edge_cache_dir)
+        for old_file in glob.glob(self.edge_cache_dir + '/' + edge_type + '_*.pkl'): os.remove(old_file)
+        cache_file = self.edge_cache_dir + '/' + edge_type + '_' + cache_key + '.pkl'
+        with open(cache_file, 'wb') as out: pickle.dump(results, out)
+
+        return None
+
     def creates_new_edges(self, node_metadata_func: Callable) -> None:
         """Takes a nested dictionary of edge lists and adds them to an existing knowledge graph by their edge_type (
         e.g. chemical-gene). Once the knowledge graph is complete, it is written out as an `.owl` file to the
@@ -279,30 +495,49 @@ class KGBuilder(object):
 
         kg_owl = self.full_kg.replace('noOWL', 'OWL') if self.decode_owl == 'yes' else self.full_kg
         annot_loc, df = self.write_location + kg_owl[:-4] + '_AnnotationsOnly.nt', kg_owl[:-4] + '_LogicOnly.owl'
-        kg_bld = KGConstructionApproach(self.res_dir); master_meta: Set = set()
-        for edge_type in [x for x in self.edge_dict.keys() if x != 'entity_namespaces']:
+        kg_bld = KGConstructionApproach(self.res_dir); tasks: List[Tuple] = []; cache: Dict = {}
+        results: Iterator[Tuple]  # the built edge types, from worker processes or built in this process
+        master_meta = FingerprintSet()  # metadata triples already written are only tracked by fingerprint
+        edge_types = [x for x in self.edge_dict.keys() if x != 'entity_namespaces']
+        for edge_type in edge_types:
             edge_list = self.edge_dict[edge_type]['edge_list']; del self.edge_dict[edge_type]['edge_list']
-            s_type, o_type = self.edge_dict[edge_type]['data_type'].split('-'); node1, node2 = set(), set()
-            rel, uri = self.edge_dict[edge_type]['edge_relation'], self.edge_dict[edge_type]['uri']
+            rel = self.edge_dict[edge_type]['edge_relation']
             invrel = self.checks_for_inverse_relations(rel, edge_list) if self.inverse_relations is not None else None
-            p = 'Creating {} ({}-{}) Edges'.format(edge_type.upper(), s_type, o_type); print('\n' + p); logger.info(p)
-            pbar = tqdm(total=len(edge_list)); res = set()
-            while len(edge_list) > 0:
-                pbar.update(1); edge = edge_list.pop(0)
-                edge_info = {'n1': s_type, 'n2': o_type, 'rel': rel, 'inv_rel': invrel, 'uri': uri, 'edges': edge}
-                meta = node_metadata_func(ent=[''.join(x) for x in list(zip(uri, edge))], e_type=[s_type, o_type])
-                meta_logic = [True if (self.node_data is None and meta is None)
-                              or [s_type, o_type] == ['class', 'class']
-                              or (self.node_data is not None and meta is not None) else False][0]
-                if self.check_ontology_class_nodes(edge_info) and meta_logic:  # ensure ont classes are in kg
-                    if self.construct_approach == 'subclass': edges = kg_bld.subclass_constructor(edge_info, edge_type)
-                    else: edges = kg_bld.instance_constructor(edge_info, edge_type)
-                    self.graph = adds_edges_to_graph(self.graph, edges, False); res |= set(edges)
-                    node1 |= {edge[0]}; node2 |= {edge[1]}
-                    if meta is not None:
-                        new_meta = {x for x in meta if x not in master_meta}; master_meta |= new_meta
-                        if len(new_meta) > 0: appends_to_existing_file(new_meta, annot_loc, ' ')
-            pbar.close(); self.gets_edge_statistics(edge_type, res, [node1, node2]); del [node1, node2]
+            cache[edge_type] = self.loads_edge_cache(edge_type, invrel)
+            if cache[edge_type][1] is None: tasks += [(edge_type, edge_list, invrel)]
+        if self.workers > 1 and len(tasks) > 1:  # edge types only depend on their own edge list, build them in parallel
+            log_str = 'Creating Edges Using {} Worker Processes'.format(self.workers)
+            print('\n' + log_str); logger.info(log_str)
+            builder = copy.copy(self); builder.graph = Graph()  # workers never read the graph
+            state = {'builder': builder, 'kg_bld': kg_bld, 'node_metadata_func': node_metadata_func}
+            ctx = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+            pool = ctx.Pool(min(self.workers, len(tasks)), initializes_edge_worker, (state,))
+            results = pool.imap(constructs_edge_type_in_worker, tasks)  # results are returned in edge type order
+        else:
+            pool, results = None, ((x[0],) + self.constructs_edge_type(x[0], x[1], x[2], kg_bld, node_metadata_func) +
+                                   (kg_bld.subclass_error.pop(x[0], None),) for x in tasks)
+        del tasks
+        annot_writer = NTriplesWriter(annot_loc)  # kept open while the metadata of all edge types is written
+        for edge_type in edge_types:
+            s_type, o_type = self.edge_dict[edge_type]['data_type'].split('-'); cache_key, cached = cache.pop(edge_type)
+            if cached is not None: res, meta, node1, node2, errors = cached; p = 'Reused Cached {} ({}-{}) Edges'
+            else:
+                res, meta, node1, node2, errors = next(results)[1:]; p = 'Created {} ({}-{}) Edges'
+                if cache_key is not None:
+                    self.writes_edge_cache(edge_type, cache_key, (res, meta, node1, node2, errors))
+            if cached is not None or pool is not None:  # unpickled triples hold new copies of the build's terms
+                res, meta = term_pool.interns_triples(res), term_pool.interns_triples(meta)
+            p = p.format(edge_type.upper(), s_type, o_type); print('\n' + p); logger.info(p)
+            self.graph.addN((s, p, o, self.graph) for s, p, o in res)  # bulk insert edge type triples
+            self.registry.updates_registry(res)
+            new_meta = master_meta.updates_set(meta)
+            if len(new_meta) > 0: annot_writer.writes_triples(new_meta)
+            if errors is not None: kg_bld.subclass_error[edge_type] = errors
+            self.gets_edge_statistics(edge_type, res, [node1, node2]); del [res, meta, node1, node2]
+        annot_writer.close()
+        if pool is not None: pool.close(); pool.join()
+        log_str = 'Term Pool: {terms} terms, {hits} hits, {misses} misses'.format(**term_pool.gets_statistics())
+        print(log_str); logger.info(log_str)
         print('\nSerializing Knowledge Graph'); logger.info('Serializing Knowledge Graph')
         self.graph.serialize(self.write_location + df); ontology_file_formatter(self.write_location, df, self.owl_tools)
         if len(kg_bld.subclass_error.keys()) > 0:  # output error logs
@@ -312,6 +547,139 @@ class KGBuilder(object):
 
         return None
 
+    def gets_checkpoint_key(self, step: str) -> str:
+        """Creates the key for a build step's checkpoint by fingerprinting the build flags and the content of all of
+        the input files used up to and including that step. The inputs include the ontologies (or the closed knowledge
+        graph for post-closure builds), relations, and node metadata for the "split" step, the master edge list and
+        subclass map for the "edges" step, and nothing further for the "owl_nets" step.
+
+        Args:
+            step: A string containing the name of a build step (i.e. "split", "edges", or "owl_nets").
+
+        Returns:
+            A string containing an md5 hash of the step's inputs.
+        """
+
+        flags = [self.kg_version, self.build, self.construct_approach, str(self.inverse_relations is not None),
+                 str(self.node_data is not None), str(self.decode_owl), step]
+        if self.build == 'post-closure':
+            closed_kg = self.write_location + self.full_kg
+            files = [closed_kg] if os.path.exists(closed_kg) else glob.glob(self.write_location + '/*.owl')[:1]
+        else: files = self.ontologies + [self.merged_ont_kg]
+        files += (self.inverse_relations or []) + (self.node_data or [])
+        if step != 'split' and self.build != 'post-closure':
+            files += [self.res_dir + '/Master_Edge_List_Dict.json'] + glob.glob(self.res_dir + '/construction_*/*.pkl')
+
+        return fingerprints_files(files, *flags)
+
+    def writes_checkpoint(self, step: str, state: Dict, files: Optional[List] = None) -> None:
+        """Saves the state of the build after a step has completed when checkpoints are enabled (i.e. checkpoint or
+        resume is True), otherwise nothing is written. Any checkpoints previously written for the step are replaced
+        and the checkpoints of all later steps are removed, since they were derived from older state.
+
+        Args:
+            step: A string containing the name of a build step (i.e. "split", "edges", or "owl_nets").
+            state: A dictionary of objects needed to resume the build after the step. An rdflib Graph stored under the
+                "graph" key is saved as a list of triples in order to preserve its insertion order.
+            files: A list of files (relative to write_location) which later build steps modify and which need to be
+                restored when resuming from the checkpoint.
+
+        Returns:
+            None.
+        """
+
+        if not self.checkpoint: return None
+        log_str = 'Writing {} Checkpoint'.format(step.upper()); print(log_str); logger.info(log_str)
+        if not os.path.exists(self.checkpoint_dir): os.mkdir(self.checkpoint_dir)
+        steps = ['split', 'edges', 'owl_nets']
+        for old_file in [x for y in steps[steps.index(step):] for x in glob.glob(self.checkpoint_dir + '/' + y + '_*')]:
+            os.remove(old_file)
+        chk_file = self.checkpoint_dir + '/' + step + '_' + self.gets_checkpoint_key(step)
+        for file_name in files or []: shutil.copy(self.write_location + file_name, chk_file + '_' + file_name[1:])
+        state = {**state, 'graph': list(state['graph'])} if 'graph' in state else state
+        with open(chk_file + '.pkl', 'wb') as out: pickle.dump({'state': state, 'files': files or []}, out)
+
+        return None
+
+    def loads_checkpoint(self, steps: List[str]) -> Tuple[Optional[str], Dict]:
+        """When resuming a build, finds the last build step with a checkpoint whose key matches the current inputs,
+        restores the files saved with it, and returns its state.
+
+        Args:
+            steps: A list of strings containing the names of the checkpointed build steps, in build order.
+
+        Returns:
+            A tuple containing the name of the build step that the build can resume after (None if the build needs
+            to start from the beginning) and a dictionary of the step's state.
+        """
+
+        if self.resume:
+            for step in steps[::-1]:
+                chk_file = self.checkpoint_dir + '/' + step + '_' + self.gets_checkpoint_key(step)
+                if os.path.exists(chk_file + '.pkl'):
+                    log_str = 'Resuming Build After {} Checkpoint'.format(step.upper()); print(log_str)
+                    logger.info(log_str)
+                    with open(chk_file + '.pkl', 'rb') as _file: checkpoint = pickle.load(_file)
+                    for file_name in checkpoint['files']:
+                        shutil.copy(chk_file + '_' + file_name[1:], self.write_location + file_name)
+                    state = checkpoint['state']
+                    if 'graph' in state:  # rebuild the graph in its original insertion order
+                        graph = Graph(store=self.graph_store)
+                        graph.addN((s, p, o, graph) for s, p, o in state['graph'])
+                        state['graph'] = graph
+                    return step, state
+            log_str = 'No Valid Checkpoints Found, Starting Build From The Beginning'; print(log_str)
+            logger.info(log_str)
+
+        return None, dict()
+
+    def outputs_metadata(self, meta: Metadata, node_int_map: Dict, graph: Union[Graph, Set],
+                         details: Dict) -> Optional[multiprocessing.process.BaseProcess]:
+        """Writes the node metadata file of an OWL-NETS or purified graph. When building with more than one worker
+        and processes can be forked, the file is written by a child process so that the outputs of the next graph are
+        created at the same time. The child process shares the parent's metadata, integer map, and graph.
+
+        Args:
+            meta: A Metadata instance whose full_kg attribute contains the name of the graph.
+            node_int_map: A dictionary where keys are node and relation identifiers and values are integers.
+            graph: A set of RDFLib Graph object triples or an RDFLib Graph.
+            details: A dictionary of information to include in the step's telemetry record.
+
+        Returns:
+            The process writing the file, which needs to be joined (see joins_metadata_outputs), or None if the file
+            was written by the current process.
+        """
+
+        if self.workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            process = multiprocessing.get_context('fork').Process(target=writes_metadata_output,
+                                                                  args=(meta, node_int_map, graph, details))
+            process.start()
+            return process
+        else: writes_metadata_output(meta, node_int_map, graph, details)
+
+        return None
+
+    @staticmethod
+    def joins_metadata_outputs(processes: List) -> None:
+        """Waits for the processes started by outputs_metadata to finish.
+
+        Args:
+            processes: A list of processes returned by outputs_metadata (None values are skipped).
+
+        Returns:
+            None.
+
+        Raises:
+            RuntimeError: If a process did not finish successfully.
+        """
+
+        for process in [x for x in processes if x is not None]:
+            process.join()
+            if process.exitcode != 0:
+                raise RuntimeError('Writing node metadata failed with exit code {}'.format(process.exitcode))
+
+        return None
+
     def construct_knowledge_graph(self) -> None:
         """Builds a knowledge graph. The knowledge graph build is completed differently depending on the build type
         that the user requested. The build types include: "full", "partial", or "post-closure". The knowledge graph
@@ -344,7 +712,8 @@ class PartialBuild(KGBuilder):
         """Builds a partial knowledge graph. A partial knowledge graph build is recommended when one intends to build a
         knowledge graph and intends to run a reasoner over it. The partial build includes the following steps: (1)
         Process relation/inverse relations; (2) Merge ontologies; (3) Process node metadata; (4) Create graph subsets;
-        and (5) Add master edge list to merged ontologies.
+        and (5) Add master edge list to merged ontologies. When checkpoints are enabled, a checkpoint is written after
+        steps 4 and 5 and when resuming, the build restarts after the last step whose inputs have not changed.
 
         Returns:
             None.
@@ -358,42 +727,58 @@ class PartialBuild(KGBuilder):
 
         # STEP 1: PROCESS RELATION AND INVERSE RELATION DATA
         log_str = '*** Loading Relations Data ***'; print(log_str); logger.info(log_str)
-        self.reverse_relation_processor()
-
-        # STEP 2: MERGE ONTOLOGIES
-        if self.merged_ont_kg in glob.glob(self.write_location + '/*.owl'):
-            log_str = '*** Loading Merged Ontologies ***'; print(log_str); logger.info(log_str)
-            self.graph = Graph().parse(self.merged_ont_kg, format='xml')
-        else:
-            log_str = '*** Merging Ontology Data ***'; print(log_str); logger.info(log_str)
-            merged_ontology_location = self.merged_ont_kg.split('/')[-1]
-            merges_ontologies(self.ontologies, merged_ontology_location, self.owl_tools)
-            self.graph.parse(self.merged_ont_kg, format='xml')  # load the merged ontology
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-
-        # STEP 3: PROCESS NODE METADATA
-        log_str = '*** Loading Node Metadata Data ***'; print(log_str); logger.info(log_str)
-        meta = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
-        if self.node_data: meta.metadata_processor(); meta.extract_metadata(self.graph); self.node_dict = meta.node_dict
-
-        # STEP 4: CREATE GRAPH SUBSETS
-        log_str = '*** Splitting Graph ***'; print(log_str); logger.info(log_str)
-        self.graph, annotation_triples = splits_knowledge_graph(self.graph)
+        with records_build_step('relations', details=self.telemetry): self.reverse_relation_processor()
         full_kg_owl = self.full_kg.replace('noOWL', 'OWL') if self.decode_owl == 'yes' else self.full_kg
         annot, full = full_kg_owl[:-4] + '_AnnotationsOnly.nt', full_kg_owl[:-4] + '.nt'
-        appends_to_existing_file(annotation_triples, self.write_location + annot, ' '); del annotation_triples
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+        step, state = self.loads_checkpoint(['split', 'edges'])
+        if step is not None: self.graph, self.node_dict = state['graph'], state['node_dict']
+        meta = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
 
-        # STEP 5: ADD EDGE DATA TO KNOWLEDGE GRAPH DATA
-        log_str = '*** Building Knowledge Graph Edges ***'; print(log_str); logger.info(log_str)
-        self.ont_classes = gets_ontology_classes(self.graph); self.obj_properties = gets_object_properties(self.graph)
-        self.creates_new_edges(meta.creates_node_metadata)
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-        # merge annotations with logic graph
-        shutil.copy(self.write_location + annot, self.write_location + full)
-        appends_to_existing_file(set(self.graph), self.write_location + full, ' ')
+        if step is None:
+            # STEP 2: MERGE ONTOLOGIES
+            with records_build_step('merge_ontologies', details=self.telemetry) as record:
+                if self.merged_ont_kg in glob.glob(self.write_location + '/*.owl'):
+                    log_str = '*** Loading Merged Ontologies ***'; print(log_str); logger.info(log_str)
+                    self.graph = loads_cached_graph(self.merged_ont_kg, store=self.graph_store)
+                else:
+                    log_str = '*** Merging Ontology Data ***'; print(log_str); logger.info(log_str)
+                    merged_ontology_location = self.merged_ont_kg.split('/')[-1]
+                    merges_ontologies(self.ontologies, merged_ontology_location, self.owl_tools)
+                    self.graph = loads_cached_graph(self.merged_ont_kg, store=self.graph_store)  # load merged ontology
+                record['output_triples'] = len(self.graph)
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+
+            # STEP 3: PROCESS NODE METADATA
+            log_str = '*** Loading Node Metadata Data ***'; print(log_str); logger.info(log_str)
+            if self.node_data:
+                with records_build_step('node_metadata', len(self.graph), self.telemetry):
+                    meta.metadata_processor(); meta.extract_metadata(self.graph); self.node_dict = meta.node_dict
+
+            # STEP 4: CREATE GRAPH SUBSETS
+            log_str = '*** Splitting Graph ***'; print(log_str); logger.info(log_str)
+            with records_build_step('split', len(self.graph), self.telemetry) as record:
+                self.graph, annotation_triples = splits_knowledge_graph(self.graph)
+                record.update({'output_triples': len(self.graph), 'annotation_triples': len(annotation_triples)})
+                with NTriplesWriter(self.write_location + annot) as writer: writer.writes_triples(annotation_triples)
+                del annotation_triples
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+            self.writes_checkpoint('split', {'graph': self.graph, 'node_dict': self.node_dict}, [annot])
+
+        if step in [None, 'split']:
+            # STEP 5: ADD EDGE DATA TO KNOWLEDGE GRAPH DATA
+            log_str = '*** Building Knowledge Graph Edges ***'; print(log_str); logger.info(log_str)
+            with records_build_step('edges', len(self.graph), self.telemetry) as record:
+                self.registers_graph_entities()
+                self.creates_new_edges(meta.creates_node_metadata); record['output_triples'] = len(self.graph)
+                record['term_pool'] = term_pool.gets_statistics()
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+            # merge annotations with logic graph
+            shutil.copy(self.write_location + annot, self.write_location + full)
+            with NTriplesWriter(self.write_location + full) as writer: writer.writes_triples(self.graph)
+            self.writes_checkpoint('edges', {'graph': self.graph, 'node_dict': self.node_dict})
 
         del meta, self.edge_dict, self.graph, self.node_dict, self.relations_dict
+        term_pool.clears_pool()  # releases the build's terms
 
         return None
 
@@ -413,6 +798,8 @@ class PostClosureBuild(KGBuilder):
         The post-closure build utilizes the following steps: (1) Process relation and inverse relation data; (2)
         Load closed knowledge graph; (3) Process node metadata; (4) Create graph subsets; (5) Decode OWL-encoded
         classes; (6) Output knowledge graph files and create edge lists; and (7) Extract and write node metadata.
+        When checkpoints are enabled, a checkpoint is written after steps 4 and 5 and when resuming, the build
+        restarts after the last step whose inputs have not changed.
 
         Returns:
             None.
@@ -427,62 +814,86 @@ class PostClosureBuild(KGBuilder):
 
         # STEP 1: PROCESS RELATION AND INVERSE RELATION DATA
         log_str = '*** Loading Relations Data ***'; print(log_str); logger.info(log_str)
-        self.reverse_relation_processor()
-
-        # STEP 2: LOAD CLOSED KNOWLEDGE GRAPH
-        closed_kg_location = glob.glob(self.write_location + '/*.owl')
-        if len(closed_kg_location) == 0:
-            log_str = 'The closed KG file does not exist!'; logger.error('OSError: ' + log_str); raise OSError(log_str)
-        elif os.stat(closed_kg_location[0]).st_size == 0:
-            log_str = '{} is empty'.format(closed_kg_location)
-            logger.error('TypeError: ' + log_str); raise TypeError(log_str)
-        else:
-            log_str = '*** Loading Closed Knowledge Graph ***'; print(log_str); logger.info(log_str)
-            os.rename(closed_kg_location[0], self.write_location + self.full_kg)  # rename closed kg file
-            self.graph = Graph().parse(self.write_location + self.full_kg, format='xml')
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-
-        # STEP 3: PROCESS NODE METADATA
-        log_str = '*** Loading Node Metadata Data ***'; print(log_str); logger.info(log_str)
-        meta = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
-        if self.node_data: meta.metadata_processor(); meta.extract_metadata(self.graph); self.node_dict = meta.node_dict
-
-        # STEP 4: CREATE GRAPH SUBSETS
-        log_str = '*** Splitting Graph ***'; print(log_str); logger.info(log_str)
-        self.graph, annotation_triples = splits_knowledge_graph(self.graph)
+        with records_build_step('relations', details=self.telemetry): self.reverse_relation_processor()
         full_kg_owl = self.full_kg.replace('noOWL', 'OWL') if self.decode_owl == 'yes' else self.full_kg
         annot, full = full_kg_owl[:-4] + '_AnnotationsOnly.nt', full_kg_owl[:-4] + '.nt'
-        appends_to_existing_file(annotation_triples, self.write_location + annot, ' '); del annotation_triples
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-        # merge annotations with logic graph
-        shutil.copy(self.write_location + annot, self.write_location + full)
-        appends_to_existing_file(set(self.graph), self.write_location + full, ' ')
-
-        # STEP 5: DECODE OWL SEMANTICS
-        if self.decode_owl:
-            log_str = '*** Running OWL-NETS ***'; print('\n' + log_str); logger.info(log_str)
-            owl_nets = OwlNets(self.graph, self.write_location, self.full_kg, self.construct_approach, self.owl_tools)
-            results = owl_nets.run_owl_nets()
-        else:
-            logger.info('*** Converting Knowledge Graph to Networkx MultiDiGraph ***')
-            convert_to_networkx(self.write_location, self.full_kg[:-4], self.graph); results = tuple([set(self.graph)])
+        step, state = self.loads_checkpoint(['split', 'owl_nets'])
+        if step is not None: self.graph, self.node_dict = state.get('graph', self.graph), state['node_dict']
+        meta = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
+
+        if step is None:
+            # STEP 2: LOAD CLOSED KNOWLEDGE GRAPH
+            closed_kg_location = glob.glob(self.write_location + '/*.owl')
+            if len(closed_kg_location) == 0:
+                log_str = 'The closed KG file does not exist!'; logger.error('OSError: ' + log_str)
+                raise OSError(log_str)
+            elif os.stat(closed_kg_location[0]).st_size == 0:
+                log_str = '{} is empty'.format(closed_kg_location)
+                logger.error('TypeError: ' + log_str); raise TypeError(log_str)
+            else:
+                log_str = '*** Loading Closed Knowledge Graph ***'; print(log_str); logger.info(log_str)
+                os.rename(closed_kg_location[0], self.write_location + self.full_kg)  # rename closed kg file
+                with records_build_step('load_closed_kg', details=self.telemetry) as record:
+                    self.graph = loads_cached_graph(self.write_location + self.full_kg, store=self.graph_store)
+                    record['output_triples'] = len(self.graph)
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+
+            # STEP 3: PROCESS NODE METADATA
+            log_str = '*** Loading Node Metadata Data ***'; print(log_str); logger.info(log_str)
+            if self.node_data:
+                with records_build_step('node_metadata', len(self.graph), self.telemetry):
+                    meta.metadata_processor(); meta.extract_metadata(self.graph); self.node_dict = meta.node_dict
+
+            # STEP 4: CREATE GRAPH SUBSETS
+            log_str = '*** Splitting Graph ***'; print(log_str); logger.info(log_str)
+            with records_build_step('split', len(self.graph), self.telemetry) as record:
+                self.graph, annotation_triples = splits_knowledge_graph(self.graph)
+                record.update({'output_triples': len(self.graph), 'annotation_triples': len(annotation_triples)})
+                with NTriplesWriter(self.write_location + annot) as writer: writer.writes_triples(annotation_triples)
+                del annotation_triples
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+            # merge annotations with logic graph
+            shutil.copy(self.write_location + annot, self.write_location + full)
+            with NTriplesWriter(self.write_location + full) as writer: writer.writes_triples(self.graph)
+            self.writes_checkpoint('split', {'graph': self.graph, 'node_dict': self.node_dict})
+
+        if step in [None, 'split']:
+            # STEP 5: DECODE OWL SEMANTICS
+            with records_build_step('owl_nets', len(self.graph), self.telemetry) as record:
+                if self.decode_owl:
+                    log_str = '*** Running OWL-NETS ***'; print('\n' + log_str); logger.info(log_str)
+                    owl_nets = OwlNets(self.graph, self.write_location, self.full_kg, self.construct_approach,
+                                       self.owl_tools, self.workers)
+                    results = owl_nets.run_owl_nets(); del owl_nets
+                else:
+                    logger.info('*** Converting Knowledge Graph to Networkx MultiDiGraph ***')
+                    convert_to_networkx(self.write_location, self.full_kg[:-4], self.graph)
+                    results = tuple([set(self.graph)])
+                record.update({'output_triples': len(results[0]), 'term_pool': term_pool.gets_statistics()})
+            self.writes_checkpoint('owl_nets', {'node_dict': self.node_dict, 'results': results})
+        else: results = state['results']
 
         # STEP 6: WRITE OUT KNOWLEDGE GRAPH DATA AND CREATE EDGE LISTS
         log_str = '*** Building Knowledge Graph Edges ***'; print(log_str); logger.info(log_str)
         f_prefix = ('', '_' + self.construct_approach.upper() + '_purified') if len(results) == 2 else ('', '')
+        processes: List = []
         for graph in results:
             if graph is not None:
                 print('OWL-NETS Graph') if results.index(graph) == 0 else print('Purified OWL-NETS Graph')
                 triple_list_file = self.full_kg[:-4] + f_prefix[results.index(graph)] + '_Triples_Integers.txt'
                 triple_map = triple_list_file[:-5] + '_Identifier_Map.json'
-                node_int_map = maps_ids_to_integers(graph, self.write_location, triple_list_file, triple_map)
+                details = dict(self.telemetry, output=triple_list_file)
+                with records_build_step('integer_mapping', len(graph), details):
+                    node_int_map = maps_ids_to_integers(graph, self.write_location, triple_list_file, triple_map)
 
                 # STEP 8: EXTRACT AND WRITE NODE METADATA
                 log_str = '*** Processing Metadata ***'; print('\n' + log_str); logger.info(log_str)
                 meta.full_kg = self.full_kg[:-4] + f_prefix[results.index(graph)] + '.owl'
-                if self.node_data: meta.output_metadata(node_int_map, graph)
+                if self.node_data: processes += [self.outputs_metadata(meta, node_int_map, graph, details)]
+        self.joins_metadata_outputs(processes)
 
-        del meta, self.edge_dict, self.graph, self.node_dict, owl_nets, self.relations_dict, results
+        del meta, self.edge_dict, self.graph, self.node_dict, self.relations_dict, results
+        term_pool.clears_pool()  # releases the build's terms
 
         return None
 
@@ -499,7 +910,8 @@ class FullBuild(KGBuilder):
         does not include running a reasoner. The full build includes the following steps: (1) Process relation/inverse
         relations; (2) Merge ontologies; (3) Process node metadata; (4) Create graph subsets; (5) Add master edge
         list to merged ontologies; (6) Decode OWL-encoded classes; (7) Output knowledge graphs and create edge lists
-        and (8) Extract and write node metadata.
+        and (8) Extract and write node metadata. When checkpoints are enabled, a checkpoint is written after steps 4,
+        5, and 6 and when resuming, the build restarts after the last step whose inputs have not changed.
 
         Returns:
             None.
@@ -510,64 +922,91 @@ class FullBuild(KGBuilder):
 
         # STEP 1: PROCESS RELATION AND INVERSE RELATION DATA
         log_str = '*** Loading Relations Data ***'; print(log_str); logger.info(log_str)
-        self.reverse_relation_processor()
-
-        # STEP 2: MERGE ONTOLOGIES
-        if self.merged_ont_kg in glob.glob(self.write_location + '/*.owl'):
-            log_str = '*** Loading Merged Ontologies ***'; print(log_str); logger.info(log_str)
-            self.graph = Graph().parse(self.merged_ont_kg, format='xml')
-        else:
-            log_str = '*** Merging Ontology Data ***'; print(log_str); logger.info(log_str)
-            merges_ontologies(self.ontologies, self.merged_ont_kg.split('/')[-1], self.owl_tools)
-            self.graph.parse(self.merged_ont_kg, format='xml')  # load the merged ontology
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-
-        # STEP 3: PROCESS NODE METADATA
-        log_str = '*** Loading Node Metadata Data ***'; print(log_str); logger.info(log_str)
-        meta = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
-        if self.node_data: meta.metadata_processor(); meta.extract_metadata(self.graph); self.node_dict = meta.node_dict
-
-        # STEP 4: CREATE GRAPH SUBSETS
-        log_str = '*** Splitting Graph ***'; print(log_str); logger.info(log_str)
-        self.graph, annotation_triples = splits_knowledge_graph(self.graph)
+        with records_build_step('relations', details=self.telemetry): self.reverse_relation_processor()
         full_kg_owl = self.full_kg.replace('noOWL', 'OWL') if self.decode_owl == 'yes' else self.full_kg
         annot, full = full_kg_owl[:-4] + '_AnnotationsOnly.nt', full_kg_owl[:-4] + '.nt'
-        appends_to_existing_file(annotation_triples, self.write_location + annot, ' '); del annotation_triples
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-
-        # STEP 5: ADD EDGE DATA TO KNOWLEDGE GRAPH DATA
-        log_str = '*** Building Knowledge Graph Edges ***'; print('\n' + log_str); logger.info(log_str)
-        self.ont_classes = gets_ontology_classes(self.graph); self.obj_properties = gets_object_properties(self.graph)
-        self.creates_new_edges(meta.creates_node_metadata)
-        stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
-        # merge annotations with logic graph
-        shutil.copy(self.write_location + annot, self.write_location + full)
-        appends_to_existing_file(set(self.graph), self.write_location + full, ' ')
-
-        # STEP 6: DECODE OWL SEMANTICS
-        if self.decode_owl:
-            log_str = '*** Running OWL-NETS ***'; print('\n' + log_str); logger.info(log_str)
-            owl_nets = OwlNets(self.graph, self.write_location, self.full_kg, self.construct_approach, self.owl_tools)
-            results = owl_nets.run_owl_nets()
-        else:
-            logger.info('*** Converting Knowledge Graph to Networkx MultiDiGraph ***')
-            convert_to_networkx(self.write_location, self.full_kg[:-4], self.graph); results = tuple([set(self.graph)])
+        step, state = self.loads_checkpoint(['split', 'edges', 'owl_nets'])
+        if step is not None: self.graph, self.node_dict = state.get('graph', self.graph), state['node_dict']
+        meta = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
+
+        if step is None:
+            # STEP 2: MERGE ONTOLOGIES
+            with records_build_step('merge_ontologies', details=self.telemetry) as record:
+                if self.merged_ont_kg in glob.glob(self.write_location + '/*.owl'):
+                    log_str = '*** Loading Merged Ontologies ***'; print(log_str); logger.info(log_str)
+                    self.graph = loads_cached_graph(self.merged_ont_kg, store=self.graph_store)
+                else:
+                    log_str = '*** Merging Ontology Data ***'; print(log_str); logger.info(log_str)
+                    merges_ontologies(self.ontologies, self.merged_ont_kg.split('/')[-1], self.owl_tools)
+                    self.graph = loads_cached_graph(self.merged_ont_kg, store=self.graph_store)  # load merged ontology
+                record['output_triples'] = len(self.graph)
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+
+            # STEP 3: PROCESS NODE METADATA
+            log_str = '*** Loading Node Metadata Data ***'; print(log_str); logger.info(log_str)
+            if self.node_data:
+                with records_build_step('node_metadata', len(self.graph), self.telemetry):
+                    meta.metadata_processor(); meta.extract_metadata(self.graph); self.node_dict = meta.node_dict
+
+            # STEP 4: CREATE GRAPH SUBSETS
+            log_str = '*** Splitting Graph ***'; print(log_str); logger.info(log_str)
+            with records_build_step('split', len(self.graph), self.telemetry) as record:
+                self.graph, annotation_triples = splits_knowledge_graph(self.graph)
+                record.update({'output_triples': len(self.graph), 'annotation_triples': len(annotation_triples)})
+                with NTriplesWriter(self.write_location + annot) as writer: writer.writes_triples(annotation_triples)
+                del annotation_triples
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+            self.writes_checkpoint('split', {'graph': self.graph, 'node_dict': self.node_dict}, [annot])
+
+        if step in [None, 'split']:
+            # STEP 5: ADD EDGE DATA TO KNOWLEDGE GRAPH DATA
+            log_str = '*** Building Knowledge Graph Edges ***'; print('\n' + log_str); logger.info(log_str)
+            with records_build_step('edges', len(self.graph), self.telemetry) as record:
+                self.registers_graph_entities()
+                self.creates_new_edges(meta.creates_node_metadata); record['output_triples'] = len(self.graph)
+                record['term_pool'] = term_pool.gets_statistics()
+            stats = derives_graph_statistics(self.graph); print(stats); logger.info(stats)
+            # merge annotations with logic graph
+            shutil.copy(self.write_location + annot, self.write_location + full)
+            with NTriplesWriter(self.write_location + full) as writer: writer.writes_triples(self.graph)
+            self.writes_checkpoint('edges', {'graph': self.graph, 'node_dict': self.node_dict})
+
+        if step in [None, 'split', 'edges']:
+            # STEP 6: DECODE OWL SEMANTICS
+            with records_build_step('owl_nets', len(self.graph), self.telemetry) as record:
+                if self.decode_owl:
+                    log_str = '*** Running OWL-NETS ***'; print('\n' + log_str); logger.info(log_str)
+                    owl_nets = OwlNets(self.graph, self.write_location, self.full_kg, self.construct_approach,
+                                       self.owl_tools, self.workers)
+                    results = owl_nets.run_owl_nets(); del owl_nets
+                else:
+                    logger.info('*** Converting Knowledge Graph to Networkx MultiDiGraph ***')
+                    convert_to_networkx(self.write_location, self.full_kg[:-4], self.graph)
+                    results = tuple([set(self.graph)])
+                record.update({'output_triples': len(results[0]), 'term_pool': term_pool.gets_statistics()})
+            self.writes_checkpoint('owl_nets', {'node_dict': self.node_dict, 'results': results})
+        else: results = state['results']
 
         # STEP 7: WRITE OUT KNOWLEDGE GRAPH METADATA AND CREATE EDGE LISTS
         log_str = '*** Writing Knowledge Graph Edge Lists ***'; print('\n' + log_str); logger.info(log_str)
         f_prefix = ('', '_' + self.construct_approach.upper() + '_purified') if len(results) == 2 else ('', '')
+        processes: List = []
         for graph in results:
             if graph is not None:
                 print('OWL-NETS Graph') if results.index(graph) == 0 else print('Purified OWL-NETS Graph')
                 triple_list_file = self.full_kg[:-4] + f_prefix[results.index(graph)] + '_Triples_Integers.txt'
                 triple_map = triple_list_file[:-5] + '_Identifier_Map.json'
-                node_int_map = maps_ids_to_integers(graph, self.write_location, triple_list_file, triple_map)
+                details = dict(self.telemetry, output=triple_list_file)
+                with records_build_step('integer_mapping', len(graph), details):
+                    node_int_map = maps_ids_to_integers(graph, self.write_location, triple_list_file, triple_map)
 
                 # STEP 8: EXTRACT AND WRITE NODE METADATA
                 log_str = '*** Processing Metadata ***'; print('\n' + log_str); logger.info(log_str)
                 meta.full_kg = self.full_kg[:-4] + f_prefix[results.index(graph)] + '.owl'
-                if self.node_data: meta.output_metadata(node_int_map, graph)
+                if self.node_data: processes += [self.outputs_metadata(meta, node_int_map, graph, details)]
+        self.joins_metadata_outputs(processes)
 
-        del meta, self.edge_dict, self.graph, self.node_dict, owl_nets, self.relations_dict, results
+        del meta, self.edge_dict, self.graph, self.node_dict, self.relations_dict, results
+        term_pool.clears_pool()  # releases the build's terms
 
         return None
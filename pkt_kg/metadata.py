@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 # import needed libraries
+import functools
 import glob
 import json
 import logging.config
@@ -16,7 +17,7 @@ from datetime import date, datetime
 from rdflib import Graph, Literal, Namespace, URIRef   # type: ignore
 from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
 from tqdm import tqdm  # type: ignore
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from pkt_kg.utils import *
 
@@ -56,21 +57,48 @@ class Metadata(object):
                         'Description': 'Any individual unit of a collection of like units arranged in a linear order',
                         'Synonym': 'None'} ... }
                 }
+            When node metadata is loaded from node_data (see metadata_processor), node_dict is a
+            pkt_kg.utils.NodeMetadataStore, which is looked up the same way but is stored on disk.
     """
 
     def __init__(self, kg_version: str, write_location: str, kg_location: str, node_data: Optional[List],
-                 node_dict: Optional[Dict]) -> None:
+                 node_dict: Optional[Union[Dict, NodeMetadataStore]]) -> None:
 
         self.kg_version: str = kg_version
         self.write_location: str = write_location
         self.full_kg: str = kg_location
         self.node_data = node_data
+        self.__entity_metadata = functools.lru_cache(maxsize=2 ** 16)(self._creates_entity_metadata)
         self.node_dict = node_dict
 
+    @property
+    def node_dict(self) -> Optional[Union[Dict, NodeMetadataStore]]:
+        """The node metadata dictionary. Replacing it clears the cached metadata triples (see creates_node_metadata)."""
+
+        return self.__node_dict
+
+    @node_dict.setter
+    def node_dict(self, node_dict: Optional[Union[Dict, NodeMetadataStore]]) -> None:
+
+        self.__node_dict = node_dict; self.__entity_metadata.cache_clear()
+
+    def __getstate__(self) -> Dict:
+
+        state = self.__dict__.copy(); del state['_Metadata__entity_metadata']
+
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+
+        self.__dict__.update(state)
+        self.__entity_metadata = functools.lru_cache(maxsize=2 ** 16)(self._creates_entity_metadata)
+
     def metadata_processor(self) -> None:
         """Loads a directory of node and relations data. The dictionary is nested with the outer keys corresponding
         to the metadata type (i.e. "nodes" or "relations") and the values containing dictionaries keyed by URI and
-        values containing a dictionary of metadata.
+        values containing a dictionary of metadata. The pickled dictionary is copied into an on-disk store (see
+        pkt_kg.utils.NodeMetadataStore) the first time it is loaded, so node metadata is looked up from disk rather
+        than being held in memory.
 
         Returns:
             None.
@@ -78,11 +106,42 @@ class Metadata(object):
 
         if self.node_data:
             log_str = 'Loading and Processing Node Metadata'; print(log_str); logger.info(log_str)
-            with open(self.node_data[0], 'rb') as out:
-                self.node_dict = pickle.load(out, encoding="utf8")
+            self.node_dict = loads_node_metadata_store(self.node_data[0])
 
         return None
 
+    @staticmethod
+    def gets_entity_annotations(graph: Graph, entities: List) -> Dict:
+        """Groups the label (rdfs:label), definition (obo:IAO_0000115), and synonym (any predicate containing
+        "synonym") annotations of a list of entities by subject. Each entity's outgoing edges are read once and the
+        type of each predicate is only worked out the first time the predicate is seen, so objects keep the order
+        returned by the graph.
+
+        Args:
+            graph: An rdflib graph object.
+            entities: A list of RDFLib URIRefs.
+
+        Returns:
+            annotations: A dictionary keyed by entity, with a dictionary keyed by "Label", "Description", or "Synonym"
+                as the value. Each of these contains a list of objects. Entities without annotations are not included.
+                For example:
+                    {URIRef('http://purl.obolibrary.org/obo/SO_0000373'): {
+                        'Label': [Literal('ds_RNA')],
+                        'Synonym': [Literal('double stranded RNA'), Literal('dsRNA')]}}
+        """
+
+        kinds: Dict = {RDFS.label: 'Label', obo.IAO_0000115: 'Description'}; annotations: Dict = dict()
+        for i in entities:
+            if i in annotations: continue
+            found: Dict = dict()
+            for p, o in graph.predicate_objects(i):
+                kind = kinds.get(p)
+                if kind is None: kind = kinds[p] = 'Synonym' if 'synonym' in str(p).lower() else ''
+                if kind: found.setdefault(kind, []).append(o)
+            if found: annotations[i] = found
+
+        return annotations
+
     def extract_metadata(self, graph: Graph) -> None:
         """Functions queries the knowledge graph to obtain labels, definitions/descriptions, and synonyms for all
         owl:Class, owl:NamedIndividual, and owl:ObjectProperty objects. This information is then added to the existing
@@ -91,6 +150,10 @@ class Metadata(object):
         value. The metadata types are packaged as a dictionary which is stored as the value to the node identifier as
         the key.
 
+        The entities are found in one pass over the rdf:type triples and their labels, descriptions, and synonyms are
+        grouped from a single query of each entity's outgoing edges (see gets_entity_annotations), rather than querying
+        the graph three times for each entity.
+
         Args:
             graph: An rdflib graph object.
 
@@ -101,47 +164,47 @@ class Metadata(object):
         log_str = 'Extracting Class and Relation Metadata'; print('\n' + log_str); logger.info(log_str)
 
         if self.node_dict:
-            domains = [
-                ('nodes', [i[0] for i in list(graph.triples((None, RDF.type, None)))
-                           if isinstance(i[0], URIRef)
-                           and (OWL.Class in i[2] or OWL.NamedIndividual in i[2])
-                           and ('#' not in str(i[0]) or '#' not in str(i[2]))]),
-                ('relations', [i[0] for i in list(graph.triples((None, RDF.type, None)))
-                               if isinstance(i[0], URIRef) and i[2] == OWL.ObjectProperty])
-            ]
-            for key, entities in domains:
+            nodes, relations = [], []
+            for s, o in graph.subject_objects(RDF.type):
+                if isinstance(s, URIRef):
+                    if (OWL.Class in o or OWL.NamedIndividual in o) and ('#' not in str(s) or '#' not in str(o)):
+                        nodes += [s]
+                    if o == OWL.ObjectProperty: relations += [s]
+            annotations = self.gets_entity_annotations(graph, nodes + relations)
+            for key, entities in [('nodes', nodes), ('relations', relations)]:
                 temp_dict = dict()
                 for i in tqdm(entities):
-                    labels = [x for x in list(graph.triples((i, RDFS.label, None)))]
-                    descriptions = [x for x in list(graph.triples((i, obo.IAO_0000115, None)))]
-                    synonyms = [x for x in list(graph.triples((i, None, None))) if 'synonym' in str(x[1]).lower()]
-                    if len(labels) == 0: pass
+                    values = annotations.get(i, dict())
+                    if 'Label' not in values: pass
                     else:
                         temp_dict[str(i)] = {
-                            'Label': str(labels[0][2]) if len(labels) > 0 else None,
-                            'Description': str(descriptions[0][2]) if len(descriptions) > 0 else None,
-                            'Synonym': '|'.join([str(c[2]) for c in synonyms]) if len(synonyms) > 0 else None
+                            'Label': str(values['Label'][0]),
+                            'Description': str(values['Description'][0]) if 'Description' in values else None,
+                            'Synonym': '|'.join([str(c) for c in values['Synonym']]) if 'Synonym' in values else None
                         }
-                self.node_dict[key] = {**self.node_dict[key], **temp_dict}
+                if isinstance(self.node_dict, NodeMetadataStore): self.node_dict.updates_metadata(key, temp_dict)
+                else: self.node_dict[key] = {**self.node_dict[key], **temp_dict}
 
             # add rdfs:subclassof and rdf:type
-            self.node_dict['relations'] = {
-                **self.node_dict['relations'],
-                **{'http://www.w3.org/2000/01/rdf-schema#subClassOf': {
-                    'Label': 'subClassOf', 'Description': 'The subject is a subclass of a class.', 'Synonym': 'None'},
-                    'http://www.w3.org/1999/02/22-rdf-syntax-ns#type': {
-                        'Label': 'type', 'Description': 'The subject is an instance of a class.', 'Synonym': 'None'}}}
-
-            if self.node_data:
-                with open(self.node_data[0], 'wb') as out:
-                    pickle.dump(self.node_dict, out)
+            temp_dict = {'http://www.w3.org/2000/01/rdf-schema#subClassOf': {
+                'Label': 'subClassOf', 'Description': 'The subject is a subclass of a class.', 'Synonym': 'None'},
+                'http://www.w3.org/1999/02/22-rdf-syntax-ns#type': {
+                    'Label': 'type', 'Description': 'The subject is an instance of a class.', 'Synonym': 'None'}}
+            if isinstance(self.node_dict, NodeMetadataStore): self.node_dict.updates_metadata('relations', temp_dict)
+            else:
+                self.node_dict['relations'] = {**self.node_dict['relations'], **temp_dict}
+                if self.node_data:
+                    with open(self.node_data[0], 'wb') as out:
+                        pickle.dump(self.node_dict, out)
+            self.__entity_metadata.cache_clear()
 
         return None
 
-    def creates_node_metadata(self, ent: List, e_type: Optional[List] = None, key_type: str = 'nodes') -> Graph:
+    def creates_node_metadata(self, ent: List, e_type: Optional[List] = None,
+                              key_type: str = 'nodes') -> Optional[List]:
         """Given a node in the knowledge graph, if the node is not an ontology class and if it has metadata information,
         then new edges are created to add the metadata to the knowledge graph. Metadata that is added includes: labels,
-        descriptions, and synonyms.
+        descriptions, and synonyms. The triples of recently used entities are cached (see _creates_entity_metadata).
 
         Args:
             ent: A list of two node identifiers (e.g. ['http://example/3075', 'http://example/1080']).
@@ -149,31 +212,49 @@ class Metadata(object):
             key_type: A string indicating if the key should be 'nodes' or 'relations (default='nodes').
 
         Returns:
-            edges: A list of tuples containing RDFLib objects used to add metadata to a knowledge graph.
+            edges: A list of tuples containing RDFLib objects used to add metadata to a knowledge graph or None if none
+                of the entities have metadata.
         """
 
-        key, edges, x = key_type, [], []
+        key, x = key_type, []
         if self.node_dict:
-            if key == 'relations' and e_type is None: x = [i for i in ent if i in self.node_dict[key].keys()]
-            elif e_type: x = [i for i in ent if e_type[ent.index(i)] != 'class' and i in self.node_dict[key].keys()]
+            if key == 'relations' and e_type is None: x = ent
+            elif e_type: x = [i for i in ent if e_type[ent.index(i)] != 'class']
             else: pass
-            if len(x) > 0:  # add metadata for eligible entities
-                for i in x:
-                    metadata_info = self.node_dict[key][i]
-                    if 'Label' in metadata_info.keys():
-                        if metadata_info['Label'] is not None and 'None' not in metadata_info['Label']:
-                            edges += [(URIRef(i), RDFS.label, Literal(metadata_info['Label']))]
-                    if 'Description' in metadata_info.keys():
-                        if metadata_info['Description'] is not None and 'None' not in metadata_info['Description']:
-                            edges += [(URIRef(i), URIRef(obo + 'IAO_0000115'), Literal(metadata_info['Description']))]
-                    if 'Synonym' in metadata_info.keys():
-                        if metadata_info['Synonym'] is not None and 'None' not in metadata_info['Synonym']:
-                            for syn in metadata_info['Synonym'].split('|'):
-                                edges += [(URIRef(i), URIRef(oboinowl + 'hasSynonym'), Literal(syn))]
-                return edges
+            metadata = [y for y in (self.__entity_metadata(i, key) for i in x) if y is not None]
+            if len(metadata) > 0: return [edge for y in metadata for edge in y]  # add metadata for eligible entities
             else: return None
         else: return None
 
+    def _creates_entity_metadata(self, i: str, key: str) -> Optional[Tuple]:
+        """Creates the label, description, and synonym triples for a single entity. The results are cached by
+        creates_node_metadata, so an entity's triples are only created once no matter how many edges it occurs in.
+
+        Args:
+            i: A string containing a node identifier (e.g. 'http://www.ncbi.nlm.nih.gov/gene/1').
+            key: A string indicating if the key should be 'nodes' or 'relations'.
+
+        Returns:
+            A tuple of tuples containing RDFLib objects used to add metadata to a knowledge graph or None if the entity
+            has no metadata.
+        """
+
+        metadata_info = self.node_dict[key].get(i) if self.node_dict is not None else None
+        if metadata_info is None: return None
+        uri, literal, edges = term_pool.interns_uri, term_pool.interns_literal, []
+        if 'Label' in metadata_info.keys():
+            if metadata_info['Label'] is not None and 'None' not in metadata_info['Label']:
+                edges += [(uri(i), RDFS.label, literal(metadata_info['Label']))]
+        if 'Description' in metadata_info.keys():
+            if metadata_info['Description'] is not None and 'None' not in metadata_info['Description']:
+                edges += [(uri(i), uri(obo + 'IAO_0000115'), literal(metadata_info['Description']))]
+        if 'Synonym' in metadata_info.keys():
+            if metadata_info['Synonym'] is not None and 'None' not in metadata_info['Synonym']:
+                for syn in metadata_info['Synonym'].split('|'):
+                    edges += [(uri(i), uri(oboinowl + 'hasSynonym'), literal(syn))]
+
+        return tuple(edges)
+
     def adds_ontology_annotations(self, filename: str, graph: Graph) -> Graph:
         """Updates the ontology annotation information for an input knowledge graph or ontology.
 
@@ -217,10 +298,15 @@ class Metadata(object):
 
         return graph
 
-    def output_metadata(self, node_integer_map: Dict, graph: Union[Set, Graph]) -> None:
-        """Loops over the self.node_dict dictionary and writes out the data to a file locally. The data is stored as
-        a tab-delimited '.txt' file with four columns: (1) node identifier; (2) node label; (3) node description or
-        definition; and (4) node synonym.
+    def output_metadata(self, node_integer_map: Dict, graph: Union[Set, Graph], chunk_size: int = 100000) -> None:
+        """Writes the metadata of every entity in node_integer_map to a file locally. The data is stored as a
+        tab-delimited '.txt' file with six columns: (1) entity type; (2) integer identifier; (3) node identifier; (4)
+        node label; (5) node description or definition; and (6) node synonym. Entities are written in integer
+        identifier order.
+
+        The node metadata is joined with node_integer_map in one pass over each metadata type (the pkt_kg.utils.
+        NodeMetadataStore is read sequentially), so only the entities that have metadata are held in memory, and the
+        rows are written in blocks of chunk_size lines. Entities in both metadata types are written as "NODES".
 
         NOTE. Not every node in the knowledge class will have metadata. There are some non-ontology nodes that are
         added (e.g. Ensembl transcript identifiers) that at the time of adding did not include labels, synonyms,
@@ -228,8 +314,11 @@ class Metadata(object):
         been available for download and thus would not have been added to the node_dict.
 
         Args:
-            node_integer_map: A dictionary where keys are integers and values are node and relation identifiers.
-            graph: A set of RDFLib Graph object triples or an RDFLib Graph.
+            node_integer_map: A dictionary where keys are node and relation identifiers and values are integers,
+                created from graph (see pkt_kg.utils.maps_ids_to_integers).
+            graph: A set of RDFLib Graph object triples or an RDFLib Graph. The entities of the graph are the keys of
+                node_integer_map, so the graph is not read again.
+            chunk_size: An integer containing the number of lines written at once (default=100000).
 
         Returns:
             None.
@@ -237,26 +326,22 @@ class Metadata(object):
 
         if self.node_dict:
             log_str = 'Writing Class Metadata'; print('\n' + log_str); logger.info(log_str)
-            entities = set([i for j in tqdm(graph) for i in j]); filename = self.full_kg[:-4] + '_NodeLabels.txt'
+            filename, rows = self.full_kg[:-4] + '_NodeLabels.txt', dict()
+            for key in ['relations', 'nodes']:  # nodes are joined last so that they replace any relation rows
+                for entity, meta in self.node_dict[key].items():
+                    nint = node_integer_map.get('<' + entity + '>')
+                    if nint is None: continue
+                    rows[nint] = '\t'.join([key.upper(), str(nint), '<' + entity + '>'] +
+                                           [meta[x] if meta[x] is not None else 'None'
+                                            for x in ['Label', 'Description', 'Synonym']]) + '\n'
             with open(self.write_location + filename, 'w', encoding='utf-8') as out:
                 out.write('entity_type' + '\t' + 'integer_id' + '\t' + 'entity_uri' + '\t' + 'label' + '\t' +
                           'description/definition' + '\t' + 'synonym' + '\n')
-                for x in tqdm(entities):
-                    nid, nint = n3(x), node_integer_map[n3(x)]
-                    if x in self.node_dict['nodes'].keys():
-                        etyp, meta = 'NODES', self.node_dict['nodes'][x]
-                    elif x in self.node_dict['relations'].keys():
-                        etyp, meta = 'RELATIONS', self.node_dict['relations'][x]
-                    else: meta, etyp, lab, dsc, syn = None, 'NA', 'NA', 'NA', 'NA'
-                    if meta is not None:
-                        lab = meta['Label'] if meta['Label'] is not None else 'None'
-                        dsc = meta['Description'] if meta['Description'] is not None else 'None'
-                        syn = meta['Synonym'] if meta['Synonym'] is not None else 'None'
-                    try:
-                        out.write(etyp + '\t' + str(nint) + '\t' + nid + '\t' + lab + '\t' + dsc + '\t' + syn + '\n')
-                    except UnicodeEncodeError:
-                        out.write(etyp.encode('utf-8').decode() + '\t' + str(nint).encode('utf-8').decode() +
-                                  '\t' + nid.encode('utf-8').decode() + '\t' + lab.encode('utf-8').decode() +
-                                  '\t' + dsc.encode('utf-8').decode() + '\t' + syn.encode('utf-8').decode() + '\n')
+                lines: List = []
+                for nid, nint in tqdm(node_integer_map.items()):
+                    row = rows.get(nint)
+                    lines.append(row if row is not None else 'NA\t' + str(nint) + '\t' + nid + '\tNA\tNA\tNA\n')
+                    if len(lines) == chunk_size: out.write(''.join(lines)); lines = []
+                out.write(''.join(lines))
 
         return None
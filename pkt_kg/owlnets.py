@@ -4,6 +4,7 @@
 # import needed libraries
 import glob
 import logging.config
+import multiprocessing
 import networkx  # type: ignore
 import os
 import os.path
@@ -23,6 +24,9 @@ from pkt_kg.utils import *
 obo = Namespace('http://purl.obolibrary.org/obo/')
 pkt = Namespace('https://github.com/callahantiff/PheKnowLator/pkt/')
 pkt_bnode = Namespace('https://github.com/callahantiff/PheKnowLator/pkt/bnode/')
+# term class bit flags (see TermClasses)
+term_excluded, term_support, term_owl, term_entity, term_property, term_object_property, term_hierarchy = \
+    1, 2, 4, 8, 16, 32, 64
 
 # logging
 log_dir, log, log_config = 'builds/logs', 'pkt_build_log.log', glob.glob('**/logging.ini', recursive=True)
@@ -35,11 +39,91 @@ logger = logging.getLogger(__name__)
 logging.config.fileConfig(log_config[0], disable_existing_loggers=False, defaults={'log_file': log_dir + '/' + log})
 
 
+# class decoding state shared with worker processes (see OwlNets.cleans_owl_encoded_classes)
+owl_nets_worker_state: Dict = dict()
+
+
+def initializes_owl_nets_worker(owl_nets: 'OwlNets') -> None:
+    """Stores the OwlNets instance used to decode classes in a worker process. Workers are forked, so the instance's
+    graph is shared with the parent process rather than copied.
+
+    Args:
+        owl_nets: An OwlNets instance.
+
+    Returns:
+        None.
+    """
+
+    owl_nets_worker_state['owl_nets'] = owl_nets
+
+    return None
+
+
+def decodes_owl_classes_in_worker(nodes: List) -> Tuple[Set, List, Dict]:
+    """Decodes a partition of the OWL-NETS node_list inside of a worker process.
+
+    Args:
+        nodes: A list of RDFLib URIRef and BNode objects of owl-encoded classes and axioms.
+
+    Returns:
+        A tuple containing the results of OwlNets.decodes_owl_classes (the set of decoded entities and a list of
+        decoded triples) and a dictionary of the "owl_nets", "complementOf", and "negation" entries that decoding the
+        partition added to owl_nets_dict.
+    """
+
+    owl_nets = owl_nets_worker_state['owl_nets']  # entries are cleared so only those of the partition are returned
+    owl_nets.owl_nets_dict.update({'owl_nets': {'decoded_classes': {}, 'cardinality': {}, 'misc': {}},
+                                   'complementOf': {}, 'negation': {}})
+    cleaned_entities, decoded_triples = owl_nets.decodes_owl_classes(nodes, False)
+    entries = {x: owl_nets.owl_nets_dict[x] for x in ['owl_nets', 'complementOf', 'negation']}
+
+    return cleaned_entities, list(decoded_triples), entries
+
+
 # TODO:
 #  (1) need to verify losslessness with respect to pkt-specific uuids; verify dict keyed with serialized nodes
 #  (2) Method is currently built to handle class axioms; small modifications needed to handle propertyChainAxioms
 
 
+class TermClasses(dict):
+    """A dictionary keyed by RDFLib term with the class of the term as the value, where each term is classified the
+    first time it is looked up. The class of a URIRef is an integer of bit flags:
+        - term_excluded: the term is from a top-level, relation, or support ontology (e.g. obo:BFO_0000001)
+        - term_support: the term is from a support ontology (e.g. obo:IAO_0000115)
+        - term_owl: the term is in the OWL namespace
+        - term_entity: the term is typed as an owl:Class or owl:NamedIndividual and is not a "#" URI
+        - term_property: the term has an rdf:type other than owl:AnnotationProperty
+        - term_object_property: the term is typed as an owl:ObjectProperty
+        - term_hierarchy: the term is rdfs:subClassOf or rdf:type
+    The class of any other term (i.e. BNodes and Literals) is None.
+
+    Attributes:
+        type_flags: A dictionary keyed by URIRef with the flags read from its rdf:type triples as the value.
+        exclude: A tuple of the prefixes (e.g. "BFO_") of the top-level, relation, and support ontology identifiers.
+        support: A tuple of the prefixes of the support ontology identifiers.
+    """
+
+    def __init__(self, type_flags: Dict, exclude: List, support: List) -> None:
+
+        super().__init__()
+        self.type_flags: Dict = type_flags
+        self.exclude: Tuple = tuple(x + '_' for x in exclude)
+        self.support: Tuple = tuple(x + '_' for x in support)
+
+    def __missing__(self, term: Any) -> Optional[int]:
+
+        if not isinstance(term, URIRef): flags = None
+        else:
+            uri = str(term); local_id = uri.split('/')[-1]; flags = self.type_flags.get(term, 0)
+            if local_id.startswith(self.exclude): flags |= term_excluded
+            if local_id.startswith(self.support): flags |= term_support
+            if str(OWL) in uri: flags |= term_owl
+            if RDFS.subClassOf in uri or RDF.type in uri: flags |= term_hierarchy
+        self[term] = flags
+
+        return flags
+
+
 class OwlNets(object):
     """Class removes OWL semantics from an ontology or knowledge graph using the OWL-NETS method. OWL-encoded or
     semantic edges are needed in a graph in order to enable a rich semantic representation. Many of the nodes in
@@ -66,16 +150,19 @@ class OwlNets(object):
         filename: A string containing the filename for the full knowledge graph (e.g. "/hpo_owlnets").
         kg_construct_approach: A string containing the type of construction approach used to build the knowledge graph.
         owl_tools: A string pointing to the location of the owl tools library.
+        workers: An integer specifying the number of processes used to decode owl-encoded classes (default=1).
 
     Raises:
         TypeError: If graph is not an rdflib.graph object.
         ValueError: If graph is an empty rdflib.graph object.
         TypeError: If the file containing owl object properties is not a txt file.
         TypeError: If the file containing owl object properties is empty.
+        ValueError: If workers is not a positive integer.
     """
 
     def __init__(self, graph: Union[Graph, str], write_location: str, filename: str,
-                 kg_construct_approach: Optional[str] = None, owl_tools: str = './pkt_kg/libs/owltools') -> None:
+                 kg_construct_approach: Optional[str] = None, owl_tools: str = './pkt_kg/libs/owltools',
+                 workers: int = 1) -> None:
 
         self.owl_tools = owl_tools
         self.kg_construct_approach = kg_construct_approach
@@ -85,6 +172,11 @@ class OwlNets(object):
         self.top_level_ontologies: List = ['ISO', 'SUMO', 'BFO']  # can only appear as predicates
         self.relations_ontologies: List = ['RO']  # can only appear as predicates
         self.support_ontologies: List = ['IAO', 'SWO', 'OBI', 'UBPROP']  # can never appear in OWL-NETS triples
+        self.telemetry: Dict = {'filename': self.filename}  # details added to build step telemetry records
+        if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+            log_str = 'workers must be a positive integer'; logger.error('ValueError: ' + log_str)
+            raise ValueError(log_str)
+        else: self.workers: int = workers
 
         # VERIFY INPUT GRAPH
         if not isinstance(graph, Graph) and not isinstance(graph, str):
@@ -95,6 +187,7 @@ class OwlNets(object):
         else:
             self.graph = graph if isinstance(graph, Graph) else Graph().parse(graph)
         self.node_list: List = []
+        self.bnode_index: Optional[BNodeIndex] = None
 
         # OWL-NETS CLEANING DICTIONARY
         self.owl_nets_dict: Dict = {'owl_nets': {'decoded_classes': {}, 'cardinality': {}, 'misc': {}},
@@ -135,9 +228,11 @@ class OwlNets(object):
         log_str = 'Post-processing pkt-kg-Namespaced Anonymous Nodes'; print(log_str); logger.info(log_str)
 
         # STEP 1: check for pkt-namespaced bnodes (pkt-added bnodes) and remove them if present
+        # the restriction node (pkt-namespaced bnode) is skipped so the original class is used whatever the triple order
         pred = RDF.type if self.kg_construct_approach == 'instance' else RDFS.subClassOf
         pkt_ns_dict = {x[0]: x[2] for x in list(self.graph.triples((None, pred, None))) if isinstance(x[2], URIRef)
-                       and (str(x[0]).startswith(str(pkt) + 'N') and x[2] not in [OWL.NamedIndividual, OWL.Class])}
+                       and (str(x[0]).startswith(str(pkt) + 'N') and x[2] not in [OWL.NamedIndividual, OWL.Class])
+                       and not str(x[2]).startswith(str(pkt_bnode))}
         if len(pkt_ns_dict) > 0:
             remove_edges: Set = set()  # update triples containing BNodes with original ontology class
             for node in tqdm(pkt_ns_dict.keys()):
@@ -158,6 +253,29 @@ class OwlNets(object):
 
         return None
 
+    def classifies_terms(self, types: bool = True) -> 'TermClasses':
+        """Creates the table used to classify the terms of the graph's triples (see TermClasses), reading the classes
+        that come from rdf:type triples once up front.
+
+        Args:
+            types: A bool indicating whether or not to read the rdf:type triples needed for the term_entity,
+                term_property, and term_object_property flags (default=True).
+
+        Returns:
+            A TermClasses dictionary.
+        """
+
+        type_flags: Dict = dict()
+        for s, o in self.graph.subject_objects(RDF.type) if types else []:
+            if not isinstance(s, URIRef): continue
+            flags = term_entity if (OWL.Class in o or OWL.NamedIndividual in o) and '#' not in s else 0
+            if o != OWL.AnnotationProperty: flags |= term_property
+            if o == OWL.ObjectProperty: flags |= term_object_property
+            type_flags[s] = type_flags.get(s, 0) | flags
+        exclude = self.top_level_ontologies + self.relations_ontologies + self.support_ontologies
+
+        return TermClasses(type_flags, exclude, self.support_ontologies)
+
     def removes_edges_with_owl_semantics(self) -> Graph:
         """Creates a filtered knowledge graph, such that only nodes that are owl:Class/owl:Individual connected via a
         owl:ObjectProperty and not an owl:AnnotationProperty. For example:
@@ -178,46 +296,51 @@ class OwlNets(object):
 
         log_str = 'Filtering Triples'; print(log_str); logger.info(log_str)
 
-        keep_predicates, filtered_triples = set(), set()
-        exclude = self.top_level_ontologies + self.relations_ontologies + self.support_ontologies
+        keep_predicates, filtered_triples = set(), self.owl_nets_dict['filtered_triples']  # filled in place
+        decoded = len(self.owl_nets_dict['owl_nets']['decoded_classes']) > 0
+        term_flags = self.classifies_terms(types=not decoded)  # types are only needed before classes are decoded
         for x in tqdm(self.graph):
-            if isinstance(x[0], URIRef) and isinstance(x[1], URIRef) and isinstance(x[2], URIRef):
-                # handle top-level, relation, and support ontologies (top/rel can only be rel; remove support onts)
-                subj = not any(i for i in exclude if str(x[0]).split('/')[-1].startswith(i + '_'))
-                obj = not any(i for i in exclude if str(x[2]).split('/')[-1].startswith(i + '_'))
-                rel = not any(i for i in self.support_ontologies if str(x[1]).split('/')[-1].startswith(i + '_'))
-                if subj and obj and rel:
-                    if len(self.owl_nets_dict['owl_nets']['decoded_classes']) == 0:
-                        s = [i for i in list(self.graph.triples((x[0], RDF.type, None)))
-                             if (OWL.Class in i[2] or OWL.NamedIndividual in i[2]) and '#' not in str(x[0])]
-                        o = [i for i in list(self.graph.triples((x[2], RDF.type, None)))
-                             if (OWL.Class in i[2] or OWL.NamedIndividual in i[2]) and '#' not in str(x[2])]
-                        p = [i for i in list(self.graph.triples((x[1], RDF.type, None)))
-                             if i[2] != OWL.AnnotationProperty]
-                        if len(s) > 0 and len(o) > 0 and len(p) > 0:
-                            if OWL.ObjectProperty in [x[2] for x in p]: keep_predicates.add(x)
-                            else: filtered_triples |= {x}
-                        if len(s) > 0 and len(o) > 0 and len(p) == 0:
-                            if RDFS.subClassOf in x[1]: keep_predicates.add(x)
-                            elif RDF.type in x[1]: keep_predicates.add(x)
-                            else: filtered_triples |= {x}
-                        elif x[1] == RDFS.subClassOf and str(OWL) not in str(x[2]): keep_predicates.add(x)
-                        else: filtered_triples |= {x}
-                    else:
-                        if str(OWL) not in str(x[0]) and str(OWL) not in str(x[2]): keep_predicates.add(x)
-                        else: filtered_triples |= {x}
-                else: filtered_triples |= {x}
-            else: filtered_triples |= {x}
-
-        filtered_graph = adds_edges_to_graph(Graph(), list(keep_predicates), False)  # create a new graph from filtered
-        self.owl_nets_dict['filtered_triples'] |= filtered_triples
+            s, p, o = term_flags[x[0]], term_flags[x[1]], term_flags[x[2]]  # None if not a URIRef
+            # handle top-level, relation, and support ontologies (top/rel can only be rel; remove support onts)
+            if s is None or p is None or o is None or (s | o) & term_excluded or p & term_support:
+                filtered_triples.add(x)
+            elif not decoded:
+                entities = s & o & term_entity
+                if entities and p & term_property:
+                    if p & term_object_property: keep_predicates.add(x)
+                    else: filtered_triples.add(x)
+                if entities and not p & term_property:
+                    if p & term_hierarchy: keep_predicates.add(x)
+                    else: filtered_triples.add(x)
+                elif x[1] == RDFS.subClassOf and not o & term_owl: keep_predicates.add(x)
+                else: filtered_triples.add(x)
+            elif not (s | o) & term_owl: keep_predicates.add(x)
+            else: filtered_triples.add(x)
+
+        filtered_graph = Graph(store=type(self.graph.store)())  # use the same store backend as the input graph
+        filtered_graph = adds_edges_to_graph(filtered_graph, list(keep_predicates), False)
 
         return filtered_graph
 
+    def indexes_bnodes(self) -> BNodeIndex:
+        """Returns an index of the anonymous structures of the graph (see pkt_kg.utils.BNodeIndex), building it if
+        there is no index or if the index was built from a different graph. The index is built when decoding starts
+        (see cleans_owl_encoded_classes) and is used by recurses_axioms, reconciles_axioms, and reconciles_classes.
+
+        Returns:
+            A BNodeIndex of self.graph.
+        """
+
+        if self.bnode_index is None or self.bnode_index.graph is not self.graph:
+            self.bnode_index = BNodeIndex(self.graph)
+
+        return self.bnode_index
+
     def recurses_axioms(self, visited: List[BNode], axioms: List[Any]) -> List[BNode]:
-        """Function recursively searches a list of graph nodes and tracks the nodes it has visited. Once all nodes in
-        the input axioms list have been visited, a final unique list of relevant nodes is returned. This list is
-        assumed to include all necessary BNodes needed to re-create an OWL:equivalentClass.
+        """Function searches a list of graph nodes and tracks the nodes it has visited. Once all nodes in the input
+        axioms list have been visited, a final unique list of relevant nodes is returned. This list is assumed to
+        include all necessary BNodes needed to re-create an OWL:equivalentClass. The BNodes reachable from the axioms
+        are read from the BNode index (see indexes_bnodes).
 
         Args:
             visited: A list which may or may not contain knowledge graph nodes.
@@ -229,14 +352,9 @@ class OwlNets(object):
             seen_nodes: A list of knowledge graph BNodes.
         """
 
-        search_axioms: List = []; tracked: List = []
+        tracked = [element for axiom in axioms for element in axiom if isinstance(element, BNode)]
 
-        for axiom in axioms:
-            for element in axiom:
-                if isinstance(element, BNode) and element not in visited:
-                    tracked.append(element); search_axioms += list(self.graph.triples((element, None, None)))
-        if len(tracked) > 0: visited += list(set(tracked)); return self.recurses_axioms(visited, search_axioms)
-        else: return visited
+        return visited + self.indexes_bnodes().finds_bnodes(tracked, visited)
 
     def finds_uri(self, n1: Union[BNode, URIRef], n2: Optional[URIRef], node_list: Optional[list] = None) -> URIRef:
         """Method searches for the RDFLib URIRef object that represents a BNode that is either an OWL.annotatedSource or
@@ -278,16 +396,13 @@ class OwlNets(object):
             org_src, src = src, src if isinstance(src, URIRef) else self.finds_uri(src, tgt, None)
             org_tgt, tgt = tgt, tgt if isinstance(tgt, URIRef) else self.finds_uri(tgt, src, None)
             bnodes = [org_src] if isinstance(org_src, BNode) and not isinstance(org_tgt, BNode) else [org_tgt]
-        master, matches = set(), set()
-        while len(bnodes) > 0:
-            x = bnodes.pop(0); master |= {x}; matches |= set(self.graph.triples((x, None, None)))
-            node_list = set([x for y in [i[0::2] for i in matches] for x in y])
-            bnodes += [x for x in node_list if isinstance(x, BNode) and x not in master]
+        matches = set(self.indexes_bnodes().gets_triples(bnodes))
 
         return src, matches
 
     def reconciles_classes(self, node: URIRef) -> Set:
         """Method searches for all triples which are out edges from all BNodes that can be reached from the input node.
+        The anonymous structures hanging off of the node are read from the BNode index (see indexes_bnodes).
 
         Args:
             node: An RDFLib URIRef object.
@@ -297,15 +412,9 @@ class OwlNets(object):
                 type URIRef, BNode, and/or Literal.
         """
 
-        matches: Set = set()
-        out_edges = set(x for y in self.graph.triples((node, None, None)) for x in y if isinstance(x, BNode))
-        node_list = list(out_edges)
-        while len(node_list) != 0:
-            entity = node_list.pop(0)
-            for element in self.recurses_axioms([], list(self.graph.triples((entity, None, None)))):
-                matches |= set(self.graph.triples((element, None, None)))
-            hits = set(x for y in matches for x in y if isinstance(x, BNode) if x not in out_edges)
-            node_list = list(set(node_list) | hits); out_edges |= set(node_list)
+        bnode_index = self.indexes_bnodes()
+        if isinstance(node, BNode): matches = set(bnode_index.gets_triples([node]))
+        else: matches = set(bnode_index.gets_class_triples(node))
 
         return matches
 
@@ -436,7 +545,7 @@ class OwlNets(object):
 
         if ('PATO' in sub and 'PATO' in obj) and not prop: return RDFS.subClassOf
         elif ('PATO' not in sub and 'PATO' not in obj) and not prop: return RDFS.subClassOf
-        elif 'PATO' not in sub and 'PATO' in obj: return URIRef(obo + 'RO_0000086')
+        elif 'PATO' not in sub and 'PATO' in obj: return term_pool.interns_uri(obo + 'RO_0000086')
         else: return prop
 
     @staticmethod
@@ -583,21 +692,21 @@ class OwlNets(object):
                 return cleaned, results[1]
             else: return cleaned, axioms
 
-    def cleans_owl_encoded_classes(self) -> Graph:
-        """Loops over a all owl:Class objects in a graph searching for edges that include owl:equivalentClass
-        nodes (i.e. to find classes assembled using owl constructors) and rdfs:subClassof nodes (i.e. to find
-        owl:restrictions). Once these edges are found, the method loops over the in and out edges of all anonymous nodes
-        in the edges in order to decode the owl-encoded nodes.
+    def decodes_owl_classes(self, nodes: List, progress_bar: bool = True) -> Tuple[Set, Set]:
+        """Decodes a list of owl-encoded classes and axioms. The cardinality, negation, complementOf, misc, and decoded
+        class entries of each node are added to owl_nets_dict. Decoding only reads the graph.
+
+        Args:
+            nodes: A list of RDFLib URIRef and BNode objects of owl-encoded classes and axioms.
+            progress_bar: A boolean indicating whether or not the progress bar should be used.
 
         Returns:
-             An rdflib.Graph object that has been updated to only include triples owl decoded triples.
+            cleaned_entities: A set of the RDFLib objects of the classes and axioms that were decoded.
+            decoded_triples: A set of tuples, where each tuple represents a class that had OWL semantics removed.
         """
 
-        log_str = 'Decoding OWL Classes and Axioms'; print(log_str); logger.info(log_str)
-
-        decoded_graph: Graph = Graph(); cleaned_entities: Set = set(); pbar = tqdm(total=len(self.node_list))
-        while self.node_list:
-            pbar.update(1); node = self.node_list.pop(0)
+        cleaned_entities: Set = set(); decoded_triples: Set = set()
+        for node in (tqdm(nodes) if progress_bar else nodes):
             node_info = self.creates_edge_dictionary(node)
             if node_info is not None and len(node_info[1]) != 0:
                 self.captures_cardinality_axioms(node_info[2], node)
@@ -622,9 +731,46 @@ class OwlNets(object):
                             else:  # catch all other axioms -- only catching owl:onProperty
                                 misc = [x for x in edges.keys() if x not in ['type', 'first', 'rest', 'onProperty']]
                                 edges = None; self.owl_nets_dict['owl_nets']['misc'][n3(node)] = {tuple(misc)}
-                    decoded_graph = adds_edges_to_graph(decoded_graph, list(cleaned_classes), False)
+                    decoded_triples |= cleaned_classes
                     self.owl_nets_dict['owl_nets']['decoded_classes'][n3(node)] = cleaned_classes
-        pbar.close()
+
+        return cleaned_entities, decoded_triples
+
+    def cleans_owl_encoded_classes(self) -> Graph:
+        """Loops over a all owl:Class objects in a graph searching for edges that include owl:equivalentClass
+        nodes (i.e. to find classes assembled using owl constructors) and rdfs:subClassof nodes (i.e. to find
+        owl:restrictions). Once these edges are found, the method loops over the in and out edges of all anonymous nodes
+        in the edges in order to decode the owl-encoded nodes.
+
+        When workers is greater than one and processes can be forked, node_list is split into contiguous partitions
+        which are decoded by a pool of worker processes that share the graph (see decodes_owl_classes). The results of
+        each partition are merged in node_list order, so the decoded graph and owl_nets_dict are the same as when the
+        classes are decoded by a single process.
+
+        Returns:
+             An rdflib.Graph object that has been updated to only include triples owl decoded triples.
+        """
+
+        log_str = 'Decoding OWL Classes and Axioms'; print(log_str); logger.info(log_str)
+
+        decoded_graph: Graph = Graph(store=type(self.graph.store)()); self.indexes_bnodes()  # shared with workers
+        if self.workers > 1 and len(self.node_list) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            log_str = 'Decoding Using {} Worker Processes'.format(self.workers); print(log_str); logger.info(log_str)
+            size = -(-len(self.node_list) // (self.workers * 4))  # several partitions per worker to balance the load
+            partitions = [self.node_list[i:i + size] for i in range(0, len(self.node_list), size)]
+            cleaned_entities: Set = set(); decoded_triples: List = []
+            pool = multiprocessing.get_context('fork').Pool(min(self.workers, len(partitions)),
+                                                            initializes_owl_nets_worker, (self,))
+            for entities, triples, entries in tqdm(pool.imap(decodes_owl_classes_in_worker, partitions),
+                                                   total=len(partitions)):
+                cleaned_entities |= entities; decoded_triples += term_pool.interns_triples(triples)
+                for key in ['decoded_classes', 'cardinality', 'misc']:
+                    self.owl_nets_dict['owl_nets'][key].update(entries['owl_nets'][key])
+                for key in ['complementOf', 'negation']: self.owl_nets_dict[key].update(entries[key])
+            pool.close(); pool.join()
+        else: cleaned_entities, decoded_triples = self.decodes_owl_classes(self.node_list)  # type: ignore
+        self.node_list = []; self.bnode_index = None
+        decoded_graph = adds_edges_to_graph(decoded_graph, decoded_triples, False)
         self.graph = decoded_graph; cleaned_decoded_graph = self.removes_edges_with_owl_semantics()
         str1 = 'Decoded {} owl-encoded classes and axioms. Note the following:\nPartially processed {} cardinality ' \
                'elements\nRemoved {} owl:disjointWith axioms\nIgnored: {} misc classes; {} classes constructed with ' \
@@ -645,6 +791,8 @@ class OwlNets(object):
         checked to ensure that at least one of their ancestor concepts is a subclass of common_ancestor. While this is
         not the best solution long-term is the cleanest way to ensure the graph remains connected and to introduce the
         least amount of extra edges (i.e. avoids having to make every node rdfs:subClassOf BFO_0000001).
+        The ancestors of each node (see pkt_kg.utils.gets_entity_ancestors) are read from an AncestorIndex of the
+        rdfs:subClassOf hierarchy (see pkt_kg.utils.AncestorIndex), so the graph is only queried once per node.
 
         Args:
             graph: An RDFLib Graph object.
@@ -660,18 +808,19 @@ class OwlNets(object):
         if not str(common_ancestor).startswith('http'): raise ValueError('Error: common_ancestor must be a valid URL')
         else:
             anc_node, roots = common_ancestor if isinstance(common_ancestor, URIRef) else URIRef(common_ancestor), set()
+            ancestors = AncestorIndex(graph, RDFS.subClassOf)
             nodes = set([x for x in list(graph.subjects()) + list(graph.objects()) if isinstance(x, URIRef)])
             for x in tqdm(nodes):
-                ancs = gets_entity_ancestors(graph, [x], RDFS.subClassOf)
+                ancs = ancestors.gets_entity_ancestors(x)
                 if len(ancs) == 0:
                     nbhd = set(graph.objects(x, None))
-                    ancs = [x for y in [gets_entity_ancestors(graph, [i], RDFS.subClassOf) for i in nbhd] for x in y]
+                    ancs = [x for y in [ancestors.gets_entity_ancestors(i) for i in nbhd] for x in y]
                     if len(ancs) == 0: ancs = [x]
                     else:
                         try: ancs = [mode(ancs)]
                         except StatisticsError: ancs = sample(ancs, 1) if not any(x for x in ancs if x in roots) else []
                 roots |= {ancs[0]} if len(ancs) > 0 else {x}
-            needed_triples = set((URIRef(x), RDFS.subClassOf, anc_node) for x in roots if x != anc_node)
+            needed_triples = set((term_pool.interns_uri(x), RDFS.subClassOf, anc_node) for x in roots if x != anc_node)
             graph = adds_edges_to_graph(graph, needed_triples)
             print('{} triples added to ensure graph is connected.'.format(len(needed_triples)))
 
@@ -684,6 +833,10 @@ class OwlNets(object):
         instance, all triples where the subject and object are connected by RDFS.subClassOf are updated to RDF.type and
         the subjects of these triples are made RDF.type all ancestors of the objects. Examples are provided below.
 
+        The ancestors of each object are read from an AncestorIndex of the rdfs:subClassOf hierarchy built before any
+        edges are updated (see pkt_kg.utils.AncestorIndex), so the ancestors of classes shared by many edges are only
+        found once.
+
         Returns:
              None.
         """
@@ -692,14 +845,17 @@ class OwlNets(object):
 
         org_rel = RDF.type if self.kg_construct_approach == 'subclass' else RDFS.subClassOf
         pure_rel = RDFS.subClassOf if org_rel == RDF.type else RDF.type
-        dirty_edges = list(self.graph.triples((None, org_rel, None)))
+        ancestors = AncestorIndex(self.graph, RDFS.subClassOf)  # hierarchy before any edges are purified
+        purified = self.owl_nets_dict['{}_approach_purified'.format(self.kg_construct_approach)]
+        dirty_edges = list(self.graph.triples((None, org_rel, None))); obj_ancs: Dict = dict()
         for edge in tqdm(dirty_edges):
-            self.graph.add((edge[0], pure_rel, edge[2])); self.graph.remove(edge)
-            o_ancs = gets_entity_ancestors(self.graph, [edge[2]], RDFS.subClassOf, [edge[2]])
-            ancs_filter = tuple([x for x in o_ancs if x.startswith('http') and URIRef(x) != edge[2]])
-            for node in ancs_filter: self.graph.add((edge[0], pure_rel, URIRef(node)))
-
-            self.owl_nets_dict['{}_approach_purified'.format(self.kg_construct_approach)] |= set(edge + ancs_filter)
+            ancs_filter = obj_ancs.get(edge[2])
+            if ancs_filter is None:
+                ancs_filter = obj_ancs[edge[2]] = tuple(x for x in ancestors.gets_ancestors(edge[2])
+                                                        if x != edge[2] and str(x).startswith('http'))
+            self.graph.remove(edge)
+            for node in (edge[2],) + ancs_filter: self.graph.add((edge[0], pure_rel, node))
+            purified.update(edge + ancs_filter)
 
         return None
 
@@ -727,7 +883,7 @@ class OwlNets(object):
                   else self.filename + f_name_lab][0]
         f_name = '/' + f_name + '_OWLNETS.nt' if not f_name.startswith('/') else f_name + '_OWLNETS.nt'
         # write graph to n-triples file
-        graph.serialize(destination=self.write_location + f_name, format='nt')
+        with NTriplesWriter(self.write_location + f_name, 'w') as writer: writer.writes_triples(graph)
         # write out owl_nets dictionary
         with open(self.write_location + f_name.strip('.nt') + '_decoding_dict.pkl', 'wb') as out:
             pickle.dump(self.owl_nets_dict, out)
@@ -750,38 +906,49 @@ class OwlNets(object):
         log_str = '*** Running OWL-NETS ***'; print('\n' + log_str); logger.info(log_str)
 
         # STEP 1: Remove owl:disjointWith axioms
-        self.removes_disjoint_with_axioms()
+        with records_build_step('owl_nets_disjoint_axioms', len(self.graph), self.telemetry) as record:
+            self.removes_disjoint_with_axioms(); record['output_triples'] = len(self.graph)
 
         # STEP 2: Update pkt-namespaced nodes and pkt-namespaced bnodes
-        self.updates_pkt_namespace_identifiers()
+        with records_build_step('owl_nets_pkt_namespace', len(self.graph), self.telemetry) as record:
+            self.updates_pkt_namespace_identifiers(); record['output_triples'] = len(self.graph)
 
         # STEP 3: Remove semantic support triples
-        filtered_graph = self.removes_edges_with_owl_semantics()
+        with records_build_step('owl_nets_filter_semantics', len(self.graph), self.telemetry) as record:
+            filtered_graph = self.removes_edges_with_owl_semantics(); record['output_triples'] = len(filtered_graph)
 
         # STEP 4: Decode owl-encoded classes and axioms
-        owl_classes = list(gets_ontology_classes(self.graph)); owl_axioms = []
-        for x in set(self.graph.subjects(RDF.type, OWL.Axiom)):
-            src = set(self.graph.objects(list(self.graph.objects(x, OWL.annotatedSource))[0], RDF.type))
-            tgt = set(self.graph.objects(list(self.graph.objects(x, OWL.annotatedTarget))[0], RDF.type))
-            if OWL.Class in src and OWL.Class in tgt: owl_axioms += [x]
-            elif (OWL.Class in src and len(tgt) == 0) or (OWL.Class in tgt and len(src) == 0): owl_axioms += [x]
-            else: pass
-        self.node_list = list(set(owl_classes) | set(owl_axioms))
-        decoded_graph = self.cleans_owl_encoded_classes()
+        with records_build_step('owl_nets_decode_classes', len(self.graph), self.telemetry) as record:
+            owl_classes = list(gets_ontology_classes(self.graph)); owl_axioms = []
+            for x in set(self.graph.subjects(RDF.type, OWL.Axiom)):
+                src = set(self.graph.objects(list(self.graph.objects(x, OWL.annotatedSource))[0], RDF.type))
+                tgt = set(self.graph.objects(list(self.graph.objects(x, OWL.annotatedTarget))[0], RDF.type))
+                if OWL.Class in src and OWL.Class in tgt: owl_axioms += [x]
+                elif (OWL.Class in src and len(tgt) == 0) or (OWL.Class in tgt and len(src) == 0): owl_axioms += [x]
+                else: pass
+            self.node_list = list(set(owl_classes) | set(owl_axioms)); record['classes'] = len(self.node_list)
+            decoded_graph = self.cleans_owl_encoded_classes(); record['output_triples'] = len(decoded_graph)
 
         # STEP 5: Ensure graph is connected
-        self.graph = self.makes_graph_connected(filtered_graph + decoded_graph)
+        with records_build_step('owl_nets_connect_graph', len(filtered_graph) + len(decoded_graph),
+                                self.telemetry) as record:
+            self.graph = self.makes_graph_connected(filtered_graph + decoded_graph)
+            record['output_triples'] = len(self.graph)
 
         # STEP 6: Post-process OWL-NETS output
         log_str = 'Processing OWL-NETS Graph Output'; print(log_str); logger.info(log_str)
         if self.kg_construct_approach is not None:
             stat = 'OWL-NETS {}'.format(derives_graph_statistics(self.graph)); print(stat); logger.info(stat)
-            self.write_out_results(self.graph); org_graph_triples = set(self.graph)
+            with records_build_step('owl_nets_write_output', len(self.graph), self.telemetry):
+                self.write_out_results(self.graph); org_graph_triples = set(self.graph)
             log_str = '{} Purification'.format(self.kg_construct_approach.title()); print(log_str); logger.info(log_str)
-            self.purifies_graph_build()
+            with records_build_step('owl_nets_purify_graph', len(self.graph), self.telemetry) as record:
+                self.purifies_graph_build(); record['output_triples'] = len(self.graph)
             stat = 'Purified OWL-NETS {}'.format(derives_graph_statistics(self.graph)); print(stat); logger.info(stat)
-            self.write_out_results(self.graph, self.kg_construct_approach)
+            with records_build_step('owl_nets_write_output', len(self.graph), self.telemetry):
+                self.write_out_results(self.graph, self.kg_construct_approach)
             return org_graph_triples, set(self.graph)
         else:
-            self.write_out_results(self.graph)
+            with records_build_step('owl_nets_write_output', len(self.graph), self.telemetry):
+                self.write_out_results(self.graph)
             return set(self.graph), None
@@ -2,8 +2,18 @@
 # -*- coding: utf-8 -*-
 
 
+from .ancestor_index import *
+from .bnode_index import *
 from .data_utils import *
+from .fingerprint_set import *
+from .graph_statistics import *
 from .kg_utils import *
+from .metadata_store import *
+from .ntriples_writer import *
+from .subclass_map import *
+from .telemetry import *
+from .term_pool import *
+from .triple_store import *
 
 
 __all__ = ['url_download', 'ftp_url_download', 'gzipped_ftp_url_download', 'zipped_url_download',
@@ -14,4 +24,10 @@ __all__ = ['url_download', 'ftp_url_download', 'gzipped_ftp_url_download', 'zipp
            'ontology_file_formatter', 'adds_edges_to_graph', 'remove_edges_from_graph', 'gets_entity_ancestors',
            'connected_components', 'removes_self_loops', 'derives_graph_statistics', 'splits_knowledge_graph',
            'adds_namespace_to_bnodes', 'removes_namespace_from_bnodes', 'finds_node_type', 'updates_graph_namespace',
-           'maps_ids_to_integers', 'n3', 'appends_to_existing_file', 'convert_to_networkx']
+           'maps_ids_to_integers', 'n3', 'appends_to_existing_file', 'convert_to_networkx',
+           'fingerprints_files', 'EntityRegistry', 'writes_graph_cache', 'loads_cached_graph', 'IntegerStore',
+           'gets_resource_usage', 'writes_telemetry_record', 'records_build_step',
+           'HyperLogLog', 'GraphStatistics', 'writes_subclass_map_index', 'SubclassMapIndex',
+           'loads_subclass_map_index', 'TermPool', 'term_pool',
+           'FingerprintSet', 'NodeMetadataStore', 'NodeMetadataTable', 'loads_node_metadata_store',
+           'NTriplesWriter', 'BNodeIndex', 'AncestorIndex']
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Ontology Hierarchy Ancestor Index.
+
+Indexes the Ancestors of Graph Nodes
+* AncestorIndex
+"""
+
+# import needed libraries
+from array import array
+from rdflib import Graph, Namespace, URIRef  # type: ignore
+from rdflib.namespace import RDFS  # type: ignore
+from rdflib.term import Node  # type: ignore
+from typing import Dict, List, Optional, Union
+
+# set-up environment variables
+obo = Namespace('http://purl.obolibrary.org/obo/')
+
+
+class AncestorIndex(object):
+    """An index of the hierarchy formed by a relation (rdfs:subClassOf by default) in a graph, built in a single pass
+    over the graph's triples. Each node in the hierarchy is given an integer identifier and the parents of each node
+    are stored as a compact array of integer identifiers, so the hierarchy can be walked without querying the graph.
+
+    The nodes are grouped into cycles in one pass over the hierarchy (see finds_components), and the ancestors of a
+    node are computed from the stored ancestors of its parents, so each part of the hierarchy is only expanded once no
+    matter how many nodes share it (see finds_ancestors), where self-loops are ignored. The ancestor list returned by
+    pkt_kg.utils.gets_entity_ancestors, which keeps one ancestor for each level of the hierarchy, is reproduced from
+    the index by gets_entity_ancestors. That list depends on every level above a node, so it can only be built from a
+    parent's list when the node has a single parent outside of any cycle; the hierarchy above nodes with several
+    parents is walked again for each of them.
+
+    The index is a snapshot of the graph it was built from, so it needs to be rebuilt after the hierarchy changes.
+
+    Attributes:
+        rel: An RDFLib URIRef containing the relation that links a node to its parents.
+        nodes: A list where the item at each integer identifier is the node it identifies.
+        ids: A dictionary keyed by node with its integer identifier as the value.
+        parents: A list where the item at each integer identifier is an array of the identifiers of the node's parents,
+            in the order they are returned by graph.objects.
+        components: An array where the item at each integer identifier is the identifier of the node's component.
+            None until the components are first needed.
+        members: A list where the item at each component identifier is an array of the component's members.
+        ancestors: A dictionary keyed by component identifier with a sorted array of the identifiers of the
+            component's ancestors as the value. Ancestors are stored when they are first requested.
+        entity_ancestors: A dictionary keyed by integer identifier with the node's list of ancestors from
+            gets_entity_ancestors as the value. Lists are stored when they are first requested.
+    """
+
+    def __init__(self, graph: Graph, rel: Union[URIRef, str] = RDFS.subClassOf) -> None:
+
+        self.rel: URIRef = rel if isinstance(rel, URIRef) else URIRef(rel)
+        self.nodes: List[Node] = []
+        self.ids: Dict[Node, int] = dict()
+        self.parents: List[array] = []
+        self.components: Optional[array] = None
+        self.members: List[array] = []
+        self.ancestors: Dict[int, array] = dict()
+        self.entity_ancestors: Dict[int, List[str]] = dict()
+        self.indexes_graph(graph)
+
+    def __len__(self) -> int:
+
+        return len(self.nodes)
+
+    def gets_id(self, node: Node) -> int:
+        """Returns the integer identifier of a node, adding the node to the index if it is not in it.
+
+        Args:
+            node: An RDFLib URIRef.
+
+        Returns:
+            An integer identifier.
+        """
+
+        idx = self.ids.get(node)
+        if idx is None:
+            idx = self.ids[node] = len(self.nodes); self.nodes.append(node); self.parents.append(array('i'))
+
+        return idx
+
+    def indexes_graph(self, graph: Graph) -> None:
+        """Reads the triples of a graph that use rel and stores the parents of each node, keeping the order that
+        graph.objects returns them in (which gets_entity_ancestors depends on).
+
+        Args:
+            graph: An RDFLib Graph object.
+
+        Returns:
+            None.
+        """
+
+        for s in dict.fromkeys(graph.subjects(self.rel, None)):
+            idx = self.gets_id(s); self.parents[idx].extend(self.gets_id(o) for o in graph.objects(s, self.rel))
+
+        return None
+
+    def finds_components(self) -> None:
+        """Groups the nodes of the hierarchy into strongly connected components (i.e. cycles, or single nodes) with an
+        iterative version of Tarjan's algorithm, which visits each node and edge once. A component is completed after
+        all of its ancestors, so components are numbered in topological order (ancestors first).
+
+        Returns:
+            None.
+        """
+
+        n = len(self.nodes); order, low = array('i', [-1]) * n, array('i', [0]) * n; on_stack = bytearray(n)
+        components = array('i', [0]) * n
+        stack: List = []; count = 0
+        for start in range(n):
+            if order[start] != -1: continue
+            order[start] = low[start] = count; count += 1; stack.append(start); on_stack[start] = 1; work = [[start, 0]]
+            while work:
+                node, i = work[-1]; parents = self.parents[node]
+                if i < len(parents):
+                    work[-1][1] += 1; parent = parents[i]
+                    if order[parent] == -1:
+                        order[parent] = low[parent] = count; count += 1; stack.append(parent); on_stack[parent] = 1
+                        work.append([parent, 0])
+                    elif on_stack[parent]: low[node] = min(low[node], order[parent])
+                    continue
+                work.pop()
+                if work: low[work[-1][0]] = min(low[work[-1][0]], low[node])
+                if low[node] != order[node]: continue
+                component = [stack.pop()]  # members of the completed component are above node
+                while component[-1] != node: component.append(stack.pop())
+                members = array('i', reversed(component)); self.members.append(members)
+                for x in members: on_stack[x] = 0; components[x] = len(self.members) - 1
+        self.components = components
+
+        return None
+
+    def finds_ancestors(self, component: int) -> array:
+        """Returns the ancestors of the nodes in a component, computing them once from the ancestors of the
+        component's parents and storing them for later calls. The ancestors of a cycle include its members.
+
+        Args:
+            component: An integer containing the identifier of a component (see finds_components).
+
+        Returns:
+            A sorted array of the integer identifiers of the ancestors.
+        """
+
+        if self.components is None: self.finds_components()
+        stack = [component]
+        while stack:
+            current = stack[-1]
+            if current in self.ancestors: stack.pop(); continue
+            members = self.members[current]; cycle = set(members)
+            parents = [x for y in members for x in self.parents[y] if x not in cycle]
+            missing = [self.components[x] for x in parents if self.components[x] not in self.ancestors]  # type: ignore
+            if len(missing) > 0: stack += missing; continue
+            ancestors = (cycle if len(members) > 1 else set()) | set(parents)
+            for x in set(self.components[x] for x in parents): ancestors.update(self.ancestors[x])  # type: ignore
+            self.ancestors[current] = array('i', sorted(ancestors)); stack.pop()
+
+        return self.ancestors[component]
+
+    def gets_ancestors(self, node: Node) -> List[Node]:
+        """Returns all ancestors of a node (see finds_ancestors).
+
+        Args:
+            node: An RDFLib URIRef.
+
+        Returns:
+            A list of RDFLib URIRefs. The list is empty if the node has no parents.
+        """
+
+        idx = self.ids.get(node)
+        if idx is None: return []
+        if self.components is None: self.finds_components()
+
+        return [self.nodes[x] for x in self.finds_ancestors(self.components[idx])]  # type: ignore
+
+    def gets_entity_ancestors(self, node: Union[Node, str]) -> List[str]:
+        """Returns the same list of ancestors as pkt_kg.utils.gets_entity_ancestors(graph, [node], rel), walking the
+        index instead of querying the graph. The hierarchy is searched one level at a time and the first new ancestor
+        found at each level is kept, so the first item of the list is the first new ancestor at the deepest level.
+        Unlike gets_ancestors, self-loops are followed, so a node that is only a subclass of itself is its own
+        ancestor. As in gets_entity_ancestors, nodes that are not URIRefs are read as OBO identifiers.
+
+        The levels above a node with a single parent that is not part of a cycle are the levels above its parent, so
+        the list of such a node is its parent's list followed by the parent, and chains of these nodes share the lists
+        of their ancestors. The hierarchy above any other node is walked level by level.
+
+        Args:
+            node: An RDFLib URIRef or string.
+
+        Returns:
+            An ordered (desc; root to leaf) list of strings containing the node's ancestors. The list is empty if the
+            node has no parents.
+        """
+
+        idx = self.ids.get(node if isinstance(node, URIRef) else URIRef(obo + str(node)))
+        if idx is None: return []
+        if self.components is None: self.finds_components()
+        chain: List[int] = []; current = idx  # nodes whose list is built from the list of their only parent
+        while current not in self.entity_ancestors:
+            parents = self.parents[current]
+            if len(parents) != 1 or parents[0] in self.parents[parents[0]]: break
+            if len(self.members[self.components[parents[0]]]) > 1: break  # type: ignore
+            chain.append(current); current = parents[0]
+        if current not in self.entity_ancestors:
+            cls_lst: List[int] = []; found, uris = set(), [current]
+            while True:
+                uris = [x for x in dict.fromkeys(x for y in uris for x in self.parents[y]) if x not in found]
+                if len(uris) == 0: break
+                cls_lst.insert(0, uris[0]); found.add(uris[0])
+            self.entity_ancestors[current] = [str(self.nodes[x]) for x in cls_lst]
+        for x in reversed(chain):
+            parent = self.parents[x][0]
+            self.entity_ancestors[x] = self.entity_ancestors[parent] + [str(self.nodes[parent])]
+
+        return self.entity_ancestors[idx]
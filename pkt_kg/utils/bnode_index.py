@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Anonymous Node Index.
+
+Indexes the Anonymous Structures of a Graph
+* BNodeIndex
+"""
+
+# import needed libraries
+from collections import deque
+from rdflib import BNode, Graph  # type: ignore
+from rdflib.term import Node  # type: ignore
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+
+class BNodeIndex(object):
+    """An index of the anonymous (BNode) structures of a graph, built in a single pass over its triples. Anonymous
+    structures (e.g. owl:Restrictions, owl:unionOf lists, and owl:Axioms) are groups of BNodes linked by triples whose
+    subject and object are both BNodes. The index groups every BNode into its connected component and stores the out
+    edges of each BNode, the triples which link a named node (URIRef) to a BNode, and the BNodes each named node links
+    to. The structure hanging off a class can then be read in time proportional to its size, without querying the
+    graph again.
+
+    Most structures have a single root BNode (a BNode without BNode parents) from which every BNode in the component
+    can be reached. For these components the triples of the whole component are returned when the root is requested.
+    Otherwise, the BNodes reachable from the requested BNodes are found by traversing the indexed out edges.
+
+    The index is a snapshot of the graph it was built from, so it needs to be rebuilt after the graph changes.
+
+    Attributes:
+        graph: The RDFLib Graph (or iterable of triples) the index was built from.
+        out_edges: A dictionary keyed by BNode with the list of triples that have the BNode as subject as the value.
+        in_edges: A dictionary keyed by BNode with the list of triples that link a named node to the BNode as the value.
+        named_bnodes: A dictionary keyed by named node with the list of BNodes it is linked to as the value.
+        components: A dictionary keyed by BNode with the integer identifier of its component as the value.
+        members: A list where the item at each component identifier is the list of the component's BNodes.
+        roots: A list where the item at each component identifier is the component's root BNode, or None if the
+            component does not have a single root from which all of its BNodes can be reached.
+    """
+
+    def __init__(self, graph: Union[Graph, Iterable[Tuple]]) -> None:
+
+        self.graph: Union[Graph, Iterable[Tuple]] = graph
+        self.out_edges: Dict[BNode, List[Tuple]] = dict()
+        self.in_edges: Dict[BNode, List[Tuple]] = dict()
+        self.named_bnodes: Dict[Node, List[BNode]] = dict()
+        self.components: Dict[BNode, int] = dict()
+        self.members: List[List[BNode]] = []
+        self.roots: List[Optional[BNode]] = []
+        self.indexes_graph(graph)
+
+    def indexes_graph(self, graph: Union[Graph, Iterable[Tuple]]) -> None:
+        """Reads the triples of a graph once, grouping BNodes into components with a union-find structure, and then
+        finds the root of each component.
+
+        Args:
+            graph: An RDFLib Graph or an iterable of (subject, predicate, object) tuples.
+
+        Returns:
+            None.
+        """
+
+        parent: Dict[BNode, BNode] = dict(); children: Set = set()
+
+        def finds(x: BNode) -> BNode:
+            root = parent.setdefault(x, x)
+            while parent[root] != root: root = parent[root]
+            while parent[x] != root: parent[x], x = root, parent[x]  # path compression
+            return root
+
+        for triple in graph:
+            s, o = triple[0], triple[2]
+            if isinstance(s, BNode):
+                self.out_edges.setdefault(s, []).append(triple); s_root = finds(s)
+                if isinstance(o, BNode) and o != s:
+                    children.add(o); o_root = finds(o)
+                    if o_root != s_root: parent[o_root] = s_root
+            elif isinstance(o, BNode):
+                self.in_edges.setdefault(o, []).append(triple); self.named_bnodes.setdefault(s, []).append(o)
+                finds(o)
+        component_ids: Dict[BNode, int] = dict()
+        for x in parent:
+            component = component_ids.setdefault(finds(x), len(component_ids))
+            if component == len(self.members): self.members.append([])
+            self.members[component].append(x); self.components[x] = component
+        for component, members in enumerate(self.members):
+            roots = [x for x in members if x not in children]
+            if len(roots) == 1 and len(self.finds_bnodes(roots, use_roots=False)) == len(members): root = roots[0]
+            else: root = None
+            self.roots.append(root)
+
+        return None
+
+    def finds_bnodes(self, bnodes: Iterable[BNode], visited: Optional[Iterable[BNode]] = None,
+                     use_roots: bool = True) -> List[BNode]:
+        """Finds the BNodes that can be reached from a list of BNodes by following out edges, including the input
+        BNodes. BNodes in visited are not returned or traversed.
+
+        Args:
+            bnodes: An iterable of RDFLib BNodes.
+            visited: An iterable of RDFLib BNodes which should not be traversed (default=None).
+            use_roots: A bool indicating whether or not to return the members of a component whose root is requested
+                without traversing it (default=True).
+
+        Returns:
+            A list of RDFLib BNodes, in the order they were reached.
+        """
+
+        seen: Set = set(visited or []); found: List = []; queue: deque = deque()
+        use_roots = use_roots and visited is None  # a component can only be returned whole if none of it is excluded
+        for x in bnodes:
+            if x in seen: continue
+            component = self.components.get(x)
+            if use_roots and component is not None and self.roots[component] == x:
+                members = [y for y in self.members[component] if y not in seen]; found += members; seen.update(members)
+            else: seen.add(x); found.append(x); queue.append(x)
+        while queue:
+            for triple in self.out_edges.get(queue.popleft(), []):
+                if isinstance(triple[2], BNode) and triple[2] not in seen:
+                    seen.add(triple[2]); found.append(triple[2]); queue.append(triple[2])
+
+        return found
+
+    def gets_triples(self, bnodes: Iterable[BNode], visited: Optional[Iterable[BNode]] = None) -> List[Tuple]:
+        """Returns the out edges of all of the BNodes that can be reached from a list of BNodes (see finds_bnodes).
+
+        Args:
+            bnodes: An iterable of RDFLib BNodes.
+            visited: An iterable of RDFLib BNodes which should not be traversed (default=None).
+
+        Returns:
+            A list of triples.
+        """
+
+        return [triple for x in self.finds_bnodes(bnodes, visited) for triple in self.out_edges.get(x, [])]
+
+    def gets_class_triples(self, node: Node) -> List[Tuple]:
+        """Returns the out edges of all of the BNodes that can be reached from the BNodes a named node is linked to
+        (i.e. the anonymous structures hanging off of a class).
+
+        Args:
+            node: An RDFLib URIRef.
+
+        Returns:
+            A list of triples.
+        """
+
+        return self.gets_triples(self.named_bnodes.get(node, []))
+
+    def gets_component_triples(self, bnodes: Iterable[BNode]) -> Set[Tuple]:
+        """Returns all triples of the connected components of a list of BNodes, including the triples that link named
+        nodes to the components.
+
+        Args:
+            bnodes: An iterable of RDFLib BNodes.
+
+        Returns:
+            A set of triples.
+        """
+
+        triples: Set = set()
+        for component in set(self.components[x] for x in bnodes if x in self.components):
+            for x in self.members[component]:
+                triples.update(self.out_edges.get(x, [])); triples.update(self.in_edges.get(x, []))
+
+        return triples
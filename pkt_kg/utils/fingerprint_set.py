@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Build Bookkeeping.
+
+Tracks Items by Fingerprint
+* FingerprintSet
+"""
+
+# import needed libraries
+import numpy as np  # type: ignore
+
+from typing import Any, Iterable, List, Optional
+
+
+class FingerprintSet(object):
+    """A set that stores a 64-bit fingerprint (Python's built-in hash) of each item added to it, rather than the item
+    itself, in a sorted numpy array. This uses 8 bytes per item, compared to the set entry, tuple, and reference
+    overhead of storing triples in a Python set, and is meant for bookkeeping during builds (e.g. checking whether a
+    triple has already been written, or counting distinct nodes). Items are added in batches. Because fingerprints are
+    built with the built-in hash, they can only be compared within a single process (and the worker processes forked
+    from it), and two different items share a fingerprint with a probability of about n^2 / 2^65 for n items.
+
+    Attributes:
+        fingerprints: A sorted numpy array of unique int64 fingerprints.
+    """
+
+    def __init__(self, items: Optional[Iterable] = None) -> None:
+
+        self.fingerprints: np.ndarray = np.empty(0, dtype=np.int64)
+        if items is not None: self.updates_set(items)
+
+    @staticmethod
+    def fingerprints_items(items: Iterable) -> np.ndarray:
+        """Returns a numpy array containing the int64 fingerprint of each item in an iterable of hashable items."""
+
+        return np.fromiter((hash(x) for x in items), dtype=np.int64)
+
+    def finds_fingerprints(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Returns a boolean numpy array indicating which of an array of fingerprints are in the set."""
+
+        idx = np.searchsorted(self.fingerprints, fingerprints)
+        found = idx < len(self.fingerprints); found[found] = self.fingerprints[idx[found]] == fingerprints[found]
+
+        return found
+
+    def updates_set(self, items: Iterable) -> List:
+        """Adds a batch of items to the set.
+
+        Args:
+            items: An iterable of hashable items (e.g. triples of RDFLib terms).
+
+        Returns:
+            A list of the items that were not already in the set, in their original order (an item repeated within
+            the batch is only returned the first time it occurs).
+        """
+
+        items = items if isinstance(items, list) else list(items); fingerprints = self.fingerprints_items(items)
+        _, first = np.unique(fingerprints, return_index=True); first.sort()  # first occurrence of each fingerprint
+        new = first[~self.finds_fingerprints(fingerprints[first])]
+        if len(new) > 0:  # merge the new fingerprints into the sorted array
+            values = np.sort(fingerprints[new])
+            self.fingerprints = np.insert(self.fingerprints, np.searchsorted(self.fingerprints, values), values)
+
+        return [items[x] for x in new.tolist()]
+
+    def __contains__(self, item: Any) -> bool:
+
+        return bool(self.finds_fingerprints(self.fingerprints_items([item]))[0])
+
+    def __len__(self) -> int:
+
+        return len(self.fingerprints)
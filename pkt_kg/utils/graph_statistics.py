@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Statistics.
+
+Counts Distinct Terms
+* HyperLogLog
+
+Accumulates Graph Statistics
+* GraphStatistics
+"""
+
+# import needed libraries
+import heapq
+import math
+
+from collections import Counter  # type: ignore
+from operator import itemgetter
+from rdflib.namespace import OWL, RDF  # type: ignore
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+
+class HyperLogLog(object):
+    """A HyperLogLog sketch that estimates the number of distinct items added to it using a fixed amount of memory
+    (2 ** precision bytes), rather than keeping every item in a set. With the default precision the standard error of
+    the estimate is about 0.8%. Items are hashed with Python's built-in hash, so the sketch only counts items added
+    within a single process.
+
+    Attributes:
+        precision: An integer containing the number of hash bits used to select a register.
+        registers: A bytearray containing the maximum rank seen by each register.
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+
+        self.precision: int = precision
+        self.registers: bytearray = bytearray(1 << precision)
+
+    def adds_item(self, item: Any) -> None:
+        """Adds an item to the sketch.
+
+        Args:
+            item: A hashable object (e.g. an RDFLib URIRef).
+
+        Returns:
+            None.
+        """
+
+        x = hash(item) & 0xFFFFFFFFFFFFFFFF  # mix the bits of the hash (splitmix64 finalizer)
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF; x ^= x >> 31
+        bits = 64 - self.precision; idx, rank = x >> bits, bits - (x & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[idx]: self.registers[idx] = rank
+
+        return None
+
+    def estimates_count(self) -> int:
+        """Estimates the number of distinct items added to the sketch.
+
+        Returns:
+            An integer containing the estimated number of distinct items.
+        """
+
+        m = len(self.registers); zeros = self.registers.count(0)
+        estimate = (0.7213 / (1 + 1.079 / m)) * m * m / sum(2.0 ** -x for x in self.registers)
+        if estimate <= 2.5 * m and zeros > 0: estimate = m * math.log(m / zeros)  # small range correction
+
+        return int(round(estimate))
+
+
+class GraphStatistics(object):
+    """Accumulates knowledge graph statistics in a single pass over a stream of triples. The statistics are kept in
+    one of two modes:
+        - counts (default): the number of triples, the distinct nodes and predicates, and the distinct nodes typed
+          as owl:Class, owl:NamedIndividual, owl:ObjectProperty, or owl:AnnotationProperty. When approximate is True,
+          distinct counts are estimated with HyperLogLog sketches instead of sets.
+        - components: the number of edges, self-loops, the number of edges per predicate, node degrees, and the
+          connected components. Each node is assigned an integer identifier, degrees are kept in a list indexed by
+          these identifiers, and components are merged as edges are added with a union-find.
+
+    Attributes:
+        approximate: A bool indicating whether or not distinct counts are estimated.
+        components: A bool indicating whether or not node degrees and connected components are kept.
+        triples: An integer containing the number of triples added.
+        self_loops: An integer containing the number of triples whose subject and object are the same node.
+        predicates: A Counter containing the number of triples for each predicate.
+    """
+
+    node_types = {OWL.Class: 'classes', OWL.NamedIndividual: 'individuals', OWL.ObjectProperty: 'object_properties',
+                  OWL.AnnotationProperty: 'annotation_properties'}
+
+    def __init__(self, components: bool = False, approximate: bool = False) -> None:
+
+        self.approximate: bool = approximate
+        self.components: bool = components
+        self.triples: int = 0
+        self.self_loops: int = 0
+        self.predicates: Counter = Counter()
+        self.distinct: Dict[str, Union[set, HyperLogLog]] = {x: HyperLogLog() if approximate else set()
+                                                            for x in ['nodes'] + list(self.node_types.values())}
+        # components mode
+        self.node_ids: Dict = dict()
+        self.nodes: List = []
+        self.degrees: List[int] = []
+        self.parents: List[int] = []
+        self.sizes: List[int] = []
+
+    def encodes_node(self, node: Any) -> int:
+        """Returns the integer identifier for a node, adding the node as its own component if it is new.
+
+        Args:
+            node: A node (e.g. an RDFLib URIRef).
+
+        Returns:
+            An integer identifier.
+        """
+
+        node_id = self.node_ids.get(node)
+        if node_id is None:
+            node_id = len(self.nodes); self.node_ids[node] = node_id; self.nodes.append(node)
+            self.degrees.append(0); self.parents.append(node_id); self.sizes.append(1)
+
+        return node_id
+
+    def finds_root(self, node_id: int) -> int:
+        """Returns the identifier of the node representing a node's component (union-find with path halving)."""
+
+        parents = self.parents
+        while parents[node_id] != node_id:
+            parents[node_id] = parents[parents[node_id]]; node_id = parents[node_id]
+
+        return node_id
+
+    def updates_statistics(self, triples: Iterable[Tuple]) -> None:
+        """Adds a stream of triples to the statistics.
+
+        Args:
+            triples: An iterable of (subject, predicate, object) tuples.
+
+        Returns:
+            None.
+        """
+
+        if self.components:
+            encode, find = self.encodes_node, self.finds_root
+            degrees, sizes, parents = self.degrees, self.sizes, self.parents
+            for s, p, o in triples:
+                self.triples += 1; self.predicates[p] += 1
+                s_id, o_id = encode(s), encode(o); degrees[s_id] += 1; degrees[o_id] += 1
+                if s_id == o_id: self.self_loops += 1; continue
+                s_root, o_root = find(s_id), find(o_id)
+                if s_root != o_root:  # union by size
+                    if sizes[s_root] < sizes[o_root]: s_root, o_root = o_root, s_root
+                    parents[o_root] = s_root; sizes[s_root] += sizes[o_root]
+        else:
+            # the counters are all sets or all HyperLogLogs, so one unbound method adds to any of them
+            add: Callable[..., Any] = HyperLogLog.adds_item if self.approximate else set.add
+            nodes = self.distinct['nodes']
+            types = {k: self.distinct[v] for k, v in self.node_types.items()}
+            for s, p, o in triples:
+                self.triples += 1; self.predicates[p] += 1; add(nodes, s); add(nodes, o)
+                if p == RDF.type and o in types: add(types[o], s)
+
+        return None
+
+    def counts_distinct(self, key: str) -> int:
+        """Returns the (estimated) number of distinct nodes ("nodes") or typed nodes (e.g. "classes")."""
+
+        counter = self.distinct[key]
+
+        return counter.estimates_count() if isinstance(counter, HyperLogLog) else len(counter)
+
+    def gets_top_predicates(self, k: int) -> List[Tuple]:
+        """Returns a list of the k predicates with the most triples as (predicate, count) tuples."""
+
+        return heapq.nlargest(k, self.predicates.items(), key=itemgetter(1))
+
+    def gets_top_degree_nodes(self, k: int) -> List[Tuple]:
+        """Returns a list of the k nodes with the highest degree as (node, degree) tuples (components mode)."""
+
+        degrees = self.degrees
+
+        return [(self.nodes[x], degrees[x]) for x in heapq.nlargest(k, range(len(degrees)), key=degrees.__getitem__)]
+
+    def gets_components(self, max_members: Optional[int] = 50) -> List[Tuple]:
+        """Returns the connected components, ordered from largest to smallest (components mode).
+
+        Args:
+            max_members: An integer; the nodes are only returned for components with fewer nodes than this
+                (default=50). If None, the nodes of every component are returned.
+
+        Returns:
+            A list of tuples, each containing the number of nodes in a component and a list of its nodes (or None).
+        """
+
+        roots = [self.finds_root(x) for x in range(len(self.nodes))]; members: Dict = dict()
+        for root in dict.fromkeys(roots):
+            members[root] = [] if max_members is None or self.sizes[root] < max_members else None
+        for node_id, root in enumerate(roots):
+            if members[root] is not None: members[root].append(self.nodes[node_id])
+
+        return sorted([(self.sizes[x], members[x]) for x in members], key=itemgetter(0), reverse=True)
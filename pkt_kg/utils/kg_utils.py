@@ -25,6 +25,8 @@ Interacts with Knowledge Graphs
 * adds_namespace_to_bnodes
 * removes_namespace_from_bnodes
 * splits_knowledge_graph
+* writes_graph_cache
+* loads_cached_graph
 
 Writes Triple Lists
 * maps_ids_to_integers
@@ -33,18 +35,26 @@ Writes Triple Lists
 
 File Type Conversion
 * convert_to_networkx
+
+Fingerprints Build Inputs
+* fingerprints_files
+
+Tracks Knowledge Graph Entities
+* EntityRegistry
 """
 
 # import needed libraries
 import glob
 import hashlib
 import json
+import logging
 import networkx as nx  # type: ignore
+import numpy as np  # type: ignore
 import os
 import os.path
+import pickle
 import random
 
-from collections import Counter  # type: ignore
 from more_itertools import unique_everseen  # type: ignore
 from rdflib import BNode, Graph, Literal, Namespace, URIRef  # type: ignore
 from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
@@ -52,13 +62,21 @@ from rdflib.plugins.serializers.nt import _quoteLiteral  # type: ignore
 import subprocess
 
 from tqdm import tqdm  # type: ignore
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pkt_kg.utils.graph_statistics import GraphStatistics
+from pkt_kg.utils.ntriples_writer import NTriplesWriter
+from pkt_kg.utils.triple_store import IntegerStore
+
+# logging
+logger = logging.getLogger(__name__)
 
 # set-up environment variables
 obo = Namespace('http://purl.obolibrary.org/obo/')
 oboinowl = Namespace('http://www.geneontology.org/formats/oboInOwl#')
 schema = Namespace('http://www.w3.org/2001/XMLSchema#')
 pkt_bnode = Namespace('https://github.com/callahantiff/PheKnowLator/pkt/bnode/')
+file_fingerprints: Dict = dict()  # md5 hashes keyed by (file path, size, modification time), see fingerprints_files
 
 
 def gets_ontology_classes(graph: Graph) -> Set:
@@ -112,6 +130,48 @@ def gets_object_properties(graph: Graph) -> Set:
     else: raise ValueError('ERROR: No object properties returned from query.')
 
 
+class EntityRegistry(object):
+    """Keeps the sets of owl:Class, owl:ObjectProperty, and owl:NamedIndividual nodes (excluding BNodes) in a knowledge
+    graph. The registry is built with a single pass over the graph's rdf:type triples and is then updated with the
+    triples that are added to or removed from the graph, so that membership checks never require the graph to be
+    queried again.
+
+    Attributes:
+        classes: A set of RDFLib URIRefs typed as owl:Class.
+        object_properties: A set of RDFLib URIRefs typed as owl:ObjectProperty.
+        individuals: A set of RDFLib URIRefs typed as owl:NamedIndividual.
+    """
+
+    def __init__(self, graph: Optional[Graph] = None) -> None:
+
+        self.classes: Set = set()
+        self.object_properties: Set = set()
+        self.individuals: Set = set()
+        if graph is not None: self.updates_registry(graph.triples((None, RDF.type, None)))
+
+    def updates_registry(self, triples: Iterable, remove: bool = False) -> None:
+        """Updates the registry with triples that were added to or removed from the graph. Only rdf:type triples
+        whose subject is a URIRef and whose object is owl:Class, owl:ObjectProperty, or owl:NamedIndividual change
+        the registry.
+
+        Args:
+            triples: An iterable of RDFLib triples.
+            remove: A bool indicating whether the triples were removed from the graph (default=False).
+
+        Returns:
+            None.
+        """
+
+        registry = {OWL.Class: self.classes, OWL.ObjectProperty: self.object_properties,
+                    OWL.NamedIndividual: self.individuals}
+        for s, p, o in triples:
+            if p == RDF.type and o in registry and isinstance(s, URIRef):
+                if remove: registry[o].discard(s)
+                else: registry[o].add(s)
+
+        return None
+
+
 def gets_ontology_class_synonyms(graph: Graph) -> Tuple:
     """Queries a knowledge graph and returns a tuple of dictionaries. The first dictionary contains all owl:Class
     objects and their synonyms in the graph. The second dictionary contains the synonyms and their OWL synonym types.
@@ -364,24 +424,21 @@ def gets_entity_ancestors(graph: Graph, uris: List[Union[URIRef, str]], rel: Uni
 
 
 def connected_components(graph: Graph) -> List:
-    """Creates a dictionary where the keys are integers representing a component number and the values are sets
-    containing the nodes for a given component. This method works by first converting the RDFLib graph into a
-    NetworkX multi-directed graph, which is converted to a undirected graph prior to calculating the connected
-    components.
+    """Creates a list of sets, where each set contains the nodes for a given component, ordered from the largest to
+    the smallest component. The components are found with a single pass over the graph's triples, which merges the
+    components of each triple's subject and object with a union-find (see GraphStatistics) rather than converting
+    the graph to a NetworkX graph.
 
     Args:
         graph: An RDFLib Graph object.
 
     Returns:
-        component_dict: A dictionary where the keys are integers representing a component number and the values are sets
-            containing the nodes for a given component.
+        component_dict: A list of sets, each set containing the nodes for a given component.
     """
 
-    nx_mdg = nx.MultiDiGraph()
-    for s, p, o in tqdm(graph):
-        nx_mdg.add_edge(s, o, **{'key': p})
+    stats = GraphStatistics(components=True); stats.updates_statistics(tqdm(graph))
     print('Calculating Connected Components')
-    comps = list(nx.connected_components(nx_mdg.to_undirected())); component_dict = sorted(comps, key=len, reverse=True)
+    component_dict = [set(x[1]) for x in stats.gets_components(max_members=None)]
 
     return component_dict
 
@@ -404,36 +461,44 @@ def removes_self_loops(graph: Graph) -> List:
     return list(self_loops)
 
 
-def derives_graph_statistics(graph: Union[Graph, nx.MultiDiGraph]) -> str:
+def derives_graph_statistics(graph: Union[Graph, nx.MultiDiGraph], approximate: bool = False) -> str:
     """Derives statistics from an input knowledge graph and prints them to the console. Note that we are not
     converting each node to a string before deriving our counts. This is purposeful as the number of unique nodes is
     altered when you it converted to a string. For example, in the HPO when honoring the RDF type of each node
     there are 406,717 unique nodes versus 406,331 unique nodes when ignoring the RDF type of each node.
 
+    The statistics are accumulated in a single pass over the graph's triples or edges (see GraphStatistics). For
+    NetworkX graphs, the highest degree nodes are found with a heap and the connected components with a union-find
+    over integer node identifiers, so the graph is never copied. For RDFLib graphs, approximate can be set to True to
+    estimate the distinct counts with HyperLogLog sketches, which keeps the memory used constant.
+
     Args:
         graph: An RDFLib graph object or a networkx.MultiDiGraph.
+        approximate: A bool indicating whether or not to estimate the distinct counts of RDFLib graphs (default=False).
 
     Returns:
         stats: A formatted string containing descriptive statistics.
     """
 
     if isinstance(graph, Graph):
-        triples = len(graph); nodes = len(set(list(graph.subjects()) + list(graph.objects())))
-        rels = set(list(graph.predicates())); cls = set([x for x in graph.subjects(RDF.type, OWL.Class)])
-        inds = set([x for x in graph.subjects(RDF.type, OWL.NamedIndividual)])
-        obj_prop = set([x for x in graph.subjects(RDF.type, OWL.ObjectProperty)])
-        ant_prop = set([x for x in graph.subjects(RDF.type, OWL.AnnotationProperty)])
+        stats = GraphStatistics(approximate=approximate); stats.updates_statistics(graph)
+        counts = [stats.counts_distinct(x) for x in ['nodes', 'classes', 'individuals', 'object_properties',
+                                                     'annotation_properties']]
         x = ' {} triples, {} nodes, {} predicates, {} classes, {} individuals, {} object props, {} annotation props'
-        stat = 'Graph Stats:' + x.format(triples, nodes, len(rels), len(cls), len(inds), len(obj_prop), len(ant_prop))
+        stat = 'Graph Stats{}:'.format(' (approximate)' if approximate else '') + \
+            x.format(stats.triples, counts[0], len(stats.predicates), *counts[1:])
     else:
-        nx_graph_und = graph.to_undirected()
-        nodes = nx.number_of_nodes(graph); edges = nx.number_of_edges(graph); self_loops = nx.number_of_selfloops(graph)
-        conn = Counter([str(x[2]) for x in graph.edges(keys=True)])  # type: ignore
-        ce = sorted(conn.items(), key=lambda x: x[1], reverse=1)[:6]  # type: ignore
+        stats = GraphStatistics(components=True)
+        stats.updates_statistics((s, p, o) for s, o, p in graph.edges(keys=True))
+        nodes = nx.number_of_nodes(graph); edges = stats.triples; self_loops = stats.self_loops
+        if nodes > len(stats.nodes):  # isolated nodes are only found by iterating over the nodes
+            for node in graph.nodes: stats.encodes_node(node)
+        ce = [(str(x[0]), x[1]) for x in stats.gets_top_predicates(6)]
         dens = nx.density(graph); avg_deg = float(edges) / nodes
-        n_deg = sorted([(str(x[0]), x[1]) for x in graph.degree], key=lambda x: x[1], reverse=1)[:6]  # type: ignore
-        c = sorted(list(nx.connected_components(nx_graph_und)), key=len, reverse=True)
-        cc = {x: str(len(c[x])) + ' nodes: ' + ' | '.join(c[x]) if len(c[x]) < 50 else len(c[x]) for x in range(len(c))}
+        n_deg = [(str(x[0]), x[1]) for x in stats.gets_top_degree_nodes(6)]
+        c = stats.gets_components(max_members=50)
+        cc = {x: str(c[x][0]) + ' nodes: ' + ' | '.join(str(y) for y in c[x][1]) if c[x][1] is not None else c[x][0]
+              for x in range(len(c))}
         x = '{} nodes, {} edges, {} self-loops, 5 most most common edges: {}, average degree {}, 5 highest degree '\
             'nodes: {}, density: {}, {} component(s): {}'
         stat = 'Graph Stats: ' + x.format(nodes, edges, self_loops, ', '.join([x[0] + ':' + str(x[1]) for x in ce]),
@@ -454,6 +519,7 @@ def adds_namespace_to_bnodes(graph: Graph, ns: Union[str, Namespace] = pkt_bnode
     """
 
     print('Processing Original Nodes')
+    graph_store = type(graph.store)()
     all_triples = set(graph)
     sub_only_bnodes_org = {x for x in graph if isinstance(x[0], BNode) and not isinstance(x[2], BNode)}
     obj_only_bnodes_org = {x for x in graph if isinstance(x[2], BNode) and not isinstance(x[0], BNode)}
@@ -467,7 +533,7 @@ def adds_namespace_to_bnodes(graph: Graph, ns: Union[str, Namespace] = pkt_bnode
     both_fixed = {(URIRef(ns_uri + str(x[0])), x[1], URIRef(ns_uri + str(x[2]))) for x in sub_and_obj_bnodes_org}
     del sub_only_bnodes_org, obj_only_bnodes_org, sub_and_obj_bnodes_org
     print('Finalizing Updated Graph')
-    updated_graph = Graph()
+    updated_graph = Graph(store=graph_store)
     for s, p, o in tqdm(graph_no_bnodes | sub_fixed | obj_fixed | both_fixed): updated_graph.add((s, p, o))
 
     return updated_graph
@@ -486,6 +552,7 @@ def removes_namespace_from_bnodes(graph: Graph, ns: Union[str, Namespace] = pkt_
     """
 
     print('Processing Original Nodes')
+    graph_store = type(graph.store)()
     ns_uri = str(ns) if isinstance(ns, Namespace) else ns
     all_triples = set(graph)
     sub_only_bnodes_ns = {(s, p, o) for s, p, o in graph if str(s).startswith(ns_uri) and not str(o).startswith(ns_uri)}
@@ -499,7 +566,7 @@ def removes_namespace_from_bnodes(graph: Graph, ns: Union[str, Namespace] = pkt_
     both_fixed = {(BNode(str(s).split('/')[-1]), p, BNode(str(o).split('/')[-1])) for s, p, o in sub_and_obj_bnodes_ns}
     del sub_only_bnodes_ns, obj_only_bnodes_ns, sub_and_obj_bnodes_ns
     print('Finalizing Updated Graph')
-    updated_graph = Graph()
+    updated_graph = Graph(store=graph_store)
     for s, p, o in tqdm(graph_no_bnodes | sub_fixed | obj_fixed | both_fixed): updated_graph.add((s, p, o))
 
     return updated_graph
@@ -549,15 +616,92 @@ def splits_knowledge_graph(graph: Graph, graph_output: bool = False) -> Tuple[Gr
     all_triples = set(graph); logic_triples = all_triples - annot_triples
     if len(logic_triples) + len(annot_triples) == len(all_triples):
         print('Creating Logic Graph (n={} Triples)'.format(len(logic_triples)))
-        logic_graph = adds_edges_to_graph(Graph(), logic_triples)
+        logic_graph = adds_edges_to_graph(Graph(store=type(graph.store)()), logic_triples)
         if graph_output:
             print('Creating Annotation Graph (n={} Triples)'.format(len(annot_triples)))
-            annotation_graph = adds_edges_to_graph(Graph(), annot_triples)
+            annotation_graph = adds_edges_to_graph(Graph(store=type(graph.store)()), annot_triples)
         else: annotation_graph = annot_triples
         return logic_graph, annotation_graph
     else: raise ValueError('Error: Graph Subsetting was Unsuccessful!')
 
 
+def writes_graph_cache(graph: Graph, filepath: str, cache_file: Optional[str] = None) -> None:
+    """Writes a binary cache for a parsed graph file, which contains a dictionary of the graph's unique terms and its
+    triples encoded as integer indices into that dictionary. The cache records the graph file's size, modification
+    time, and md5 hash so that loads_cached_graph can verify that it is still valid.
+
+    Args:
+        graph: An RDFLib Graph object parsed from filepath.
+        filepath: A string containing the path to the file that the graph was parsed from.
+        cache_file: A string containing the path to write the cache to (default=None, which writes a sidecar next to
+            the graph file, i.e. filepath + '.graph_cache').
+
+    Returns:
+        None.
+    """
+
+    cache_file = filepath + '.graph_cache' if cache_file is None else cache_file
+    term_ids: Dict = dict(); kinds: List = []; values: List = []; literals: Dict = dict()
+    triples = np.empty((len(graph), 3), dtype=np.int64)
+    for i, triple in enumerate(graph):
+        for j, term in enumerate(triple):
+            if term not in term_ids:
+                term_ids[term] = len(values); values.append(str(term))
+                if isinstance(term, BNode): kinds.append(1)
+                elif isinstance(term, Literal):
+                    kinds.append(2); literals[term_ids[term]] = (term.language, term.datatype)
+                else: kinds.append(0)
+            triples[i, j] = term_ids[term]
+    stats = os.stat(filepath); file_info = (stats.st_size, stats.st_mtime_ns, fingerprints_files([filepath]))
+    dtype = np.int32 if len(values) < 2 ** 31 else np.int64
+    cache = {'file': file_info, 'kinds': np.array(kinds, dtype=np.int8), 'values': values, 'literals': literals,
+             'triples': triples.astype(dtype)}
+    with open(cache_file, 'wb') as out: pickle.dump(cache, out, protocol=4)
+
+    return None
+
+
+def loads_cached_graph(filepath: str, file_format: str = 'xml', store: str = 'default',
+                       cache_file: Optional[str] = None) -> Graph:
+    """Loads a graph from a file using the binary cache written by writes_graph_cache when it is valid, otherwise
+    the file is parsed and a new cache is written. A cache is valid when the size of the graph file matches the
+    recorded size and either its modification time or its md5 hash matches the recorded value. The cached triples are
+    passed straight to the graph's store, which skips the per-triple checks of Graph.addN, and an IntegerStore builds
+    its indexes from the encoded triples at once (see IntegerStore.loads_triples).
+
+    Args:
+        filepath: A string containing the path to a graph file.
+        file_format: A string containing the RDFLib format of the graph file (default='xml').
+        store: A string containing the name of the RDFLib store plugin used for the graph (default='default').
+        cache_file: A string containing the path of the cache (default=None, which uses a sidecar next to the graph
+            file, i.e. filepath + '.graph_cache').
+
+    Returns:
+        graph: An RDFLib Graph object.
+    """
+
+    cache_file = filepath + '.graph_cache' if cache_file is None else cache_file
+    stats, cache = os.stat(filepath), None
+    if os.path.exists(cache_file):
+        with open(cache_file, 'rb') as f_in: cache = pickle.load(f_in)
+        size, mtime, file_hash = cache['file']
+        if size != stats.st_size or (mtime != stats.st_mtime_ns and file_hash != fingerprints_files([filepath])):
+            cache = None
+    if cache is None:
+        log_str = 'Parsing Graph File: {}'.format(filepath); print(log_str); logger.info(log_str)
+        graph = Graph(store=store).parse(filepath, format=file_format); writes_graph_cache(graph, filepath, cache_file)
+    else:
+        log_str = 'Loading Graph From Cache: {}'.format(cache_file); print(log_str); logger.info(log_str)
+        graph = Graph(store=store); values, literals = cache['values'], cache['literals']
+        terms = [URIRef(values[i]) if kind == 0 else BNode(values[i]) if kind == 1
+                 else Literal(values[i], lang=literals[i][0], datatype=literals[i][1])
+                 for i, kind in enumerate(cache['kinds'].tolist())]
+        if isinstance(graph.store, IntegerStore): graph.store.loads_triples(terms, cache['triples'])
+        else: graph.store.addN((terms[s], terms[p], terms[o], graph) for s, p, o in cache['triples'].tolist())
+
+    return graph
+
+
 def maps_ids_to_integers(graph: Union[Graph, Set], write_location: str, output_ints: str, output_ints_map: str) -> Dict:
     """Loops over the knowledge graph in order to create three different types of files:
         - Integers: tab-delimited `.txt` file containing three columns, one for each part of a triple (i.e.
@@ -628,6 +772,7 @@ def n3(node: Union[URIRef, BNode, Literal]) -> str:
 
 def appends_to_existing_file(edges: Union[List, Set], filepath: str, sep: str) -> None:
     """Method adds data to the end of an existing file. Assumes that it is adding data to the end of a n-triples file.
+    Callers that write to the same file several times should keep a pkt_kg.utils.NTriplesWriter open instead.
 
     Args:
         edges: A tuple of 3 RDFLib terms.
@@ -638,10 +783,7 @@ def appends_to_existing_file(edges: Union[List, Set], filepath: str, sep: str) -
         None.
     """
 
-    with open(filepath, 'a', newline='') as out:
-        for edge in edges:
-            out.write(n3(edge[0]) + sep + n3(edge[1]) + sep + n3(edge[2]) + ' .\n')
-    out.close()
+    with NTriplesWriter(filepath, 'a') as writer: writer.writes_triples(edges, sep)
 
     return None
 
@@ -692,3 +834,30 @@ def convert_to_networkx(write_location: str, full_kg: str, graph: Optional[Graph
     nx.write_gpickle(nx_mdg, write_location + full_kg + '_NetworkxMultiDiGraph.gpickle'); del nx_mdg
 
     return None
+
+
+def fingerprints_files(files: List[str], *args: str) -> str:
+    """Creates a fingerprint for a set of input files by hashing their content in chunks. The md5 hash of each file is
+    cached using the file's path, size, and modification time so that files are only read once per process.
+
+    Args:
+        files: A list of strings containing paths to existing files (non-existent files are recorded by name only).
+        args: Optional strings (e.g. build flags) which are included in the fingerprint.
+
+    Returns:
+        A string containing an md5 hash of the files' content and the optional strings.
+    """
+
+    fingerprint = hashlib.md5('|'.join(args).encode())
+    for file_path in sorted(set(files)):
+        fingerprint.update(os.path.basename(file_path).encode())
+        if not os.path.exists(file_path): continue
+        stats = os.stat(file_path); key = (os.path.abspath(file_path), stats.st_size, stats.st_mtime_ns)
+        if key not in file_fingerprints:
+            file_hash = hashlib.md5()
+            with open(file_path, 'rb') as f_in:
+                for chunk in iter(lambda: f_in.read(1 << 20), b''): file_hash.update(chunk)
+            file_fingerprints[key] = file_hash.hexdigest()
+        fingerprint.update(file_fingerprints[key].encode())
+
+    return fingerprint.hexdigest()
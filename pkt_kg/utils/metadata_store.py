@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Node Metadata Store.
+
+Stores Node Metadata On Disk
+* NodeMetadataStore
+* NodeMetadataTable
+
+Loads Node Metadata Stores
+* loads_node_metadata_store
+"""
+
+# import needed libraries
+import json
+import os
+import os.path
+import pickle
+import sqlite3
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# database layout -- one row per entity (the metadata dictionary is stored as JSON), the metadata types (e.g. "nodes"
+# and "relations") in the order they were added, and the size and modification time of the pickled dictionary the
+# store was created from
+store_schema = """
+    CREATE TABLE IF NOT EXISTS key_types (key_type TEXT PRIMARY KEY);
+    CREATE TABLE IF NOT EXISTS metadata (key_type TEXT NOT NULL, entity TEXT NOT NULL, value TEXT NOT NULL,
+                                         PRIMARY KEY (key_type, entity));
+    CREATE TABLE IF NOT EXISTS source (name TEXT PRIMARY KEY, value INTEGER);
+"""
+
+
+class NodeMetadataTable(Mapping):
+    """A read-only dictionary interface to the metadata of one metadata type (e.g. "nodes") in a NodeMetadataStore.
+    Entities are looked up with the store's primary key index and are iterated in the order they were first added.
+
+    Attributes:
+        store: The NodeMetadataStore containing the table.
+        key_type: A string containing the metadata type (e.g. "nodes" or "relations").
+    """
+
+    def __init__(self, store: 'NodeMetadataStore', key_type: str) -> None:
+
+        self.store: NodeMetadataStore = store
+        self.key_type: str = key_type
+
+    def get(self, key: Any, default: Any = None) -> Any:
+
+        if type(key) is not str: return default  # as in a dictionary, RDFLib terms do not match string keys
+        row = self.store.connects().execute('SELECT value FROM metadata WHERE key_type = ? AND entity = ?',
+                                            (self.key_type, key)).fetchone()
+
+        return default if row is None else json.loads(row[0])
+
+    def __getitem__(self, key: Any) -> Dict:
+
+        value = self.get(key)
+        if value is None: raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+
+        return type(key) is str and self.store.connects().execute(
+            'SELECT 1 FROM metadata WHERE key_type = ? AND entity = ?', (self.key_type, key)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+
+        for row in self.store.connects().execute('SELECT entity FROM metadata WHERE key_type = ? ORDER BY rowid',
+                                                 (self.key_type,)):
+            yield row[0]
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:  # type: ignore
+
+        for row in self.store.connects().execute('SELECT entity, value FROM metadata WHERE key_type = ? ORDER BY '
+                                                 'rowid', (self.key_type,)):
+            yield row[0], json.loads(row[1])
+
+    def __len__(self) -> int:
+
+        return self.store.connects().execute('SELECT COUNT(*) FROM metadata WHERE key_type = ?',
+                                             (self.key_type,)).fetchone()[0]
+
+
+class NodeMetadataStore(Mapping):
+    """A node metadata dictionary (see Metadata.node_dict) stored in an SQLite database on disk. The store is keyed by
+    metadata type (e.g. "nodes" or "relations") with a NodeMetadataTable as the value, so entities can be looked up
+    the same way as in the nested dictionary while only the requested entities are read into memory. Metadata is
+    added in batches with updates_metadata. Each process opens its own connection to the database, so the store can
+    be used by worker processes and is pickled as the path to the database.
+
+    Attributes:
+        db_file: A string containing the path to the database.
+        batch_size: An integer containing the number of entities written in each transaction.
+    """
+
+    def __init__(self, db_file: str, batch_size: int = 50000) -> None:
+
+        self.db_file: str = db_file
+        self.batch_size: int = batch_size
+        self.__connection: Optional[sqlite3.Connection] = None; self.__pid: Optional[int] = None
+        self.connects().executescript(store_schema)
+
+    def connects(self) -> sqlite3.Connection:
+        """Returns the current process' connection to the database, opening it if needed."""
+
+        if self.__connection is None or self.__pid != os.getpid():
+            self.__connection = sqlite3.connect(self.db_file); self.__pid = os.getpid()
+
+        return self.__connection
+
+    def updates_metadata(self, key_type: str, metadata: Union[Dict, Iterable[Tuple[str, Dict]]]) -> None:
+        """Adds metadata to the store, replacing the metadata of entities that are already in it. Entities that are
+        replaced keep their position in the store (i.e. this matches updating a dictionary).
+
+        Args:
+            key_type: A string containing the metadata type (e.g. "nodes" or "relations").
+            metadata: A dictionary (or an iterable of tuples) of entity identifiers and their metadata dictionary
+                (e.g. {'http://www.ncbi.nlm.nih.gov/gene/1': {'Label': 'A1BG', 'Description': None, 'Synonym': None}}).
+
+        Returns:
+            None.
+        """
+
+        batch: List = []; metadata = metadata.items() if isinstance(metadata, dict) else metadata
+        with self.connects() as connection:
+            connection.execute('INSERT OR IGNORE INTO key_types VALUES (?)', (key_type,))
+        for entity, value in metadata:
+            batch += [(key_type, entity, json.dumps(value))]
+            if len(batch) == self.batch_size: self._writes_batch(batch); batch = []
+        if len(batch) > 0: self._writes_batch(batch)
+
+        return None
+
+    def _writes_batch(self, batch: List) -> None:
+        """Writes a batch of (key_type, entity, value) rows to the database in a single transaction."""
+
+        with self.connects() as connection:
+            connection.executemany('INSERT INTO metadata VALUES (?, ?, ?) ON CONFLICT (key_type, entity) DO UPDATE '
+                                   'SET value = excluded.value', batch)
+
+        return None
+
+    def updates_source(self, size: int, mtime: int) -> None:
+        """Records the size and modification time (in ns) of the pickled dictionary the store was created from."""
+
+        with self.connects() as connection:
+            connection.executemany('INSERT OR REPLACE INTO source VALUES (?, ?)', [('size', size), ('mtime', mtime)])
+
+        return None
+
+    def gets_source(self) -> Tuple[Optional[int], Optional[int]]:
+        """Returns the size and modification time (in ns) of the pickled dictionary the store was created from."""
+
+        source = dict(self.connects().execute('SELECT name, value FROM source').fetchall())
+
+        return source.get('size'), source.get('mtime')
+
+    def __getitem__(self, key: Any) -> NodeMetadataTable:
+
+        if key not in self: raise KeyError(key)
+
+        return NodeMetadataTable(self, key)
+
+    def __contains__(self, key: Any) -> bool:
+
+        return isinstance(key, str) and self.connects().execute(
+            'SELECT 1 FROM key_types WHERE key_type = ?', (key,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+
+        for row in self.connects().execute('SELECT key_type FROM key_types ORDER BY rowid').fetchall(): yield row[0]
+
+    def __len__(self) -> int:
+
+        return self.connects().execute('SELECT COUNT(*) FROM key_types').fetchone()[0]
+
+    def __getstate__(self) -> Dict:
+
+        return {'db_file': self.db_file, 'batch_size': self.batch_size}
+
+    def __setstate__(self, state: Dict) -> None:
+
+        self.__init__(state['db_file'], state['batch_size'])  # type: ignore
+
+    def close(self) -> None:
+        """Closes the current process' connection to the database."""
+
+        if self.__connection is not None and self.__pid == os.getpid(): self.__connection.close()
+        self.__connection = None
+
+        return None
+
+
+def loads_node_metadata_store(pickle_file: str, db_file: Optional[str] = None) -> NodeMetadataStore:
+    """Opens the store for a pickled node metadata dictionary, first copying the pickled dictionary into a new store
+    if there is no store or if the pickled dictionary has changed since the store was created. The pickled dictionary
+    is only read into memory when the store is created.
+
+    Args:
+        pickle_file: A string containing the path to a pickled node metadata dictionary.
+        db_file: A string containing the path to the store (default=pickle_file with a ".db" extension).
+
+    Returns:
+        A NodeMetadataStore instance.
+    """
+
+    db_file = db_file if db_file is not None else os.path.splitext(pickle_file)[0] + '.db'
+    stat, store = os.stat(pickle_file), None
+    if os.path.exists(db_file):
+        try: store = NodeMetadataStore(db_file)
+        except sqlite3.DatabaseError: store = None
+        if store is not None and store.gets_source() != (stat.st_size, stat.st_mtime_ns): store.close(); store = None
+    if store is None:
+        with open(pickle_file, 'rb') as f: node_dict = pickle.load(f, encoding='utf8')
+        temp_file = db_file + '.{}.tmp'.format(os.getpid())
+        if os.path.exists(temp_file): os.remove(temp_file)
+        temp_store = NodeMetadataStore(temp_file)
+        for key_type in list(node_dict.keys()): temp_store.updates_metadata(key_type, node_dict.pop(key_type))
+        temp_store.updates_source(stat.st_size, stat.st_mtime_ns); temp_store.close(); del node_dict
+        os.replace(temp_file, db_file); store = NodeMetadataStore(db_file)
+
+    return store
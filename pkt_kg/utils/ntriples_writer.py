@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Buffered N-Triples Writer.
+
+Writes N-Triples Files
+* NTriplesWriter
+"""
+
+# import needed libraries
+import gzip
+import queue
+import threading
+
+from rdflib import Literal  # type: ignore
+from rdflib.plugins.serializers.nt import _quoteLiteral  # type: ignore
+from rdflib.term import Node  # type: ignore
+from types import ModuleType
+from typing import Any, Dict, IO, Iterable, List, Optional, Tuple
+
+zstandard: Optional[ModuleType]  # zstd compression is optional
+try: import zstandard  # type: ignore
+except ImportError: zstandard = None
+
+# file extensions added to the output file for each compression type
+compression_extensions = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+class NTriplesWriter(object):
+    """Writes triples to an N-Triples file which stays open until the writer is closed, so that a build can add
+    triples to the same file at several points (e.g. once per edge type) without reopening it. Serialized terms are
+    cached, since the same nodes and relations occur in many triples, and lines are joined into blocks of buffer_size
+    triples before they are written. When compression is used, blocks are compressed and written by a background
+    thread while the next block is serialized. The writer can be used as a context manager.
+
+        Example:
+            with NTriplesWriter(write_location + '/PheKnowLator_Full.nt') as writer:
+                writer.writes_triples(set(graph))
+
+    Attributes:
+        filepath: A string containing the path to the file being written. If compression is used, the compression
+            type's extension (".gz" or ".zst") is added unless the path already ends with it.
+        mode: A string containing "a" to append triples to the end of an existing file or "w" to overwrite it.
+        compression: A string containing the compression type, either None (default), "gzip", or "zstd".
+        buffer_size: An integer containing the number of triples that are joined and written at once.
+        max_cached_terms: An integer containing the number of serialized terms cached before the cache is cleared.
+        triple_count: An integer containing the number of triples written.
+
+    Raises:
+        ValueError: If mode is not "a" or "w".
+        ValueError: If compression is not None, "gzip", or "zstd".
+        ImportError: If compression is "zstd" and the zstandard library is not installed.
+    """
+
+    def __init__(self, filepath: str, mode: str = 'a', compression: Optional[str] = None, buffer_size: int = 100000,
+                 max_cached_terms: int = 5000000) -> None:
+
+        if mode not in ['a', 'w']: raise ValueError('mode must be "a" or "w"')
+        if compression is not None and compression not in compression_extensions.keys():
+            raise ValueError('compression must be None, "gzip", or "zstd"')
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError('zstd compression requires the zstandard library: pip install zstandard')
+        ext = compression_extensions[compression] if compression is not None else ''
+        self.filepath: str = filepath if filepath.endswith(ext) else filepath + ext
+        self.mode: str = mode
+        self.compression: Optional[str] = compression
+        self.buffer_size: int = buffer_size
+        self.max_cached_terms: int = max_cached_terms
+        self.triple_count: int = 0
+        self.terms: Dict[Node, str] = dict()
+        self.lines: List[str] = []
+        self.error: Optional[BaseException] = None
+        file = open(self.filepath, self.mode + 'b')
+        self.file: Optional[IO[bytes]] = file
+        self.stream: Any = file
+        self.blocks: Optional[queue.Queue] = None
+        self.thread: Optional[threading.Thread] = None
+        if compression is not None:  # compressed blocks are written by a background thread
+            if compression == 'gzip': self.stream = gzip.GzipFile(fileobj=file, mode=self.mode + 'b')
+            elif zstandard is not None: self.stream = zstandard.ZstdCompressor().stream_writer(file, closefd=False)
+            self.blocks = queue.Queue(maxsize=4)
+            self.thread = threading.Thread(target=self.compresses_blocks, daemon=True); self.thread.start()
+
+    def __enter__(self) -> 'NTriplesWriter':
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+
+        self.close()
+
+        return None
+
+    def serializes_term(self, term: Node) -> str:
+        """Returns the N-Triples serialization of an RDFLib term (see pkt_kg.utils.n3), using the cached serialization
+        when the term was already written.
+
+        Args:
+            term: An RDFLib BNode, URIRef, or Literal.
+
+        Returns:
+            A string containing the serialized term.
+        """
+
+        serialized = self.terms.get(term)
+        if serialized is None:
+            if len(self.terms) >= self.max_cached_terms: self.terms.clear()
+            serialized = _quoteLiteral(term) if isinstance(term, Literal) else term.n3()
+            self.terms[term] = serialized
+
+        return serialized
+
+    def writes_triples(self, triples: Iterable[Tuple], sep: str = ' ') -> None:
+        """Serializes triples and adds them to the output buffer, writing the buffer each time it holds buffer_size
+        triples.
+
+        Args:
+            triples: An iterable of (subject, predicate, object) tuples of RDFLib terms.
+            sep: A string containing the separator written between the terms of a triple (default=' ').
+
+        Returns:
+            None.
+        """
+
+        if self.file is None: raise ValueError('I/O operation on closed NTriplesWriter')
+        lines, term = self.lines, self.serializes_term
+        for s, p, o in triples:
+            lines.append(term(s) + sep + term(p) + sep + term(o) + ' .\n')
+            if len(lines) >= self.buffer_size: self.flush(); lines = self.lines
+
+        return None
+
+    def flush(self) -> None:
+        """Writes the buffered triples to the output file (or hands them to the compression thread)."""
+
+        if len(self.lines) > 0:
+            block = ''.join(self.lines).encode('utf-8'); self.triple_count += len(self.lines); self.lines = []
+            if self.blocks is None: self.stream.write(block)
+            else:
+                if self.error is not None: raise self.error
+                self.blocks.put(block)
+
+        return None
+
+    def compresses_blocks(self) -> None:
+        """Compresses and writes the blocks of serialized triples passed by flush until a None block is received.
+        Runs in a background thread. Any error raised while writing is stored and re-raised in the main thread.
+        """
+
+        block = self.blocks.get()  # type: ignore
+        while block is not None:
+            try:
+                if self.error is None: self.stream.write(block)
+            except BaseException as e: self.error = e
+            block = self.blocks.get()  # type: ignore
+
+        return None
+
+    def close(self) -> None:
+        """Writes any buffered triples and closes the output file. Closing a closed writer has no effect."""
+
+        if self.file is not None:
+            try: self.flush()
+            finally:
+                if self.thread is not None: self.blocks.put(None); self.thread.join()  # type: ignore
+                if self.stream is not self.file: self.stream.close()
+                self.file.close(); self.file = None; self.terms.clear()
+            if self.error is not None: raise self.error
+
+        return None
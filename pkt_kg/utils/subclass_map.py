@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Subclass Construction Map Index.
+
+Writes and Loads Subclass Map Indexes
+* writes_subclass_map_index
+* loads_subclass_map_index
+
+Reads Subclass Map Indexes
+* SubclassMapIndex
+"""
+
+# import needed libraries
+import functools
+import mmap
+import os
+import os.path
+import pickle
+import struct
+import sys
+import zlib
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+# index file layout -- a fixed size header followed by 8-byte aligned sections: key offsets, value offsets, values
+# (integer class identifiers), class offsets, hash table slots, key bytes, and class bytes. Arrays are stored in the
+# native byte order.
+index_magic = b'PKTSCMI1'
+index_header = struct.Struct('<8s7Q')  # magic, little endian flag, keys, classes, values, slots, source size and mtime
+header_size = 64
+
+
+def _aligns(size: int) -> int:
+    """Returns a size rounded up to a multiple of 8 bytes."""
+
+    return size + (-size % 8)
+
+
+def writes_subclass_map_index(subclass_map: Dict, index_file: str, source: Optional[str] = None) -> None:
+    """Writes a subclass construction map, i.e. a dictionary keyed by non-class entity identifiers with lists of
+    ontology class identifiers as values, to a memory-mappable index file. Keys are written in sorted order and each
+    key is also placed in an open addressing hash table (CRC32 with linear probing), so entities can be found without
+    searching. Each unique class identifier is stored once. Classes stored as sets are written in sorted order, classes
+    stored as lists keep their order. The index is written to a temporary file that then replaces the index file, so
+    processes reading an existing index are not affected.
+
+    Args:
+        subclass_map: A dictionary keyed by entity identifier with a list or set of class identifiers as the value.
+        index_file: A string containing the path to write the index to.
+        source: A string containing the path to the pickled map the index was created from (default=None). Its size
+            and modification time are recorded so that out of date indexes can be found (see loads_subclass_map_index).
+
+    Returns:
+        None.
+    """
+
+    keys = sorted(subclass_map.keys(), key=lambda x: x.encode('utf-8'))
+    class_ids: Dict = dict(); key_offsets, value_offsets, values = array('Q', [0]), array('Q', [0]), array('I')
+    key_bytes = b''.join(x.encode('utf-8') for x in keys)
+    for key in keys:
+        key_offsets.append(key_offsets[-1] + len(key.encode('utf-8')))
+        classes = sorted(subclass_map[key]) if isinstance(subclass_map[key], (set, frozenset)) else subclass_map[key]
+        for cls in classes: values.append(class_ids.setdefault(cls, len(class_ids)))
+        value_offsets.append(len(values))
+    class_offsets, encoded_classes = array('Q', [0]), [x.encode('utf-8') for x in class_ids]
+    for cls in encoded_classes: class_offsets.append(class_offsets[-1] + len(cls))
+    n_slots = 1 << max(len(keys) * 2 - 1, 1).bit_length(); mask = n_slots - 1  # load factor of at most 0.5
+    slots = array('Q', bytes(8 * n_slots))  # slots hold the key position + 1 (0 = empty)
+    for idx, key in enumerate(keys):
+        slot = zlib.crc32(key.encode('utf-8')) & mask
+        while slots[slot] != 0: slot = (slot + 1) & mask
+        slots[slot] = idx + 1
+    stat = os.stat(source) if source is not None else None
+    header = index_header.pack(index_magic, int(sys.byteorder == 'little'), len(keys), len(class_ids), len(values),
+                               n_slots, stat.st_size if stat else 0, stat.st_mtime_ns if stat else 0)
+    temp_file = index_file + '.{}.tmp'.format(os.getpid())
+    with open(temp_file, 'wb') as out:
+        out.write(header.ljust(header_size, b'\0'))
+        for section in [key_offsets, value_offsets, values, class_offsets, slots]:
+            data = section.tobytes(); out.write(data.ljust(_aligns(len(data)), b'\0'))
+        out.write(key_bytes); out.write(b''.join(encoded_classes))
+    os.replace(temp_file, index_file)
+
+    return None
+
+
+class SubclassMapIndex(Mapping):
+    """A read-only dictionary interface to a subclass construction map index (see writes_subclass_map_index). The
+    index file is memory-mapped and entities are found with the index's hash table, so the map is never
+    loaded into memory and processes using the same index share a single copy through the operating system's page
+    cache. Recent lookups are cached.
+
+    Attributes:
+        index_file: A string containing the path to the index file.
+        source_size: An integer containing the size of the pickled map the index was created from.
+        source_mtime: An integer containing the modification time (in ns) of the pickled map the index was created from.
+    """
+
+    def __init__(self, index_file: str, cache_size: int = 65536) -> None:
+
+        self.index_file: str = index_file
+        self.cache_size: int = cache_size
+        with open(index_file, 'rb') as f: self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, little, n_keys, n_classes, n_values, n_slots, self.source_size, self.source_mtime = \
+            index_header.unpack_from(self.__mmap, 0)
+        if magic != index_magic or little != int(sys.byteorder == 'little'):
+            self.__mmap.close(); raise ValueError('{} is not a subclass map index'.format(index_file))
+        self.__view, pos, sections = memoryview(self.__mmap), header_size, []
+        for count, width in [(n_keys + 1, 8), (n_keys + 1, 8), (n_values, 4), (n_classes + 1, 8), (n_slots, 8)]:
+            section = self.__view[pos:pos + count * width]  # 8-byte offsets and slots, 4-byte class identifiers
+            sections += [section.cast('Q') if width == 8 else section.cast('I')]; pos += _aligns(count * width)
+        self.__key_offsets, self.__value_offsets, self.__values, self.__class_offsets, self.__slots = sections
+        self.__mask = n_slots - 1
+        self.__key_start = pos; self.__class_start = pos + self.__key_offsets[n_keys]; self.__size = n_keys
+        self.__lookup = functools.lru_cache(maxsize=cache_size)(self._finds_classes)
+
+    def _gets_key(self, idx: int) -> bytes:
+        """Returns the bytes of the key at a position in the sorted keys."""
+
+        start = self.__key_start
+
+        return self.__mmap[start + self.__key_offsets[idx]:start + self.__key_offsets[idx + 1]]
+
+    def _finds_classes(self, key: str) -> Optional[List[str]]:
+        """Returns the list of classes for a key, or None if the key is not in the index, by probing the hash table."""
+
+        target, slots, mask = key.encode('utf-8'), self.__slots, self.__mask
+        slot = zlib.crc32(target) & mask
+        while slots[slot] != 0:
+            idx = slots[slot] - 1
+            if self._gets_key(idx) == target:
+                start, offsets = self.__class_start, self.__class_offsets
+                return [self.__mmap[start + offsets[x]:start + offsets[x + 1]].decode('utf-8')
+                        for x in self.__values[self.__value_offsets[idx]:self.__value_offsets[idx + 1]]]
+            slot = (slot + 1) & mask
+
+        return None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+
+        classes = self.__lookup(key) if isinstance(key, str) else None
+
+        return default if classes is None else list(classes)
+
+    def __getitem__(self, key: Any) -> List[str]:
+
+        classes = self.get(key)
+        if classes is None: raise KeyError(key)
+
+        return classes
+
+    def __contains__(self, key: Any) -> bool:
+
+        return isinstance(key, str) and self.__lookup(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+
+        for idx in range(self.__size): yield self._gets_key(idx).decode('utf-8')
+
+    def __len__(self) -> int:
+
+        return self.__size
+
+    def __getstate__(self) -> Dict:
+
+        return {'index_file': self.index_file, 'cache_size': self.cache_size}
+
+    def __setstate__(self, state: Dict) -> None:
+
+        self.__init__(state['index_file'], state['cache_size'])  # type: ignore
+
+    def close(self) -> None:
+        """Closes the memory-mapped index file."""
+
+        self.__lookup.cache_clear()
+        for view in [self.__key_offsets, self.__value_offsets, self.__values, self.__class_offsets, self.__slots,
+                     self.__view]:
+            view.release()
+        self.__mmap.close()
+
+        return None
+
+
+def loads_subclass_map_index(pickle_file: str, index_file: Optional[str] = None) -> SubclassMapIndex:
+    """Opens the index for a pickled subclass construction map, first converting the pickled map to an index (see
+    writes_subclass_map_index) if there is no index or if the pickled map has changed since the index was written.
+
+    Args:
+        pickle_file: A string containing the path to a pickled subclass construction map.
+        index_file: A string containing the path to the index (default=pickle_file with an ".idx" extension).
+
+    Returns:
+        A SubclassMapIndex instance.
+    """
+
+    index_file = index_file if index_file is not None else os.path.splitext(pickle_file)[0] + '.idx'
+    stat, index = os.stat(pickle_file), None
+    if os.path.exists(index_file):
+        try: index = SubclassMapIndex(index_file)
+        except (ValueError, struct.error): index = None
+        if index is not None and (index.source_size, index.source_mtime) != (stat.st_size, stat.st_mtime_ns):
+            index.close(); index = None
+    if index is None:
+        with open(pickle_file, 'rb') as f: subclass_map = pickle.load(f, encoding='bytes')
+        writes_subclass_map_index(subclass_map, index_file, pickle_file); del subclass_map
+        index = SubclassMapIndex(index_file)
+
+    return index
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Build Telemetry.
+
+Measures Resource Usage
+* gets_resource_usage
+
+Records Build Steps
+* writes_telemetry_record
+* records_build_step
+"""
+
+# import needed libraries
+import datetime
+import json
+import os
+import os.path
+import resource
+import sys
+import time
+
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Optional, Tuple
+
+# telemetry log -- written next to the build log (see pkt_kg.knowledge_graph) unless the PKT_TELEMETRY_LOG environment
+# variable contains another path
+log_dir = 'builds/logs' if os.path.isdir('builds') or not os.path.isdir('../builds') else '../builds/logs'
+telemetry_log = os.environ.get('PKT_TELEMETRY_LOG', log_dir + '/pkt_build_telemetry.jsonl')
+
+
+def gets_resource_usage() -> Tuple[float, float]:
+    """Gets the CPU time used by the current process and its finished child processes (e.g. edge construction
+    workers) and the peak resident set size (RSS) of the current process.
+
+    Returns:
+        cpu_time: A float containing the user and system CPU time in seconds.
+        peak_rss: A float containing the peak RSS in megabytes.
+    """
+
+    own, children = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_time = own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+    peak_rss = own.ru_maxrss / (1024 ** 2) if sys.platform == 'darwin' else own.ru_maxrss / 1024  # bytes vs. kb
+
+    return cpu_time, peak_rss
+
+
+def writes_telemetry_record(record: Dict, log_file: Optional[str] = None) -> None:
+    """Appends a telemetry record to a JSON Lines file, where each line contains the JSON record for one build step.
+
+    Args:
+        record: A dictionary containing a telemetry record.
+        log_file: A string containing the path to the telemetry file (default=telemetry_log).
+
+    Returns:
+        None.
+    """
+
+    log_file = log_file if log_file is not None else telemetry_log
+    if os.path.dirname(log_file) != '': os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    with open(log_file, 'a') as out: out.write(json.dumps(record) + '\n')
+
+    return None
+
+
+@contextmanager
+def records_build_step(step: str, input_triples: Optional[int] = None, details: Optional[Dict] = None,
+                       log_file: Optional[str] = None) -> Generator[Dict, None, None]:
+    """Context manager that measures a build step and writes a telemetry record for it once the step finishes. The
+    record is yielded so that the step can add its output triple count (i.e. record['output_triples']) and any other
+    details. Each record contains the step name, start time, process id, status ("completed" or "failed"), wall time,
+    CPU time, peak RSS delta (i.e. how much the step raised the process' peak memory), input and output triple counts,
+    and throughput (output triples per second, or input triples per second if the step has no output triples).
+
+    Args:
+        step: A string containing the name of the build step (e.g. "split").
+        input_triples: An integer containing the number of triples input to the step (default=None).
+        details: A dictionary of other information to include in the record (e.g. {'build': 'full'}).
+        log_file: A string containing the path to the telemetry file (default=telemetry_log).
+
+    Returns:
+        record: A dictionary containing the telemetry record for the step.
+    """
+
+    record: Dict[str, Any] = {'step': step}; record.update(details or {})
+    record.update({'started': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'pid': os.getpid(),
+                   'status': 'failed', 'input_triples': input_triples, 'output_triples': None})
+    start_cpu, start_rss = gets_resource_usage(); start_wall = time.perf_counter()
+    try:
+        yield record
+        record['status'] = 'completed'
+    finally:
+        wall_time = time.perf_counter() - start_wall; cpu_time, peak_rss = gets_resource_usage()
+        triples = record['output_triples'] if record['output_triples'] is not None else record['input_triples']
+        record.update({'wall_time_sec': round(wall_time, 4), 'cpu_time_sec': round(cpu_time - start_cpu, 4),
+                       'peak_rss_delta_mb': round(peak_rss - start_rss, 2),
+                       'triples_per_sec': round(triples / wall_time, 2) if triples and wall_time > 0 else None})
+        writes_telemetry_record(record, log_file)
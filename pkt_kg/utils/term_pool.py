@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Term Interning.
+
+Interns RDFLib Terms
+* TermPool
+"""
+
+# import needed libraries
+from rdflib import Literal, URIRef  # type: ignore
+from rdflib.term import Node  # type: ignore
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class TermPool(object):
+    """Interns RDFLib URIRef and Literal objects so that equal terms created at different points of a build (e.g. the
+    same gene URIRef created for every edge it occurs in) share a single object. Terms are looked up by their string
+    value before they are created, so a hit also avoids instantiating the term. The pool counts the number of hits
+    (an existing term was returned) and misses (a new term was added).
+
+    Attributes:
+        uris: A dictionary keyed by string with URIRefs as values.
+        literals: A dictionary keyed by (string, datatype, language) tuples with Literals as values.
+        hits: An integer containing the number of lookups that returned an existing term.
+        misses: An integer containing the number of lookups that added a new term.
+    """
+
+    def __init__(self) -> None:
+
+        self.uris: Dict[str, URIRef] = dict()
+        self.literals: Dict[Tuple, Literal] = dict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def interns_uri(self, value: str) -> URIRef:
+        """Returns the pooled URIRef for a string, creating it if it is not in the pool.
+
+        Args:
+            value: A string containing a URI (e.g. 'http://purl.obolibrary.org/obo/RO_0002436').
+
+        Returns:
+            A URIRef.
+        """
+
+        term = self.uris.get(value)
+        if term is None: term = self.uris[value] = URIRef(value); self.misses += 1
+        else: self.hits += 1
+
+        return term
+
+    def interns_literal(self, value: str, datatype: Optional[str] = None, lang: Optional[str] = None) -> Literal:
+        """Returns the pooled Literal for a lexical value, datatype, and language, creating it if it is not in the pool.
+
+        Args:
+            value: A string containing the lexical value of the Literal.
+            datatype: A string containing the datatype URI of the Literal (default=None).
+            lang: A string containing the language tag of the Literal (default=None).
+
+        Returns:
+            A Literal.
+        """
+
+        key = (value, datatype, lang); term = self.literals.get(key)
+        if term is None: term = self.literals[key] = Literal(value, lang=lang, datatype=datatype); self.misses += 1
+        else: self.hits += 1
+
+        return term
+
+    def interns_term(self, term: Node) -> Node:
+        """Returns the pooled term equal to an existing RDFLib term, adding the term to the pool if there is none.
+        BNodes and other terms are returned unchanged.
+
+        Args:
+            term: An RDFLib term (e.g. a URIRef that was unpickled).
+
+        Returns:
+            An RDFLib term.
+        """
+
+        pooled: Optional[Node]
+        if type(term) is URIRef:  # pools are keyed by plain strings (see interns_uri)
+            uri_key = str(term); pooled = self.uris.get(uri_key)
+            if pooled is None: pooled = self.uris[uri_key] = term; self.misses += 1
+            else: self.hits += 1
+        elif type(term) is Literal:
+            datatype = str(term.datatype) if term.datatype is not None else None
+            literal_key = (str(term), datatype, term.language); pooled = self.literals.get(literal_key)
+            if pooled is None: pooled = self.literals[literal_key] = term; self.misses += 1
+            else: self.hits += 1
+        else: pooled = term
+
+        return pooled
+
+    def interns_triples(self, triples: Iterable[Tuple]) -> List[Tuple]:
+        """Interns the terms of each triple in a list of triples (e.g. triples returned by a worker process or read
+        from a cache, which were unpickled as new objects).
+
+        Args:
+            triples: An iterable of (subject, predicate, object) tuples of RDFLib terms.
+
+        Returns:
+            A list of (subject, predicate, object) tuples of pooled RDFLib terms.
+        """
+
+        intern = self.interns_term
+
+        return [(intern(s), intern(p), intern(o)) for s, p, o in triples]
+
+    def gets_statistics(self) -> Dict:
+        """Returns a dictionary containing the number of pooled terms, hits, misses, and the hit rate."""
+
+        lookups = self.hits + self.misses
+
+        return {'terms': len(self.uris) + len(self.literals), 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups > 0 else None}
+
+    def clears_pool(self) -> None:
+        """Removes all terms from the pool and resets the hit and miss counters."""
+
+        self.uris.clear(); self.literals.clear(); self.hits = 0; self.misses = 0
+
+        return None
+
+
+# build-wide term pool used by the construction approaches, metadata, and owl-nets modules
+term_pool = TermPool()
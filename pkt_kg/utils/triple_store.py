@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Triple Store.
+
+Integer-Encoded RDFLib Store
+* IntegerStore
+"""
+
+# import needed libraries
+import numpy as np  # type: ignore
+
+from array import array
+from rdflib import plugin  # type: ignore
+from rdflib.store import Store  # type: ignore
+from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple
+
+# packed index keys hold two term identifiers, one in the high and one in the low 32 bits
+id_bits, id_mask = 32, 0xFFFFFFFF
+
+
+class IntegerStore(Store):
+    """An in-memory RDFLib Store which keeps each unique term once in a dictionary and stores triples as integer
+    identifiers in three indexes (subject-predicate-object, predicate-object-subject, and object-subject-predicate).
+    Each index is a pair of numpy columns: an int64 key packing the first two identifiers of the triple and an int32
+    column holding the third, so a triple costs 36 bytes across the three indexes. The rows are sorted by key and then
+    by the third identifier, so a triple (or the triples sharing a key) is found by binary search no matter how many
+    triples share its key. Unlike the default RDFLib Memory store, triples are not tracked per context, which removes
+    the per-triple tuple and context dictionaries that account for most of the memory used by large graphs. The store
+    is registered as the RDFLib store plugin "Integer" and can be used anywhere a Graph is created, for example
+    Graph(store='Integer').
+
+    Rewriting the sorted columns for every new triple would make building a graph quadratic, so added triples are
+    first kept in small nested dictionaries (the same layout as the indexes) and merged into the columns in batches
+    once they reach a quarter of the size of the columns (and at least merge_size triples). Triples removed from the
+    columns are kept in a set until the next merge. Both are included when triples are matched.
+
+    The store supports the parts of the Graph API used when building knowledge graphs (adding, removing, and matching
+    triples, iteration, length, and namespace bindings). Merged triples are iterated in the order of their subject's,
+    predicate's, and object's term identifiers (i.e. the order that the terms were first added to the store), followed
+    by the triples that have not been merged yet. Terms are kept in the term dictionary once they have been added, and
+    at most 2^31 terms can be stored.
+
+    Attributes:
+        context_aware: A bool indicating that the store does not track contexts.
+        formula_aware: A bool indicating that the store does not support quoted statements.
+        graph_aware: A bool indicating that the store does not track empty graphs.
+        merge_size: An integer containing the smallest number of added or removed triples that are merged into the
+            sorted columns at once.
+    """
+
+    context_aware = False
+    formula_aware = False
+    graph_aware = False
+    merge_size = 65536
+
+    def __init__(self, configuration: Optional[str] = None, identifier: Optional[Any] = None) -> None:
+
+        super(IntegerStore, self).__init__(configuration)
+        self.identifier = identifier
+        self.__term_ids: Dict = dict()
+        self.__terms: List = []
+        self.__columns: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            x: (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)) for x in ['spo', 'pos', 'osp']}
+        self.__spo: Dict[int, Dict[int, Set[int]]] = dict()
+        self.__pos: Dict[int, Dict[int, Set[int]]] = dict()
+        self.__osp: Dict[int, Dict[int, Set[int]]] = dict()
+        self.__added: int = 0
+        self.__added_log: array = array('q')
+        self.__removed: Set[Tuple[int, int, int]] = set()
+        self.__size: int = 0
+        self.__namespaces: Dict = dict()
+        self.__prefixes: Dict = dict()
+
+    def encodes_term(self, term: Any) -> int:
+        """Returns the integer identifier for a term, adding the term to the term dictionary if it is new.
+
+        Args:
+            term: An RDFLib URIRef, BNode, or Literal.
+
+        Returns:
+            An integer identifier.
+        """
+
+        term_id = self.__term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.__terms); self.__term_ids[term] = term_id; self.__terms.append(term)
+
+        return term_id
+
+    @staticmethod
+    def _indexes_triple(index: Dict, a: int, b: int, c: int) -> bool:
+        """Adds a triple of integer identifiers to a nested index and returns True if it was not already present."""
+
+        inner = index.get(a)
+        if inner is None: index[a] = {b: {c}}; return True
+        leaf = inner.get(b)
+        if leaf is None: inner[b] = {c}; return True
+        if c in leaf: return False
+        leaf.add(c); return True
+
+    @staticmethod
+    def _unindexes_triple(index: Dict, a: int, b: int, c: int) -> None:
+        """Removes a triple of integer identifiers from a nested index, dropping any emptied levels."""
+
+        inner = index[a]; leaf = inner[b]; leaf.discard(c)
+        if len(leaf) == 0:
+            del inner[b]
+            if len(inner) == 0: del index[a]
+
+        return None
+
+    @staticmethod
+    def _finds_range(columns: Tuple[np.ndarray, np.ndarray], a: int, b: Optional[int] = None) -> Tuple[int, int]:
+        """Returns the start and end positions of the rows of a pair of sorted columns whose key starts with a (and
+        ends with b, when b is not None)."""
+
+        keys = columns[0]; start = a << id_bits if b is None else (a << id_bits) | b
+        end = (a + 1) << id_bits if b is None else start + 1
+
+        return int(keys.searchsorted(start, 'left')), int(keys.searchsorted(end, 'left'))
+
+    def _finds_position(self, index: str, a: int, b: int, c: int) -> int:
+        """Returns the position of a triple of integer identifiers in one of the sorted indexes, or -1 if it is not
+        in the index."""
+
+        keys, values = self.__columns[index]; key = (a << id_bits) | b
+        start, end = int(keys.searchsorted(key, 'left')), int(keys.searchsorted(key, 'right'))
+        position = start + int(values[start:end].searchsorted(c))  # values are sorted within each key
+
+        return position if position < end and values[position] == c else -1
+
+    @staticmethod
+    def _reads_rows(columns: Tuple[np.ndarray, np.ndarray], start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        """Yields the rows of a pair of sorted columns between two positions as triples of integer identifiers, in the
+        order of the index (e.g. predicate, object, subject for the predicate-object-subject index)."""
+
+        keys, values = columns
+        for x in range(start, end, 65536):
+            key, value = keys[x:min(x + 65536, end)], values[x:min(x + 65536, end)]
+            yield from zip((key >> id_bits).tolist(), (key & id_mask).tolist(), value.tolist())
+
+    def merges_triples(self) -> None:
+        """Merges the added triples into the sorted columns of each index and drops the removed triples from them.
+
+        Returns:
+            None.
+        """
+
+        if len(self.__removed) > 0:
+            removed = np.array(list(self.__removed), dtype=np.int64); self.__removed = set()
+            for index, order in [('spo', (0, 1, 2)), ('pos', (1, 2, 0)), ('osp', (2, 0, 1))]:
+                # numbering the keys in order gives each row an increasing int64 (key number, third identifier)
+                keys, values = self.__columns[index]; groups = np.concatenate([[0], np.cumsum(keys[1:] != keys[:-1])])
+                rows = (groups << 31) | values.astype(np.int64)
+                found = groups[keys.searchsorted((removed[:, order[0]] << id_bits) | removed[:, order[1]])]
+                deleted = rows.searchsorted((found << 31) | removed[:, order[2]])
+                self.__columns[index] = (np.delete(keys, deleted), np.delete(values, deleted))
+        if self.__added > 0:
+            if len(self.__added_log) == 3 * self.__added: triples = np.frombuffer(self.__added_log, dtype=np.int64)
+            else:  # some of the logged triples have been removed
+                triples = np.fromiter((i for s, x in self.__spo.items() for p, y in x.items() for o in y
+                                       for i in (s, p, o)), dtype=np.int64, count=3 * self.__added)
+            triples = triples.reshape(-1, 3)
+            for index, order in [('spo', (0, 1, 2)), ('pos', (1, 2, 0)), ('osp', (2, 0, 1))]:
+                columns = self.__columns[index]; added = (triples[:, order[0]] << id_bits) | triples[:, order[1]]
+                keys, values = np.concatenate([columns[0], added]), np.concatenate([columns[1], triples[:, order[2]]])
+                rows = np.lexsort((values, keys)); self.__columns[index] = (keys[rows], values[rows].astype(np.int32))
+            self.__spo, self.__pos, self.__osp, self.__added, self.__added_log = dict(), dict(), dict(), 0, array('q')
+
+        return None
+
+    def _checks_merge(self) -> None:
+        """Merges the added and removed triples into the sorted columns once there are enough of them."""
+
+        if self.__added + len(self.__removed) >= max(self.merge_size, len(self.__columns['spo'][0]) >> 2):
+            self.merges_triples()
+
+        return None
+
+    def add(self, triple: Tuple, context: Any, quoted: bool = False) -> None:
+        """Adds a triple to the store.
+
+        Args:
+            triple: A tuple of three RDFLib terms.
+            context: The graph adding the triple (ignored, the store is not context aware).
+            quoted: A bool indicating a quoted statement (not supported).
+
+        Returns:
+            None.
+        """
+
+        s, p, o = self.encodes_term(triple[0]), self.encodes_term(triple[1]), self.encodes_term(triple[2])
+        if len(self.__columns['spo'][0]) > 0 and self._finds_position('spo', s, p, o) != -1:
+            if (s, p, o) in self.__removed: self.__removed.discard((s, p, o)); self.__size += 1
+        elif self._indexes_triple(self.__spo, s, p, o):
+            self._indexes_triple(self.__pos, p, o, s); self._indexes_triple(self.__osp, o, s, p)
+            self.__added_log.extend((s, p, o)); self.__size += 1; self.__added += 1; self._checks_merge()
+
+        return None
+
+    def addN(self, quads: Any) -> None:  # noqa: N802
+        """Adds an iterable of quads to the store."""
+
+        for s, p, o, c in quads: self.add((s, p, o), c)
+
+        return None
+
+    def loads_triples(self, terms: List, triples: np.ndarray) -> None:
+        """Adds triples that are encoded as indices into a list of terms (e.g. the binary cache read by
+        pkt_kg.utils.loads_cached_graph). When the store is empty, the sorted columns of each index are built at once
+        from the encoded triples instead of adding the triples one at a time.
+
+        Args:
+            terms: A list of RDFLib URIRefs, BNodes, and Literals.
+            triples: A numpy array with one row of three indices into terms for each triple.
+
+        Returns:
+            None.
+        """
+
+        if len(self.__columns['spo'][0]) > 0 or self.__added > 0:
+            self.addN((terms[s], terms[p], terms[o], None) for s, p, o in triples.tolist())
+        else:
+            term_ids = np.array([self.encodes_term(x) for x in terms], dtype=np.int64)
+            triples = np.unique(term_ids[triples].reshape(-1, 3), axis=0)
+            for index, order in [('spo', (0, 1, 2)), ('pos', (1, 2, 0)), ('osp', (2, 0, 1))]:
+                keys, values = (triples[:, order[0]] << id_bits) | triples[:, order[1]], triples[:, order[2]]
+                rows = np.lexsort((values, keys)); self.__columns[index] = (keys[rows], values[rows].astype(np.int32))
+            self.__size = len(triples)
+
+        return None
+
+    def _matches_columns(self, columns: Dict, s: Optional[int], p: Optional[int], o: Optional[int]) -> Iterator:
+        """Yields the integer identifiers of the merged triples matching a pattern, where None is a wildcard."""
+
+        if s is not None and p is not None:
+            start, end = self._finds_range(columns['spo'], s, p)
+            for x in self._reads_rows(columns['spo'], start, end):
+                if o is None or x[2] == o: yield x
+        elif s is not None and o is not None:
+            start, end = self._finds_range(columns['osp'], o, s)
+            for x in self._reads_rows(columns['osp'], start, end): yield x[1], x[2], x[0]
+        elif s is not None:
+            start, end = self._finds_range(columns['spo'], s)
+            yield from self._reads_rows(columns['spo'], start, end)
+        elif p is not None:
+            start, end = self._finds_range(columns['pos'], p, o)
+            for x in self._reads_rows(columns['pos'], start, end): yield x[2], x[0], x[1]
+        elif o is not None:
+            start, end = self._finds_range(columns['osp'], o)
+            for x in self._reads_rows(columns['osp'], start, end): yield x[1], x[2], x[0]
+        else: yield from self._reads_rows(columns['spo'], 0, len(columns['spo'][0]))
+
+    @staticmethod
+    def _matches_added(indexes: Tuple, s: Optional[int], p: Optional[int], o: Optional[int]) -> Iterator:
+        """Yields the integer identifiers of the added triples that have not been merged yet matching a pattern, where
+        None is a wildcard."""
+
+        spo, pos, osp = indexes
+        if s is not None:
+            preds = spo.get(s, dict())
+            for pid in ([p] if p is not None else list(preds)):
+                objs = preds.get(pid, set())
+                if o is not None:
+                    if o in objs: yield s, pid, o
+                else:
+                    for oid in list(objs): yield s, pid, oid
+        elif p is not None:
+            objs_dict = pos.get(p, dict())
+            for oid in ([o] if o is not None else list(objs_dict)):
+                for sid in list(objs_dict.get(oid, set())): yield sid, p, oid
+        elif o is not None:
+            for sid, preds_set in list(osp.get(o, dict()).items()):
+                for pid in list(preds_set): yield sid, pid, o
+        else:
+            for sid in list(spo):
+                for pid, objs in list(spo.get(sid, dict()).items()):
+                    for oid in list(objs): yield sid, pid, oid
+
+    def _matches_ids(self, triple_pattern: Tuple) -> Iterator[Tuple[int, int, int]]:
+        """Yields the integer identifiers of the triples matching a pattern, where None is a wildcard. The indexes are
+        read as they were when the first triple is requested, so triples merged while matching are not skipped."""
+
+        ids: List[Optional[int]] = [None if x is None else self.__term_ids.get(x, -1) for x in triple_pattern]
+        if -1 in ids: return
+        s, p, o = ids
+        if s is not None and p is not None and o is not None:  # checks a single triple without reading the columns
+            if o in self.__spo.get(s, dict()).get(p, ()) or ((s, p, o) not in self.__removed
+                                                             and self._finds_position('spo', s, p, o) != -1):
+                yield s, p, o
+            return
+        columns, removed, added = dict(self.__columns), self.__removed, (self.__spo, self.__pos, self.__osp)
+        for x in self._matches_columns(columns, s, p, o):
+            if len(removed) == 0 or x not in removed: yield x
+        yield from self._matches_added(added, s, p, o)
+
+    def triples(self, triple_pattern: Tuple, context: Optional[Any] = None) -> Generator:
+        """Yields the triples matching a pattern, where None is a wildcard.
+
+        Args:
+            triple_pattern: A tuple of three RDFLib terms or None.
+            context: The graph requesting the triples (ignored, the store is not context aware).
+
+        Returns:
+            A generator of tuples, each containing a matching triple and an empty iterator of contexts.
+        """
+
+        terms = self.__terms
+        for s, p, o in self._matches_ids(triple_pattern): yield (terms[s], terms[p], terms[o]), iter(())
+
+    def remove(self, triple_pattern: Tuple, context: Optional[Any] = None) -> None:
+        """Removes all of the triples matching a pattern, where None is a wildcard.
+
+        Args:
+            triple_pattern: A tuple of three RDFLib terms or None.
+            context: The graph removing the triples (ignored, the store is not context aware).
+
+        Returns:
+            None.
+        """
+
+        for s, p, o in list(self._matches_ids(triple_pattern)):
+            if o in self.__spo.get(s, dict()).get(p, ()):
+                self._unindexes_triple(self.__spo, s, p, o); self._unindexes_triple(self.__pos, p, o, s)
+                self._unindexes_triple(self.__osp, o, s, p); self.__added -= 1
+            else: self.__removed.add((s, p, o))
+            self.__size -= 1
+        self._checks_merge()
+
+        return None
+
+    def __len__(self, context: Optional[Any] = None) -> int:
+
+        return self.__size
+
+    def contexts(self, triple: Optional[Tuple] = None) -> Generator:
+        """Yields nothing, the store is not context aware."""
+
+        yield from ()
+
+    def bind(self, prefix: str, namespace: Any, override: bool = True) -> None:
+        """Binds a namespace to a prefix."""
+
+        bound_namespace, bound_prefix = self.__namespaces.get(prefix), self.__prefixes.get(namespace)
+        if override:
+            if bound_prefix is not None: del self.__namespaces[bound_prefix]
+            if bound_namespace is not None: del self.__prefixes[bound_namespace]
+            self.__namespaces[prefix] = namespace; self.__prefixes[namespace] = prefix
+        else:
+            namespace = bound_namespace if bound_namespace is not None else namespace
+            prefix = bound_prefix if bound_prefix is not None else prefix
+            self.__namespaces[prefix] = namespace; self.__prefixes[namespace] = prefix
+
+        return None
+
+    def namespace(self, prefix: str) -> Optional[Any]:
+        """Returns the namespace bound to a prefix."""
+
+        return self.__namespaces.get(prefix)
+
+    def prefix(self, namespace: Any) -> Optional[str]:
+        """Returns the prefix bound to a namespace."""
+
+        return self.__prefixes.get(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, Any]]:
+        """Yields the bound prefixes and namespaces."""
+
+        for prefix, namespace in list(self.__namespaces.items()): yield prefix, namespace
+
+
+plugin.register('Integer', Store, 'pkt_kg.utils.triple_store', 'IntegerStore')
@@ -0,0 +1,81 @@
+import unittest
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import RDF, RDFS, OWL
+
+from pkt_kg.utils import *
+
+
+class TestAncestorIndex(unittest.TestCase):
+    """Class to test the ancestor index methods."""
+
+    def setUp(self):
+        # create a hierarchy with two roots, a node with two parents, a cycle, and a self-loop
+        self.nodes = {x: URIRef('http://purl.obolibrary.org/obo/HP_000000{}'.format(x)) for x in range(10)}
+        self.graph = Graph()
+        for child, parent in [(1, 0), (2, 1), (3, 2), (4, 5), (3, 4), (6, 3), (7, 8), (8, 7), (9, 7), (9, 9)]:
+            self.graph.add((self.nodes[child], RDFS.subClassOf, self.nodes[parent]))
+        self.graph.add((self.nodes[1], RDF.type, OWL.Class))
+        self.index = AncestorIndex(self.graph)
+
+        return None
+
+    def test_indexes_graph(self):
+        """Tests the indexes_graph method."""
+
+        self.assertEqual(len(self.index), 10)
+        self.assertEqual(self.index.rel, RDFS.subClassOf)
+        self.assertEqual(list(self.index.parents[self.index.ids[self.nodes[9]]]),
+                         [self.index.ids[x] for x in self.graph.objects(self.nodes[9], RDFS.subClassOf)])
+        self.assertEqual(len(self.index.parents[self.index.ids[self.nodes[0]]]), 0)
+        self.assertNotIn(OWL.Class, self.index.ids)
+
+        return None
+
+    def test_gets_ancestors(self):
+        """Tests the gets_ancestors and finds_ancestors methods."""
+
+        self.assertEqual(self.index.gets_ancestors(self.nodes[0]), [])
+        self.assertEqual(self.index.gets_ancestors(OWL.Class), [])
+        self.assertEqual(set(self.index.gets_ancestors(self.nodes[6])), {self.nodes[x] for x in [0, 1, 2, 3, 4, 5]})
+        self.assertEqual(set(self.index.gets_ancestors(self.nodes[4])), {self.nodes[5]})
+        # members of a cycle are ancestors of each other and of themselves
+        self.assertEqual(set(self.index.gets_ancestors(self.nodes[7])), {self.nodes[7], self.nodes[8]})
+        self.assertEqual(set(self.index.gets_ancestors(self.nodes[9])), {self.nodes[7], self.nodes[8]})
+        # ancestors are stored once for each component
+        component = self.index.components[self.index.ids[self.nodes[3]]]
+        self.assertIs(self.index.finds_ancestors(component), self.index.ancestors[component])
+        self.assertEqual(list(self.index.ancestors[component]), sorted(self.index.ancestors[component]))
+
+        return None
+
+    def test_gets_entity_ancestors(self):
+        """Tests the gets_entity_ancestors method."""
+
+        for node in list(self.nodes.values()) + [OWL.Class, 'HP_0000003']:
+            expected = gets_entity_ancestors(self.graph, [node], RDFS.subClassOf)
+            self.assertEqual(self.index.gets_entity_ancestors(node), expected)
+        self.assertEqual(self.index.gets_entity_ancestors(self.nodes[6])[0], str(self.nodes[0]))
+        # the list of a node with one parent outside of a cycle extends the list of its parent
+        self.assertEqual(self.index.gets_entity_ancestors(self.nodes[2]),
+                         self.index.gets_entity_ancestors(self.nodes[1]) + [str(self.nodes[1])])
+        # lists are stored once for each node
+        self.assertIs(self.index.gets_entity_ancestors(self.nodes[6]), self.index.gets_entity_ancestors(self.nodes[6]))
+
+        return None
+
+    def test_finds_components(self):
+        """Tests the finds_components method."""
+
+        self.index.finds_components()
+        components, ids = self.index.components, self.index.ids
+        self.assertEqual(len(self.index.members), 9)
+        # members of a cycle share a component and other nodes have their own
+        self.assertEqual(components[ids[self.nodes[7]]], components[ids[self.nodes[8]]])
+        members = self.index.members[components[ids[self.nodes[7]]]]
+        self.assertEqual(set(members), {ids[self.nodes[7]], ids[self.nodes[8]]})
+        # components are numbered with ancestors first
+        for child, parent in [(1, 0), (2, 1), (3, 4), (6, 3), (9, 7)]:
+            self.assertLess(components[ids[self.nodes[parent]]], components[ids[self.nodes[child]]])
+
+        return None
@@ -0,0 +1,77 @@
+import unittest
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.collection import Collection
+from rdflib.namespace import OWL, RDF, RDFS
+
+from pkt_kg.utils import *
+
+
+class TestBNodeIndex(unittest.TestCase):
+    """Class to test the anonymous node index methods."""
+
+    def setUp(self):
+        # create a class with an existential restriction and an owl:intersectionOf equivalent class
+        obo = 'http://purl.obolibrary.org/obo/'
+        self.cls, self.graph = URIRef(obo + 'HP_0000001'), Graph()
+        self.rest, self.equiv, self.members, self.rest2 = BNode(), BNode(), BNode(), BNode()
+        self.graph.add((self.cls, RDF.type, OWL.Class))
+        self.graph.add((self.cls, RDFS.label, Literal('test class')))
+        self.graph.add((self.cls, RDFS.subClassOf, self.rest))
+        self.graph.add((self.rest, RDF.type, OWL.Restriction))
+        self.graph.add((self.rest, OWL.onProperty, URIRef(obo + 'RO_0002200')))
+        self.graph.add((self.rest, OWL.someValuesFrom, URIRef(obo + 'HP_0000002')))
+        self.graph.add((self.cls, OWL.equivalentClass, self.equiv))
+        self.graph.add((self.equiv, RDF.type, OWL.Class))
+        self.graph.add((self.rest2, RDF.type, OWL.Restriction))
+        self.graph.add((self.rest2, OWL.onProperty, URIRef(obo + 'RO_0002200')))
+        self.graph.add((self.rest2, OWL.someValuesFrom, URIRef(obo + 'HP_0000003')))
+        Collection(self.graph, self.members, [URIRef(obo + 'HP_0000004'), self.rest2])
+        self.graph.add((self.equiv, OWL.intersectionOf, self.members))
+        self.index = BNodeIndex(self.graph)
+
+        return None
+
+    def test_indexes_graph(self):
+        """Tests the indexes_graph method."""
+
+        self.assertEqual(len(self.index.members), 2)
+        self.assertEqual(len(self.index.out_edges), len(set(x for x in self.graph.subjects() if isinstance(x, BNode))))
+        self.assertEqual(set(self.index.named_bnodes[self.cls]), {self.rest, self.equiv})
+        self.assertEqual(self.index.roots[self.index.components[self.rest]], self.rest)
+        self.assertEqual(self.index.roots[self.index.components[self.rest2]], self.equiv)
+        self.assertEqual(self.index.components[self.members], self.index.components[self.equiv])
+
+        return None
+
+    def test_finds_bnodes(self):
+        """Tests the finds_bnodes method."""
+
+        component = self.index.members[self.index.components[self.equiv]]
+        self.assertEqual(set(self.index.finds_bnodes([self.equiv])), set(component))
+        self.assertEqual(set(self.index.finds_bnodes([self.equiv], use_roots=False)), set(component))
+        self.assertEqual(self.index.finds_bnodes([self.rest2]), [self.rest2])
+        self.assertNotIn(self.rest2, self.index.finds_bnodes([self.equiv], [self.rest2]))
+        self.assertNotIn(self.equiv, self.index.finds_bnodes([self.equiv], [self.equiv]))
+
+        return None
+
+    def test_gets_triples(self):
+        """Tests the gets_triples and gets_class_triples methods."""
+
+        triples = set(x for x in self.graph if isinstance(x[0], BNode))
+        self.assertEqual(set(self.index.gets_class_triples(self.cls)), triples)
+        self.assertEqual(set(self.index.gets_triples([self.rest])), set(self.graph.triples((self.rest, None, None))))
+        self.assertEqual(self.index.gets_class_triples(URIRef('http://purl.obolibrary.org/obo/HP_0000002')), [])
+
+        return None
+
+    def test_gets_component_triples(self):
+        """Tests the gets_component_triples method."""
+
+        triples = set(x for x in self.graph if isinstance(x[0], BNode) and x[0] != self.rest)
+        triples |= {(self.cls, OWL.equivalentClass, self.equiv)}
+        self.assertEqual(self.index.gets_component_triples([self.rest2]), triples)
+        self.assertEqual(self.index.gets_component_triples([BNode()]), set())
+
+        return None
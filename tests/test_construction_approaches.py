@@ -9,11 +9,11 @@ import shutil
 import unittest
 
 from rdflib import Graph, URIRef, BNode
-from rdflib.namespace import OWL, RDF
+from rdflib.namespace import OWL, RDF, RDFS
 from typing import Dict, List, Tuple
 
 from pkt_kg.construction_approaches import KGConstructionApproach
-from pkt_kg.utils import adds_edges_to_graph
+from pkt_kg.utils import adds_edges_to_graph, SubclassMapIndex
 
 
 class TestKGConstructionApproach(unittest.TestCase):
@@ -144,7 +144,7 @@ class TestKGConstructionApproach(unittest.TestCase):
         self.assertIsInstance(self.kg_builder.write_location, str)
 
         # subclass dict
-        self.assertIsInstance(self.kg_builder.subclass_dict, Dict)
+        self.assertIsInstance(self.kg_builder.subclass_dict, SubclassMapIndex)
         self.assertTrue(len(self.kg_builder.subclass_dict) == 15)
 
         # subclass_error dict
@@ -162,7 +162,7 @@ class TestKGConstructionApproach(unittest.TestCase):
 
         # test when entity not in subclass_dict
         # update subclass dict to remove an entry
-        del self.kg_builder.subclass_dict['2']
+        self.kg_builder.subclass_dict = {k: v for k, v in self.kg_builder.subclass_dict.items() if k != '2'}
         result = self.kg_builder.maps_node_to_class('gene-phenotype', '2', ['2', 'HP_0002511'])
         self.assertEqual(None, result)
 
@@ -249,7 +249,7 @@ class TestKGConstructionApproach(unittest.TestCase):
         subclass_map_dict."""
 
         # prepare input vars
-        del self.kg_builder.subclass_dict['2']
+        self.kg_builder.subclass_dict = {k: v for k, v in self.kg_builder.subclass_dict.items() if k != '2'}
 
         # edge_info
         edge_info = {'n1': 'subclass', 'n2': 'class', 'rel': 'RO_0003302', 'inv_rel': None,
@@ -494,6 +494,82 @@ class TestKGConstructionApproach(unittest.TestCase):
 
         return None
 
+    def test_subclass_bulk_constructor(self):
+        """Tests the subclass_bulk_constructor method."""
+
+        # prepare input vars
+        edge_list = self.edge_dict['gene-phenotype']['edge_list'] + [['11', 'HP_0000716']]
+        uri = self.edge_dict['gene-phenotype']['uri']; rel = URIRef('http://purl.obolibrary.org/obo/RO_0003302')
+        gene, hp = URIRef(uri[0] + '2'), URIRef(uri[1] + 'HP_0002511')
+        so = URIRef('http://purl.obolibrary.org/obo/SO_0001217')
+
+        # test method
+        batches = self.kg_builder.subclass_bulk_constructor('gene-phenotype', [x[0] for x in edge_list],
+                                                            [x[1] for x in edge_list], ['subclass', 'class'], uri,
+                                                            'RO_0003302', None)
+        self.assertIsInstance(batches, List)
+        self.assertEqual(len(batches), 11)
+        expected = [(gene, RDFS.subClassOf, so), (so, RDF.type, OWL.Class)] + \
+            list(self.kg_builder.subclass_core_constructor(gene, hp, rel, None))
+        self.assertEqual(batches[0], expected)
+        self.assertEqual(batches[-1], [])
+        self.assertEqual(self.kg_builder.subclass_error['gene-phenotype'], ['11'])
+
+        # check results match the per-edge constructor
+        edge_info = {'n1': 'subclass', 'n2': 'class', 'rel': 'RO_0003302', 'inv_rel': 'RO_0002200', 'uri': uri}
+        batches = self.kg_builder.subclass_bulk_constructor('gene-phenotype', [x[0] for x in edge_list],
+                                                            [x[1] for x in edge_list], ['subclass', 'class'], uri,
+                                                            'RO_0003302', 'RO_0002200')
+        for edge, batch in zip(edge_list, batches):
+            self.assertEqual(batch, self.kg_builder.subclass_constructor(dict(edge_info, edges=edge), 'gene-phenotype'))
+
+        # check typing triples are only emitted once when declared
+        declared = self.kg_builder.subclass_bulk_constructor('gene-phenotype', [x[0] for x in edge_list],
+                                                             [x[1] for x in edge_list], ['subclass', 'class'], uri,
+                                                             'RO_0003302', 'RO_0002200', set())
+        self.assertEqual(set(x for y in declared for x in y), set(x for y in batches for x in y))
+        self.assertTrue(sum(len(x) for x in declared) < sum(len(x) for x in batches))
+        typing = [x for y in declared for x in y if x[1] == RDF.type and x[2] in [OWL.Class, OWL.ObjectProperty]]
+        self.assertEqual(len(typing), len(set(typing)))
+        self.assertEqual(declared[-1], [])
+
+        return None
+
+    def test_instance_bulk_constructor(self):
+        """Tests the instance_bulk_constructor method."""
+
+        # prepare input vars
+        edge_list = self.edge_dict_inst['gene-gene']['edge_list']; uri = self.edge_dict_inst['gene-gene']['uri']
+        rel = URIRef('http://purl.obolibrary.org/obo/RO_0002435')
+        gene1, gene2 = URIRef(uri[0] + '3075'), URIRef(uri[1] + '1080')
+        so = URIRef('http://purl.obolibrary.org/obo/SO_0001217')
+
+        # test method
+        batches = self.kg_builder.instance_bulk_constructor('gene-gene', [x[0] for x in edge_list],
+                                                            [x[1] for x in edge_list], ['instance', 'instance'], uri,
+                                                            'RO_0002435', 'RO_0002435')
+        self.assertEqual(len(batches), 8)
+        expected = [(gene1, RDFS.subClassOf, so), (so, RDF.type, OWL.Class), (gene1, RDF.type, OWL.Class),
+                    (gene2, RDFS.subClassOf, so), (so, RDF.type, OWL.Class), (gene2, RDF.type, OWL.Class)] + \
+            list(self.kg_builder.instance_core_constructor(gene1, gene2, rel, rel))
+        self.assertEqual(batches[0], expected)
+        self.assertEqual(len(self.kg_builder.subclass_error), 0)
+        declared = self.kg_builder.instance_bulk_constructor('gene-gene', [x[0] for x in edge_list],
+                                                             [x[1] for x in edge_list], ['instance', 'instance'], uri,
+                                                             'RO_0002435', 'RO_0002435', set())
+        self.assertEqual(declared[0], list(dict.fromkeys(expected)))
+        self.assertEqual(set(x for y in declared for x in y), set(x for y in batches for x in y))
+
+        # class-class edges
+        edge_list = self.edge_dict_inst['disease-disease']['edge_list']
+        batches = self.kg_builder.instance_bulk_constructor('disease-disease', [x[0] for x in edge_list],
+                                                            [x[1] for x in edge_list], ['class', 'class'], uri,
+                                                            'RO_0002435', None)
+        self.assertEqual(batches[0], list(self.kg_builder.instance_core_constructor(
+            URIRef(uri[0] + 'DOID_3075'), URIRef(uri[1] + 'DOID_1080'), rel, None)))
+
+        return None
+
     def tearDown(self):
 
         # remove resource directory
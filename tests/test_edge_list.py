@@ -5,6 +5,7 @@ import pandas
 import re
 import unittest
 
+from mock import patch
 from typing import List, Tuple
 
 from pkt_kg.edge_list import CreatesEdgeList
@@ -329,3 +330,38 @@ class TestCreatesEdgeList(unittest.TestCase):
         self.assertIn(('19', 'DOID_1936'), self.master_edge_list.source_info['gene-disease']['edge_list'])
 
         return None
+
+    def tests_fingerprints_edge_type(self):
+        """Tests fingerprints_edge_type method."""
+
+        fingerprint = self.master_edge_list.fingerprints_edge_type('gene-disease')
+        self.assertIsInstance(fingerprint, str)
+        self.assertEqual(fingerprint, self.master_edge_list.fingerprints_edge_type('gene-disease'))
+        self.assertNotEqual(fingerprint, self.master_edge_list.fingerprints_edge_type('chemical-disease'))
+
+        # update the resource_info row for the edge type
+        self.master_edge_list.source_info['gene-disease']['column_idx'] = '0;2'
+        self.assertNotEqual(fingerprint, self.master_edge_list.fingerprints_edge_type('gene-disease'))
+
+        return None
+
+    def tests_creates_knowledge_graph_edges_unchanged(self):
+        """Tests creates_knowledge_graph_edges method when the edge data has not changed since the last build."""
+
+        self.master_edge_list.creates_knowledge_graph_edges()
+        fingerprint = self.master_edge_list.source_info['gene-disease']['fingerprint']
+        edge_list = self.master_edge_list.source_info['gene-disease']['edge_list']
+
+        # re-run method and make sure that the edges are reused from the saved master edge list
+        file_loc = self.dir_loc + '/resource_info.txt'
+        master_edge_list = CreatesEdgeList(data_files=self.edge_data_files, source_file=file_loc)
+        for edge_type in ['chemical-disease', 'gene-disease']:
+            maps = self.master_edge_list.source_info[edge_type]['identifier_maps']
+            master_edge_list.source_info[edge_type]['identifier_maps'] = maps
+        with patch.object(CreatesEdgeList, 'data_reader') as mock_data_reader:
+            master_edge_list.creates_knowledge_graph_edges()
+            self.assertFalse(mock_data_reader.called)
+        self.assertEqual(fingerprint, master_edge_list.source_info['gene-disease']['fingerprint'])
+        self.assertEqual(edge_list, master_edge_list.source_info['gene-disease']['edge_list'])
+
+        return None
@@ -0,0 +1,55 @@
+import pickle
+import unittest
+
+from rdflib import Literal, URIRef
+from rdflib.namespace import RDFS
+
+from pkt_kg.utils import *
+
+
+class TestFingerprintSet(unittest.TestCase):
+    """Class to test the FingerprintSet class."""
+
+    def setUp(self):
+        gene = URIRef('https://www.ncbi.nlm.nih.gov/gene/2')
+        self.triples = [(gene, RDFS.label, Literal('A2M')), (gene, RDFS.label, Literal('alpha-2-macroglobulin')),
+                        (gene, RDFS.comment, Literal('A2M'))]
+
+        return None
+
+    def test_updates_set(self):
+        """Tests the updates_set method."""
+
+        fingerprints = FingerprintSet()
+        self.assertEqual(len(fingerprints), 0)
+        self.assertFalse(self.triples[0] in fingerprints)
+
+        # test adding triples, including a repeated triple
+        new = fingerprints.updates_set(self.triples[:2] + [self.triples[0]])
+        self.assertEqual(new, self.triples[:2])
+        self.assertEqual(len(fingerprints), 2)
+        self.assertTrue(self.triples[0] in fingerprints)
+        self.assertFalse(self.triples[2] in fingerprints)
+
+        # test adding triples that are already in the set
+        new = fingerprints.updates_set(iter(reversed(self.triples)))
+        self.assertEqual(new, [self.triples[2]])
+        self.assertEqual(len(fingerprints), 3)
+        self.assertEqual(fingerprints.updates_set([]), [])
+        self.assertTrue(all(fingerprints.fingerprints[:-1] < fingerprints.fingerprints[1:]))
+
+        return None
+
+    def test_fingerprint_set(self):
+        """Tests creating and pickling a FingerprintSet."""
+
+        fingerprints = FingerprintSet(x[2] for x in self.triples)
+        self.assertEqual(len(fingerprints), 2)
+        self.assertTrue(Literal('A2M') in fingerprints)
+
+        # test pickling (e.g. results returned by a worker process)
+        copied = pickle.loads(pickle.dumps(fingerprints))
+        self.assertEqual(len(copied), 2)
+        self.assertTrue(Literal('alpha-2-macroglobulin') in copied)
+
+        return None
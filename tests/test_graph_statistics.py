@@ -0,0 +1,88 @@
+import networkx as nx
+import os
+import os.path
+import unittest
+
+from rdflib import Graph, Literal, Namespace, URIRef  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+
+from pkt_kg.utils import *
+
+# set global attributes
+obo = Namespace('http://purl.obolibrary.org/obo/')
+
+
+class TestGraphStatistics(unittest.TestCase):
+    """Class to test the knowledge graph statistics classes."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data/ontologies')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # create test data
+        self.triples = [(obo.SO_0000001, RDF.type, OWL.Class), (obo.SO_0000002, RDF.type, OWL.Class),
+                        (obo.SO_0000002, RDFS.subClassOf, obo.SO_0000001),
+                        (obo.RO_0000001, RDF.type, OWL.ObjectProperty),
+                        (obo.SO_0000003, RDFS.label, Literal('region')), (obo.SO_0000004, RDFS.seeAlso, obo.SO_0000004)]
+
+        return None
+
+    def test_hyperloglog(self):
+        """Tests the HyperLogLog class."""
+
+        sketch = HyperLogLog()
+        self.assertEqual(sketch.estimates_count(), 0)
+        for i in range(50000): sketch.adds_item(URIRef(obo + 'SO_{}'.format(i % 20000)))
+        self.assertTrue(abs(sketch.estimates_count() - 20000) < 20000 * 0.05)
+
+        # small counts
+        sketch = HyperLogLog()
+        for i in range(100): sketch.adds_item(i)
+        self.assertTrue(abs(sketch.estimates_count() - 100) <= 2)
+
+        return None
+
+    def test_graph_statistics_counts(self):
+        """Tests the GraphStatistics class when keeping counts."""
+
+        stats = GraphStatistics(); stats.updates_statistics(self.triples)
+        self.assertEqual(stats.triples, 6)
+        self.assertEqual(stats.counts_distinct('nodes'), 8)
+        self.assertEqual(stats.counts_distinct('classes'), 2)
+        self.assertEqual(stats.counts_distinct('object_properties'), 1)
+        self.assertEqual(stats.counts_distinct('individuals'), 0)
+        self.assertEqual(stats.gets_top_predicates(1), [(RDF.type, 3)])
+
+        # approximate counts
+        stats = GraphStatistics(approximate=True); stats.updates_statistics(self.triples)
+        self.assertIsInstance(stats.distinct['nodes'], HyperLogLog)
+        self.assertEqual(stats.counts_distinct('nodes'), 8)
+        self.assertEqual(stats.counts_distinct('classes'), 2)
+
+        return None
+
+    def test_graph_statistics_components(self):
+        """Tests the GraphStatistics class when keeping node degrees and connected components."""
+
+        stats = GraphStatistics(components=True); stats.updates_statistics(self.triples)
+        self.assertEqual((stats.triples, stats.self_loops), (6, 1))
+        self.assertEqual(stats.gets_top_degree_nodes(5), [(obo.SO_0000001, 2), (OWL.Class, 2), (obo.SO_0000002, 2),
+                                                          (obo.SO_0000004, 2), (obo.RO_0000001, 1)])
+
+        # connected components
+        components = stats.gets_components()
+        self.assertEqual([x[0] for x in components], [3, 2, 2, 1])
+        self.assertEqual(set(components[0][1]), {obo.SO_0000001, obo.SO_0000002, OWL.Class})
+        self.assertEqual(stats.gets_components(max_members=3)[0], (3, None))
+
+        # compare to networkx
+        graph = Graph().parse(self.dir_loc + '/so_with_imports.owl')
+        stats = GraphStatistics(components=True); stats.updates_statistics(graph)
+        nx_mdg = nx.MultiDiGraph()
+        for s, p, o in graph: nx_mdg.add_edge(s, o, **{'key': p})
+        self.assertEqual(sorted([len(x) for x in nx.connected_components(nx_mdg.to_undirected())], reverse=True),
+                         [x[0] for x in stats.gets_components()])
+
+        return None
@@ -8,7 +8,7 @@ import unittest
 from mock import patch
 from typing import Dict, List, Set, Tuple
 from rdflib import BNode, Graph, Literal, Namespace, URIRef  # type: ignore
-from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS, XSD  # type: ignore
 
 from pkt_kg.utils import *
 
@@ -366,6 +366,39 @@ class TestKGUtils(unittest.TestCase):
 
         return None
 
+    def test_entity_registry(self):
+        """Tests the EntityRegistry class."""
+
+        # read in ontology
+        graph = Graph().parse(self.good_ontology_file_location)
+
+        # build registry from graph
+        registry = EntityRegistry(graph)
+        self.assertEqual(registry.classes, gets_ontology_classes(graph))
+        self.assertEqual(registry.object_properties, gets_object_properties(graph))
+        self.assertEqual(len(registry.individuals), 0)
+
+        # update registry with added triples
+        triples = [(obo.SO_9999999, RDF.type, OWL.Class), (obo.RO_9999999, RDF.type, OWL.ObjectProperty),
+                   (obo.SO_9999998, RDF.type, OWL.NamedIndividual), (BNode('x'), RDF.type, OWL.Class),
+                   (obo.SO_9999999, RDFS.subClassOf, obo.SO_0000287)]
+        registry.updates_registry(triples)
+        self.assertEqual(len(gets_ontology_classes(graph)) + 1, len(registry.classes))
+        self.assertIn(obo.SO_9999999, registry.classes)
+        self.assertIn(obo.RO_9999999, registry.object_properties)
+        self.assertEqual(registry.individuals, {obo.SO_9999998})
+
+        # update registry with removed triples
+        registry.updates_registry(triples, remove=True)
+        self.assertEqual(registry.classes, gets_ontology_classes(graph))
+        self.assertEqual(registry.object_properties, gets_object_properties(graph))
+        self.assertEqual(len(registry.individuals), 0)
+
+        # empty registry
+        self.assertEqual(len(EntityRegistry().classes), 0)
+
+        return None
+
     def test_gets_ontology_class_synonyms(self):
         """Tests the  gets_ontology_class_synonyms method."""
 
@@ -511,6 +544,10 @@ class TestKGUtils(unittest.TestCase):
                          '50 object props, 39 annotation props'
         self.assertEqual(stats, expected_stats)
 
+        # test approximate statistics
+        stats = derives_graph_statistics(graph, approximate=True)
+        self.assertTrue(stats.startswith('Graph Stats (approximate): 42237 triples'))
+
         return None
 
     def test_derives_graph_statistics_nx(self):
@@ -606,3 +643,69 @@ class TestKGUtils(unittest.TestCase):
         if os.path.exists(filepath): os.remove(filepath)
 
         return None
+
+    def test_fingerprints_files(self):
+        """Tests the fingerprints_files method"""
+
+        # create test data and write it locally
+        filepath = self.dir_loc + '/TEST_Fingerprint.txt'
+        with open(filepath, 'w') as out: out.write('test data\n')
+
+        # test method
+        fingerprint = fingerprints_files([filepath], 'subclass')
+        self.assertIsInstance(fingerprint, str)
+        self.assertEqual(fingerprint, fingerprints_files([filepath, filepath], 'subclass'))
+        self.assertNotEqual(fingerprint, fingerprints_files([filepath], 'instance'))
+        self.assertNotEqual(fingerprint, fingerprints_files([filepath + '_missing'], 'subclass'))
+
+        # test method when the file content changes
+        with open(filepath, 'a') as out: out.write('more test data\n')
+        self.assertNotEqual(fingerprint, fingerprints_files([filepath], 'subclass'))
+
+        # clean up environment
+        if os.path.exists(filepath): os.remove(filepath)
+
+        return None
+
+    def test_loads_cached_graph(self):
+        """Tests the loads_cached_graph and writes_graph_cache methods"""
+
+        # create test data and write it locally
+        filepath = self.dir_loc + '/TEST_Graph.owl'
+        graph = Graph()
+        graph.add((obo.CHEBI_9444, RDF.type, OWL.Class))
+        graph.add((obo.CHEBI_9444, RDFS.label, Literal('Teprotide', lang='en')))
+        graph.add((obo.CHEBI_9444, obo.IAO_0000115, Literal('9', datatype=XSD.integer)))
+        graph.add((obo.CHEBI_9444, RDFS.subClassOf, BNode('N1')))
+        graph.add((BNode('N1'), OWL.onProperty, obo.RO_0002200))
+        graph.serialize(filepath, format='xml')
+
+        # test method when there is no cache
+        graph1 = loads_cached_graph(filepath)
+        self.assertTrue(os.path.exists(filepath + '.graph_cache'))
+        self.assertEqual(len(graph1), 5)
+
+        # test method when loading from the cache
+        with patch('pkt_kg.utils.kg_utils.Graph.parse') as mock_parse:
+            graph2 = loads_cached_graph(filepath)
+            self.assertFalse(mock_parse.called)
+        self.assertEqual(set(graph1), set(graph2))
+
+        # test method when the graph file has changed
+        graph.add((obo.CHEBI_9445, RDF.type, OWL.Class)); graph.serialize(filepath, format='xml')
+        graph3 = loads_cached_graph(filepath)
+        self.assertEqual(len(graph3), 6)
+
+        # test method when the cache location is chosen by the caller
+        cache_file = self.dir_loc + '/TEST_Graph_cache.pkl'
+        graph4 = loads_cached_graph(filepath, cache_file=cache_file)
+        self.assertTrue(os.path.exists(cache_file))
+        graph5 = loads_cached_graph(filepath, store='Integer', cache_file=cache_file)
+        self.assertIsInstance(graph5.store, IntegerStore)
+        self.assertEqual(set(graph4), set(graph5))
+
+        # clean up environment
+        for f in [filepath, filepath + '.graph_cache', cache_file]:
+            if os.path.exists(f): os.remove(f)
+
+        return None
@@ -15,9 +15,11 @@ from rdflib.namespace import OWL, RDF
 from typing import Dict, List
 
 from pkt_kg.__version__ import __version__
+from pkt_kg.construction_approaches import KGConstructionApproach
 from pkt_kg.knowledge_graph import FullBuild, PartialBuild, PostClosureBuild
 from pkt_kg.metadata import Metadata
 from pkt_kg.utils import appends_to_existing_file, gets_ontology_classes, gets_object_properties, splits_knowledge_graph
+from pkt_kg.utils import FingerprintSet, IntegerStore
 
 
 class TestKGBuilder(unittest.TestCase):
@@ -267,6 +269,41 @@ class TestKGBuilder(unittest.TestCase):
 
         return None
 
+    def test_class_initialization_parameters_workers(self):
+        """Tests the class initialization parameters for the number of edge construction workers."""
+
+        self.assertRaises(ValueError, FullBuild, 'subclass', 'yes', 'yes', 'yes', self.write_location, 0)
+        self.assertRaises(ValueError, FullBuild, 'subclass', 'yes', 'yes', 'yes', self.write_location, '2')
+        self.assertEqual(self.kg_subclass.workers, 1)
+
+        return None
+
+    def test_class_initialization_parameters_resume(self):
+        """Tests the class initialization parameters for resuming a build from a checkpoint."""
+
+        self.assertRaises(TypeError, FullBuild, 'subclass', 'yes', 'yes', 'yes', self.write_location, 1, 'yes')
+        self.assertFalse(self.kg_subclass.resume)
+        self.assertEqual(self.kg_subclass.checkpoint_dir, self.write_location + '/checkpoints')
+
+        # test checkpoints are only written when requested or when resuming
+        self.assertRaises(TypeError, FullBuild, 'subclass', 'yes', 'yes', 'yes', self.write_location, checkpoint='yes')
+        self.assertFalse(self.kg_subclass.checkpoint)
+        self.assertTrue(FullBuild('subclass', 'yes', 'yes', 'yes', self.write_location, checkpoint=True).checkpoint)
+        self.assertTrue(FullBuild('subclass', 'yes', 'yes', 'yes', self.write_location, resume=True).checkpoint)
+
+        return None
+
+    def test_class_initialization_parameters_store(self):
+        """Tests the class initialization parameters for the graph store backend."""
+
+        self.assertRaises(ValueError, FullBuild, 'subclass', 'yes', 'yes', 'yes', self.write_location, 1, False, 'disk')
+        self.assertEqual(self.kg_subclass.graph_store, 'default')
+        kg = FullBuild('subclass', 'yes', 'yes', 'yes', self.write_location, store='integer')
+        self.assertEqual(kg.graph_store, 'Integer')
+        self.assertIsInstance(kg.graph.store, IntegerStore)
+
+        return None
+
     def test_class_initialization_ontology_data(self):
         """Tests the class initialization for when no merged ontology file is created."""
 
@@ -410,6 +447,8 @@ class TestKGBuilder(unittest.TestCase):
         # test adding a good relation
         new_relation = URIRef('http://purl.obolibrary.org/obo/' + 'RO_0002566')
         self.kg_subclass.verifies_object_property(new_relation)
+        self.assertIn(new_relation, self.kg_subclass.registry.object_properties)
+        self.assertIn((new_relation, RDF.type, OWL.ObjectProperty), self.kg_subclass.graph)
 
         # update list of object properties
         self.kg_subclass.obj_properties = gets_object_properties(self.kg_subclass.graph)
@@ -489,6 +528,40 @@ class TestKGBuilder(unittest.TestCase):
 
         return None
 
+    def test_constructs_edge_type(self):
+        """Tests the constructs_edge_type method."""
+
+        self.kg_subclass.reverse_relation_processor()
+        classes = ['SO_0000162', 'SO_0000196', 'SO_0000323', 'SO_0001490']
+        self.kg_subclass.ont_classes = {URIRef('http://purl.obolibrary.org/obo/' + x) for x in classes}
+
+        # initialize metadata and construction approach classes
+        meta = Metadata(self.kg_subclass.kg_version, self.kg_subclass.write_location, self.kg_subclass.full_kg,
+                        self.kg_subclass.node_data, self.kg_subclass.node_dict)
+        meta.metadata_processor()
+        kg_bld = KGConstructionApproach(self.dir_loc_resources)
+
+        # test method
+        edge_list = self.kg_subclass.edge_dict['gene-phenotype']['edge_list']
+        res, meta_edges, node1, node2 = self.kg_subclass.constructs_edge_type('gene-phenotype', edge_list, None,
+                                                                              kg_bld, meta.creates_node_metadata)
+
+        # check returned results
+        self.assertIsInstance(res, List)
+        self.assertEqual(len(res), 25)
+        self.assertEqual(len(set(res)), len(res))
+        self.assertIsInstance(meta_edges, List)
+        self.assertEqual(len(meta_edges), 18)
+        self.assertIsInstance(node1, FingerprintSet)
+        self.assertEqual(len(node1), 2)
+        self.assertTrue('2' in node1 and '9' in node1)
+        self.assertEqual(len(node2), len(set(classes)))
+        self.assertTrue(all(x in node2 for x in classes))
+        # gene 9 passes the class and metadata checks, but is not in the subclass_dict
+        self.assertEqual(kg_bld.subclass_error, {'gene-phenotype': ['9']})
+
+        return None
+
     def test_creates_new_edges_not_adding_metadata_to_kg(self):
         """Tests the creates_new_edges method without adding node metadata to the KG."""
 
@@ -597,6 +670,88 @@ class TestKGBuilder(unittest.TestCase):
 
         return None
 
+    def test_gets_checkpoint_key(self):
+        """Tests the gets_checkpoint_key method."""
+
+        split_key = self.kg_subclass.gets_checkpoint_key('split')
+        self.assertIsInstance(split_key, str)
+        self.assertEqual(split_key, self.kg_subclass.gets_checkpoint_key('split'))
+        self.assertNotEqual(split_key, self.kg_subclass.gets_checkpoint_key('edges'))
+        self.assertNotEqual(split_key, self.kg_instance2.gets_checkpoint_key('split'))
+
+        # update the edge data and make sure that only the keys for the later steps change
+        edges_key = self.kg_subclass.gets_checkpoint_key('edges')
+        with open(self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'a') as out: out.write(' ')
+        self.assertEqual(split_key, self.kg_subclass.gets_checkpoint_key('split'))
+        self.assertNotEqual(edges_key, self.kg_subclass.gets_checkpoint_key('edges'))
+
+        return None
+
+    def test_writes_and_loads_checkpoint(self):
+        """Tests the writes_checkpoint and loads_checkpoint methods."""
+
+        graph = Graph(); graph.add((URIRef('http://purl.obolibrary.org/obo/SO_0000162'), RDF.type, OWL.Class))
+        graph.add((BNode('N1'), RDF.type, OWL.Class))
+        annot = '/TEST_AnnotationsOnly.nt'
+        with open(self.write_location + annot, 'w') as out: out.write('test annotations\n')
+
+        # test checkpoints are not written unless they are enabled
+        self.kg_subclass.writes_checkpoint('split', {'graph': graph, 'node_dict': {'nodes': {}}}, [annot])
+        self.assertEqual(len(glob.glob(self.kg_subclass.checkpoint_dir + '/split_*')), 0)
+
+        # write checkpoints
+        self.kg_subclass.checkpoint = True
+        self.kg_subclass.writes_checkpoint('split', {'graph': graph, 'node_dict': {'nodes': {}}}, [annot])
+        self.kg_subclass.writes_checkpoint('edges', {'graph': graph, 'node_dict': None})
+        self.assertEqual(len(glob.glob(self.kg_subclass.checkpoint_dir + '/split_*')), 2)
+        self.assertEqual(len(glob.glob(self.kg_subclass.checkpoint_dir + '/edges_*')), 1)
+
+        # test loading checkpoints when not resuming
+        self.assertEqual(self.kg_subclass.loads_checkpoint(['split', 'edges', 'owl_nets']), (None, dict()))
+
+        # test loading checkpoints when resuming
+        self.kg_subclass.resume = True
+        step, state = self.kg_subclass.loads_checkpoint(['split', 'edges', 'owl_nets'])
+        self.assertEqual(step, 'edges')
+        self.assertEqual(list(state['graph']), list(graph))
+        self.assertIsNone(state['node_dict'])
+
+        # test that rewriting an earlier step removes the checkpoints of the later steps
+        with open(self.write_location + annot, 'a') as out: out.write('more test annotations\n')
+        self.kg_subclass.writes_checkpoint('split', {'graph': graph, 'node_dict': {'nodes': {}}}, [annot])
+        self.assertEqual(len(glob.glob(self.kg_subclass.checkpoint_dir + '/edges_*')), 0)
+        with open(self.write_location + annot, 'a') as out: out.write('partial edge annotations\n')
+        step, state = self.kg_subclass.loads_checkpoint(['split', 'edges', 'owl_nets'])
+        self.assertEqual(step, 'split')
+        self.assertEqual(state['node_dict'], {'nodes': {}})
+        with open(self.write_location + annot, 'r') as f_in: self.assertEqual(len(f_in.readlines()), 2)
+
+        return None
+
+    def test_loads_and_writes_edge_cache(self):
+        """Tests the loads_edge_cache and writes_edge_cache methods."""
+
+        # test edge type without a fingerprint
+        self.assertEqual(self.kg_subclass.loads_edge_cache('gene-gene', None), (None, None))
+
+        # test edge type with a fingerprint
+        self.kg_subclass.edge_dict['gene-gene']['fingerprint'] = 'b0a4ea06d4e7da13a4f5df3e7d1e4a26'
+        cache_key, cached = self.kg_subclass.loads_edge_cache('gene-gene', 'RO_0002435')
+        self.assertIsInstance(cache_key, str)
+        self.assertIsNone(cached)
+        self.assertNotEqual(cache_key, self.kg_subclass.loads_edge_cache('gene-gene', None)[0])
+
+        # write results and then make sure they are loaded
+        results = ([(BNode('N1'), RDF.type, OWL.Class)], [], {'1'}, {'2'}, ['2'])
+        self.kg_subclass.writes_edge_cache('gene-gene', cache_key, results)
+        self.assertEqual(self.kg_subclass.loads_edge_cache('gene-gene', 'RO_0002435'), (cache_key, results))
+
+        # update the edge type's fingerprint and make sure the cached results are no longer used
+        self.kg_subclass.edge_dict['gene-gene']['fingerprint'] = 'e1b3b4bb1b0a1e3a8ad4c6e3a0f8f6d2'
+        self.assertIsNone(self.kg_subclass.loads_edge_cache('gene-gene', 'RO_0002435')[1])
+
+        return None
+
     def test_creates_new_edges_instance_no_inverse(self):
         """Tests the creates_new_edges method when applied to a kg with instance-based construction without inverse
         relations."""
@@ -681,6 +836,35 @@ class TestKGBuilder(unittest.TestCase):
 
         return None
 
+    def test_creates_new_edges_instance_inverse_workers(self):
+        """Tests the creates_new_edges method when applied to a kg with instance-based construction with
+        inverse relations using multiple worker processes."""
+
+        self.kg_instance2.reverse_relation_processor()
+        self.kg_instance2.workers = 2
+
+        # make sure that kg is empty
+        self.kg_instance2.graph = Graph()
+
+        # initialize metadata class
+        meta = Metadata(self.kg_instance2.kg_version, self.kg_instance2.write_location, self.kg_instance2.full_kg,
+                        self.kg_instance2.node_data, self.kg_instance2.node_dict)
+        if self.kg_instance2.node_data:
+            meta.metadata_processor(); meta.extract_metadata(self.kg_instance2.graph)
+        self.kg_instance2.node_dict = meta.node_dict
+
+        # test method
+        self.kg_instance2.creates_new_edges(meta.creates_node_metadata)
+
+        # check that the same edges were added to the graph
+        self.assertEqual(len(self.kg_instance2.graph), 64)
+
+        # check graph files were saved
+        full_kg_owl = self.kg_instance2.full_kg.replace('noOWL', 'OWL')
+        self.assertTrue(os.path.exists(self.kg_instance2.write_location + full_kg_owl[:-4] + '_LogicOnly.owl'))
+
+        return None
+
     def test_creates_new_edges_adding_metadata_to_kg_bad(self):
         """Tests the creates_new_edges method and adds node metadata to the KG, but also makes sure that a
         log file is written for genes that are not in the subclass_map."""
@@ -6,8 +6,11 @@ import os.path
 import pandas
 import pickle
 import shutil
+import tempfile
 import unittest
 
+from unittest import mock
+
 from rdflib import Graph
 from typing import Dict, List
 
@@ -18,6 +21,11 @@ class TestPostClosureBuild(unittest.TestCase):
     """Class to test the PostClosureBuild class from the knowledge graph script."""
 
     def setUp(self):
+        # write build step telemetry records to a temporary directory instead of builds/logs
+        telemetry_dir = tempfile.mkdtemp(); self.addCleanup(shutil.rmtree, telemetry_dir, True)
+        telemetry = mock.patch('pkt_kg.utils.telemetry.telemetry_log', telemetry_dir + '/pkt_build_telemetry.jsonl')
+        telemetry.start(); self.addCleanup(telemetry.stop)
+
         # initialize file location
         current_directory = os.path.dirname(__file__)
         dir_loc = os.path.join(current_directory, 'data')
@@ -5,8 +5,8 @@ import os.path
 import pickle
 import unittest
 
-from rdflib import Graph
-from typing import Dict
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDFS
 
 from pkt_kg.metadata import *
 
@@ -55,13 +55,14 @@ class TestMetadata(unittest.TestCase):
         self.metadata.metadata_processor()  # load dictionary
 
         # make sure that the dictionary has the "schtuff"
-        self.assertIsInstance(self.metadata.node_dict, Dict)
+        self.assertIsInstance(self.metadata.node_dict, NodeMetadataStore)
+        self.assertTrue(os.path.exists(self.dir_loc + '/node_data/node_metadata_dict.db'))
         self.assertTrue('nodes' in self.metadata.node_dict.keys())
         self.assertTrue('relations' in self.metadata.node_dict.keys())
 
         # check node dict
         node_key = 'http://www.ncbi.nlm.nih.gov/gene/1'
-        self.assertIsInstance(self.metadata.node_dict['nodes'], Dict)
+        self.assertIsInstance(self.metadata.node_dict['nodes'], NodeMetadataTable)
         self.assertTrue(len(self.metadata.node_dict['nodes']) == 20)
         self.assertIn('Label', self.metadata.node_dict['nodes'][node_key].keys())
         self.assertIn('Synonym', self.metadata.node_dict['nodes'][node_key].keys())
@@ -69,7 +70,7 @@ class TestMetadata(unittest.TestCase):
 
         # check relations dict
         relations_key = 'http://purl.obolibrary.org/obo/RO_0002597'
-        self.assertIsInstance(self.metadata.node_dict['relations'], Dict)
+        self.assertIsInstance(self.metadata.node_dict['relations'], NodeMetadataTable)
         self.assertTrue(len(self.metadata.node_dict['relations']) == 20)
         self.assertIn('Label', self.metadata.node_dict['relations'][relations_key].keys())
         self.assertIn('Synonym', self.metadata.node_dict['relations'][relations_key].keys())
@@ -138,6 +139,33 @@ class TestMetadata(unittest.TestCase):
 
         return None
 
+    def test_creates_node_metadata_cache(self):
+        """Tests that the creates_node_metadata method creates the triples for each entity once."""
+
+        node_dict = {'nodes': {'http://www.ncbi.nlm.nih.gov/gene/1': {'Label': 'A1BG', 'Description': None,
+                                                                      'Synonym': 'ABG|A1B'}}, 'relations': {}}
+        self.metadata.node_dict = node_dict
+        updated_graph_1 = self.metadata.creates_node_metadata(ent=['http://www.ncbi.nlm.nih.gov/gene/1'],
+                                                              e_type=['entity'])
+        self.assertEqual(len(updated_graph_1), 3)
+        updated_graph_2 = self.metadata.creates_node_metadata(ent=['http://www.ncbi.nlm.nih.gov/gene/1'],
+                                                              e_type=['entity'])
+        self.assertEqual(updated_graph_1, updated_graph_2)
+        self.assertTrue(all(x is y for x, y in zip(updated_graph_1, updated_graph_2)))
+
+        # test that replacing the node_dict clears the cached triples
+        self.metadata.node_dict = {'nodes': {'http://www.ncbi.nlm.nih.gov/gene/1': {'Label': 'A1BG'}}}
+        updated_graph_3 = self.metadata.creates_node_metadata(ent=['http://www.ncbi.nlm.nih.gov/gene/1'],
+                                                              e_type=['entity'])
+        self.assertEqual(len(updated_graph_3), 1)
+
+        # test that the cache is not pickled
+        copied = pickle.loads(pickle.dumps(self.metadata))
+        self.assertEqual(copied.creates_node_metadata(ent=['http://www.ncbi.nlm.nih.gov/gene/1'], e_type=['entity']),
+                         updated_graph_3)
+
+        return None
+
     def test_creates_node_metadata_none(self):
         """Tests the creates_node_metadata method when node_dict is None."""
 
@@ -173,9 +201,9 @@ class TestMetadata(unittest.TestCase):
         """Tests the extract_metadata data."""
 
         org_file_size = os.path.getsize(self.metadata.node_data[0])
+        self.assertIsInstance(self.metadata.node_dict, NodeMetadataStore)
 
         # extract metadata
-        self.metadata.node_data = [self.metadata.node_data[0].replace('.pkl', '_test.pkl')]
         self.metadata.extract_metadata(graph=self.graph)
 
         # check that it worked
@@ -192,8 +220,34 @@ class TestMetadata(unittest.TestCase):
         self.assertIn('Description', self.metadata.node_dict['relations'][relation_key])
         self.assertIn('Synonym', self.metadata.node_dict['relations'][relation_key])
 
-        # check that larger dict was saved
-        self.assertTrue(os.path.getsize(self.metadata.node_data[0]) >= org_file_size)
+        # check that the metadata was saved to the store and that the pickled dict was not changed
+        store = NodeMetadataStore(self.metadata.node_dict.db_file)
+        self.assertEqual(len(store['nodes']), 2461)
+        self.assertEqual(store['nodes'][node_key], self.metadata.node_dict['nodes'][node_key])
+        self.assertEqual(os.path.getsize(self.metadata.node_data[0]), org_file_size)
+        store.close()
+
+        return None
+
+    def test_gets_entity_annotations(self):
+        """Tests the gets_entity_annotations method."""
+
+        graph = Graph(); entity = URIRef('http://purl.obolibrary.org/obo/SO_0000373')
+        exact = URIRef('http://www.geneontology.org/formats/oboInOwl#hasExactSynonym')
+        related = URIRef('http://www.geneontology.org/formats/oboInOwl#hasRelatedSynonym')
+        graph.add((entity, RDFS.label, Literal('ds_RNA')))
+        graph.add((entity, exact, Literal('double stranded RNA')))
+        graph.add((entity, RDFS.comment, Literal('a comment')))
+        graph.add((entity, related, Literal('dsRNA')))
+        graph.add((URIRef('http://purl.obolibrary.org/obo/SO_0000374'), RDFS.comment, Literal('a comment')))
+
+        annotations = self.metadata.gets_entity_annotations(
+            graph, [entity, entity, URIRef('http://purl.obolibrary.org/obo/SO_0000374')])
+        self.assertEqual(list(annotations.keys()), [entity])
+        self.assertEqual(annotations[entity]['Label'], [Literal('ds_RNA')])
+        self.assertNotIn('Description', annotations[entity])
+        self.assertEqual(annotations[entity]['Synonym'], list(graph.objects(entity, exact)) +
+                         list(graph.objects(entity, related)))
 
         return None
 
@@ -249,6 +303,34 @@ class TestMetadata(unittest.TestCase):
 
         return None
 
+    def test_output_metadata_rows(self):
+        """Tests the output_metadata method rows."""
+
+        self.metadata.write_location = ''  # update environment var
+        self.metadata.full_kg = self.dir_loc + '/ontologies/TEST.owl'
+        self.metadata.node_dict = {
+            'nodes': {'http://www.ncbi.nlm.nih.gov/gene/1': {'Label': 'A1BG', 'Description': None, 'Synonym': 'ABG'},
+                      'http://www.ncbi.nlm.nih.gov/gene/3': {'Label': 'A2MP1', 'Description': None, 'Synonym': None}},
+            'relations': {'http://purl.obolibrary.org/obo/RO_0002435': {'Label': 'genetically interacts with',
+                                                                       'Description': 'é', 'Synonym': None}}}
+        node_ints = {'<http://www.ncbi.nlm.nih.gov/gene/1>': 1, '<http://purl.obolibrary.org/obo/RO_0002435>': 2,
+                     '<http://www.ncbi.nlm.nih.gov/gene/2>': 3}
+        graph = {(URIRef('http://www.ncbi.nlm.nih.gov/gene/1'), URIRef('http://purl.obolibrary.org/obo/RO_0002435'),
+                  URIRef('http://www.ncbi.nlm.nih.gov/gene/2'))}
+
+        # run function
+        self.metadata.output_metadata(node_ints, graph, chunk_size=2)
+        with open(self.dir_loc + '/ontologies/TEST_NodeLabels.txt', encoding='utf-8') as f: lines = f.readlines()
+        self.assertEqual(lines[1:], ['NODES\t1\t<http://www.ncbi.nlm.nih.gov/gene/1>\tA1BG\tNone\tABG\n',
+                                     'RELATIONS\t2\t<http://purl.obolibrary.org/obo/RO_0002435>\tgenetically '
+                                     'interacts with\té\tNone\n',
+                                     'NA\t3\t<http://www.ncbi.nlm.nih.gov/gene/2>\tNA\tNA\tNA\n'])
+
+        # remove file
+        os.remove(self.dir_loc + '/ontologies/TEST_NodeLabels.txt')
+
+        return None
+
     def test_adds_ontology_annotations(self):
         """Tests the adds_ontology_annotations method."""
 
@@ -279,5 +361,7 @@ class TestMetadata(unittest.TestCase):
             test_data_location = glob.glob(self.dir_loc + '/node_data/*_test.pkl')
             if len(test_data_location) > 0:
                 os.remove(test_data_location[0])
+        if isinstance(self.metadata.node_dict, NodeMetadataStore): self.metadata.node_dict.close()
+        for store_file in glob.glob(self.dir_loc + '/node_data/*.db'): os.remove(store_file)
 
         return None
@@ -0,0 +1,96 @@
+import os
+import os.path
+import pickle
+import shutil
+import unittest
+
+from pkt_kg.utils import *
+
+
+class TestNodeMetadataStore(unittest.TestCase):
+    """Class to test the node metadata store methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+        self.write_location = self.dir_loc + '/node_metadata_store'
+        os.mkdir(self.write_location)
+
+        # create node metadata
+        self.node_dict = {
+            'nodes': {'http://www.ncbi.nlm.nih.gov/gene/1': {'Label': 'A1BG', 'Description': None,
+                                                             'Synonym': 'HYST2477alpha-1B-glycoprotein|ABG'},
+                      'http://www.ncbi.nlm.nih.gov/gene/2': {'Label': 'A2M', 'Description': 'é', 'Synonym': None}},
+            'relations': {}}
+        self.pickle_file = self.write_location + '/node_metadata_dict.pkl'
+        with open(self.pickle_file, 'wb') as f: pickle.dump(self.node_dict, f, protocol=4)
+
+        return None
+
+    def test_loads_node_metadata_store(self):
+        """Tests the loads_node_metadata_store method."""
+
+        # test creating the store
+        store = loads_node_metadata_store(self.pickle_file)
+        self.assertTrue(os.path.exists(self.write_location + '/node_metadata_dict.db'))
+        self.assertIsInstance(store, NodeMetadataStore)
+        self.assertEqual(list(store), ['nodes', 'relations'])
+        self.assertEqual({k: dict(v.items()) for k, v in store.items()}, self.node_dict)
+        self.assertEqual(len(store['relations']), 0)
+        self.assertRaises(KeyError, store.__getitem__, 'classes')
+        store.close()
+
+        # test re-using the store
+        mtime = os.stat(self.write_location + '/node_metadata_dict.db').st_mtime_ns
+        store = loads_node_metadata_store(self.pickle_file); store.close()
+        self.assertEqual(os.stat(self.write_location + '/node_metadata_dict.db').st_mtime_ns, mtime)
+
+        # test recreating the store when the pickled dictionary changes
+        with open(self.pickle_file, 'wb') as f: pickle.dump({'nodes': {}}, f, protocol=4)
+        store = loads_node_metadata_store(self.pickle_file)
+        self.assertEqual(list(store), ['nodes'])
+        self.assertEqual(len(store['nodes']), 0)
+        store.close()
+
+        # test recreating an invalid store
+        with open(self.write_location + '/node_metadata_dict.db', 'wb') as f: f.write(b'not a store' * 100)
+        store = loads_node_metadata_store(self.pickle_file)
+        self.assertEqual(list(store), ['nodes'])
+        store.close()
+
+        return None
+
+    def test_updates_metadata(self):
+        """Tests the updates_metadata method and looking up metadata."""
+
+        store = NodeMetadataStore(self.write_location + '/node_metadata_dict.db', batch_size=1)
+        store.updates_metadata('nodes', self.node_dict['nodes'])
+        node = 'http://www.ncbi.nlm.nih.gov/gene/1'
+        self.assertTrue(node in store['nodes'])
+        self.assertTrue(node in store['nodes'].keys())
+        self.assertFalse('http://www.ncbi.nlm.nih.gov/gene/3' in store['nodes'])
+        self.assertEqual(store['nodes'][node], self.node_dict['nodes'][node])
+        self.assertIsNone(store['nodes'].get('http://www.ncbi.nlm.nih.gov/gene/3'))
+
+        # test updating metadata keeps the order of the entities
+        store.updates_metadata('nodes', iter([('http://www.ncbi.nlm.nih.gov/gene/3', {'Label': 'NAT1'}),
+                                              (node, {'Label': 'A1BG', 'Description': None, 'Synonym': None})]))
+        self.assertEqual(list(store['nodes']), ['http://www.ncbi.nlm.nih.gov/gene/1',
+                                                'http://www.ncbi.nlm.nih.gov/gene/2',
+                                                'http://www.ncbi.nlm.nih.gov/gene/3'])
+        self.assertEqual(store['nodes'][node]['Synonym'], None)
+
+        # test pickling the store (e.g. a store used by a worker process)
+        copied = pickle.loads(pickle.dumps(store))
+        self.assertEqual(len(copied['nodes']), 3)
+        self.assertEqual(copied['nodes'][node], store['nodes'][node])
+        store.close(); copied.close()
+
+        return None
+
+    def tearDown(self):
+        shutil.rmtree(self.write_location)
+
+        return None
@@ -0,0 +1,87 @@
+import gzip
+import os
+import os.path
+import unittest
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import OWL, RDF, RDFS
+
+from pkt_kg.utils import *
+
+
+class TestNTriplesWriter(unittest.TestCase):
+    """Class to test the buffered n-triples writer methods."""
+
+    def setUp(self):
+        # initialize file location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+        self.filepath = self.dir_loc + '/TEST_Writer.nt'
+
+        # create test data
+        self.triples = [(URIRef('http://purl.obolibrary.org/obo/CHEBI_9444'), RDFS.label, Literal('Teprotide')),
+                        (URIRef('http://purl.obolibrary.org/obo/CHEBI_9444'), RDF.type, OWL.Class),
+                        (BNode('Nf72db1a3dc964ce3b0cd2ea4c7142af5'), RDF.type, OWL.Class),
+                        (URIRef('http://purl.obolibrary.org/obo/CHEBI_9444'), RDFS.comment,
+                         Literal('a "b"\nc', lang='en'))]
+
+        return None
+
+    def test_writes_triples(self):
+        """Tests the writes_triples method."""
+
+        with NTriplesWriter(self.filepath, 'w', buffer_size=2) as writer:
+            writer.writes_triples(self.triples[:3]); writer.writes_triples(self.triples[3:])
+        self.assertEqual(writer.triple_count, 4)
+        with open(self.filepath) as f: lines = f.readlines()
+        self.assertEqual(lines, [' '.join([n3(x) for x in triple]) + ' .\n' for triple in self.triples])
+        self.assertEqual(len(Graph().parse(self.filepath, format='nt')), 4)
+        self.assertRaises(ValueError, writer.writes_triples, self.triples)
+
+        # test appending to an existing file
+        with NTriplesWriter(self.filepath) as writer: writer.writes_triples(self.triples[:1])
+        with open(self.filepath) as f: self.assertEqual(len(f.readlines()), 5)
+
+        return None
+
+    def test_serializes_term(self):
+        """Tests the serializes_term method."""
+
+        writer = NTriplesWriter(self.filepath, 'w', max_cached_terms=2)
+        self.assertEqual(writer.serializes_term(self.triples[0][0]), '<http://purl.obolibrary.org/obo/CHEBI_9444>')
+        self.assertEqual(writer.serializes_term(self.triples[0][2]), '"Teprotide"')
+        self.assertEqual(len(writer.terms), 2)
+        self.assertEqual(writer.serializes_term(self.triples[3][2]), n3(self.triples[3][2]))
+        self.assertEqual(len(writer.terms), 1)
+        writer.close(); writer.close()
+        self.assertEqual(len(writer.terms), 0)
+
+        return None
+
+    def test_writes_triples_gzip(self):
+        """Tests the writes_triples method when compressing the output file."""
+
+        with NTriplesWriter(self.filepath, 'w', 'gzip', buffer_size=1) as writer: writer.writes_triples(self.triples)
+        self.assertEqual(writer.filepath, self.filepath + '.gz')
+        with NTriplesWriter(self.filepath + '.gz', 'a', 'gzip') as writer: writer.writes_triples(self.triples[:1])
+        with gzip.open(self.filepath + '.gz', 'rt') as f: lines = f.readlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[:4], [' '.join([n3(x) for x in triple]) + ' .\n' for triple in self.triples])
+
+        return None
+
+    def test_initialization(self):
+        """Tests the class initialization."""
+
+        self.assertRaises(ValueError, NTriplesWriter, self.filepath, 'r')
+        self.assertRaises(ValueError, NTriplesWriter, self.filepath, 'w', 'bz2')
+        self.assertFalse(os.path.exists(self.filepath))
+
+        return None
+
+    def tearDown(self):
+        for filepath in [self.filepath, self.filepath + '.gz']:
+            if os.path.exists(filepath): os.remove(filepath)
+
+        return None
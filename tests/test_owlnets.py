@@ -2,14 +2,19 @@ import glob
 import logging
 import os
 import shutil
+import tempfile
 import unittest
 
+from unittest import mock
+
 from rdflib import Graph, BNode, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
+from statistics import mode
 from typing import Dict, List, Set, Tuple
 
-from pkt_kg.owlnets import OwlNets
-from pkt_kg.utils import adds_edges_to_graph
+from pkt_kg.construction_approaches import KGConstructionApproach
+from pkt_kg.owlnets import OwlNets, TermClasses, term_entity, term_excluded, term_hierarchy, term_owl, term_support
+from pkt_kg.utils import adds_edges_to_graph, gets_entity_ancestors, gets_ontology_classes
 
 # set namespace
 obo = Namespace('http://purl.obolibrary.org/obo/')
@@ -19,6 +24,11 @@ class TestOwlNets(unittest.TestCase):
     """Class to test the OwlNets class from the owlnets script."""
 
     def setUp(self):
+        # write build step telemetry records to a temporary directory instead of builds/logs
+        telemetry_dir = tempfile.mkdtemp(); self.addCleanup(shutil.rmtree, telemetry_dir, True)
+        telemetry = mock.patch('pkt_kg.utils.telemetry.telemetry_log', telemetry_dir + '/pkt_build_telemetry.jsonl')
+        telemetry.start(); self.addCleanup(telemetry.stop)
+
         # initialize file location
         current_directory = os.path.dirname(__file__)
         dir_loc = os.path.join(current_directory, 'data')
@@ -94,6 +104,16 @@ class TestOwlNets(unittest.TestCase):
 
         return None
 
+    def test_initialization_workers(self):
+        """Tests the class initialization state for the workers parameter."""
+
+        self.assertEqual(self.owl_nets.workers, 1)
+        for workers in [0, -1, 1.5, True]:
+            self.assertRaises(ValueError, OwlNets, kg_construct_approach='subclass', graph=self.graph,
+                              write_location=self.write_location, filename=self.kg_filename, workers=workers)
+
+        return None
+
     def test_initialization_state_graph(self):
         """Tests the class initialization state for graphs."""
 
@@ -212,6 +232,30 @@ class TestOwlNets(unittest.TestCase):
 
         return None
 
+    def test_updates_pkt_namespace_identifiers_subclass_batched(self):
+        """Tests the updates_pkt_namespace_identifiers method for a subclass-based construction approach when the
+        edges are built one at a time and when they are built in a batch with typing triples only emitted once."""
+
+        edges = [(obo.DOID_3075, obo.DOID_1080), (obo.DOID_1080, obo.DOID_0001), (obo.DOID_3075, obo.DOID_0002)]
+        core = KGConstructionApproach.subclass_core_constructor; declared: Set = set()
+        per_edge = [list(set(core(x[0], x[1], obo.RO_0003302, obo.RO_0002200))) for x in edges]
+        batched = [list(core(x[0], x[1], obo.RO_0003302, obo.RO_0002200, declared=declared)) for x in edges]
+
+        # run method on graphs built from each set of triples in both directions
+        results = []
+        for batches in [per_edge, batched, [x[::-1] for x in per_edge], [x[::-1] for x in batched]]:
+            self.owl_nets.graph = adds_edges_to_graph(Graph(), [x for y in batches for x in y])
+            self.owl_nets.updates_pkt_namespace_identifiers(); results += [set(self.owl_nets.graph)]
+        for result in results[1:]: self.assertEqual(result, results[0])
+        self.assertFalse(any(str(x).startswith('https://github.com/callahantiff/PheKnowLator/pkt/')
+                             for y in results[0] for x in y))
+        restrictions = {(x[0], x[2]) for x in results[0] if x[1] == RDFS.subClassOf and isinstance(x[2], BNode)}
+        values = {(x[0], x[2]) for x in results[0] if x[1] == OWL.someValuesFrom}
+        self.assertEqual({(x[0], y[1]) for x in restrictions for y in values if x[1] == y[0]},
+                         set(edges) | {(x[1], x[0]) for x in edges})
+
+        return None
+
     def test_removes_disjoint_with_axioms(self):
         """Tests the removes_disjoint_with_axioms method."""
 
@@ -251,6 +295,26 @@ class TestOwlNets(unittest.TestCase):
 
         return None
 
+    def test_classifies_terms(self):
+        """Tests the classifies_terms method."""
+
+        term_flags = self.owl_nets.classifies_terms()
+        self.assertIsInstance(term_flags, TermClasses)
+        self.assertEqual(len(term_flags), 0)
+        self.assertIsNone(term_flags[BNode('N194ae548a89740849c3536d9753d39d8')])
+        self.assertIsNone(term_flags[Literal('SO_0000784')])
+        self.assertEqual(term_flags[obo.SO_0000784] & (term_entity | term_excluded), term_entity)
+        self.assertEqual(term_flags[obo.BFO_0000001] & term_excluded, term_excluded)
+        self.assertEqual(term_flags[obo.IAO_0000115] & term_support, term_support)
+        self.assertEqual(term_flags[OWL.Class] & term_owl, term_owl)
+        self.assertEqual(term_flags[RDFS.subClassOf], term_hierarchy)
+        self.assertEqual(len(term_flags), 7)
+
+        # test without reading rdf:type triples
+        self.assertEqual(self.owl_nets.classifies_terms(types=False)[obo.SO_0000784], 0)
+
+        return None
+
     def test_recurses_axioms(self):
         """Tests the recurses_axioms method."""
 
@@ -587,6 +651,27 @@ class TestOwlNets(unittest.TestCase):
 
         return None
 
+    def test_cleans_owl_encoded_classes_workers(self):
+        """Tests the cleans_owl_encoded_classes method when decoding with more than one worker process."""
+
+        # set-up inputs
+        node_list = list(gets_ontology_classes(self.owl_nets.graph))[:50] + [obo.SO_0000822]
+        self.owl_nets.node_list = list(node_list)
+        decoded_graph = self.owl_nets.cleans_owl_encoded_classes()
+        owl_nets = OwlNets(kg_construct_approach='subclass', graph=self.graph, write_location=self.write_location,
+                           filename=self.kg_filename, workers=3)
+        owl_nets.node_list = list(node_list)
+
+        # test method
+        decoded_graph_workers = owl_nets.cleans_owl_encoded_classes()
+        self.assertEqual(owl_nets.node_list, [])
+        self.assertEqual(set(decoded_graph_workers), set(decoded_graph))
+        self.assertEqual(owl_nets.owl_nets_dict['owl_nets'], self.owl_nets.owl_nets_dict['owl_nets'])
+        self.assertEqual(owl_nets.owl_nets_dict['negation'], self.owl_nets.owl_nets_dict['negation'])
+        self.assertEqual(owl_nets.owl_nets_dict['complementOf'], self.owl_nets.owl_nets_dict['complementOf'])
+
+        return None
+
     def test_makes_graph_connected_default(self):
         """Tests the makes_graph_connected method using the default argument for common_ancestor."""
 
@@ -611,6 +696,33 @@ class TestOwlNets(unittest.TestCase):
 
         return None
 
+    def test_makes_graph_connected_ancestors(self):
+        """Tests that the makes_graph_connected method adds the triples found from gets_entity_ancestors."""
+
+        # create a hierarchy with paths of different lengths, a cycle, a self-loop, and nodes without ancestors
+        edges = [(1, RDFS.subClassOf, 0), (2, RDFS.subClassOf, 1), (2, RDFS.subClassOf, 3), (4, RDFS.subClassOf, 5),
+                 (4, RDFS.subClassOf, 6), (6, RDFS.subClassOf, 7), (5, RDFS.subClassOf, 8), (8, RDFS.subClassOf, 9),
+                 (10, RDFS.subClassOf, 11), (11, RDFS.subClassOf, 10), (12, RDFS.subClassOf, 12),
+                 (13, obo.RO_0002200, 2), (13, obo.RO_0002200, 4), (13, obo.RO_0002200, 6), (14, obo.RO_0002200, 15)]
+        graph = adds_edges_to_graph(Graph(), [(obo['HP_{}'.format(x[0])], x[1], obo['HP_{}'.format(x[2])])
+                                              for x in edges] + [(obo.HP_0, RDFS.subClassOf, obo.BFO_0000001)])
+
+        # find the triples needed to connect the graph by querying the graph for the ancestors of each node
+        roots: Set = set()
+        for x in set(x for y in graph for x in [y[0], y[2]] if isinstance(x, URIRef)):
+            ancs = gets_entity_ancestors(graph, [x], RDFS.subClassOf)
+            if len(ancs) == 0:
+                ancs = [x for y in [gets_entity_ancestors(graph, [i], RDFS.subClassOf)
+                                    for i in set(graph.objects(x, None))] for x in y]
+                ancs = [mode(ancs)] if len(ancs) > 0 else [x]
+            roots |= {ancs[0]}
+        needed_triples = set((URIRef(x), RDFS.subClassOf, obo.BFO_0000001) for x in roots if x != obo.BFO_0000001)
+
+        connected_graph = self.owl_nets.makes_graph_connected(Graph() + graph)
+        self.assertEqual(set(connected_graph) - set(graph), needed_triples)
+
+        return None
+
     def test_purifies_graph_build_none(self):
         """Tests the purifies_graph_build method when kg_construction is None."""
 
@@ -0,0 +1,94 @@
+import os
+import os.path
+import pickle
+import shutil
+import unittest
+
+from pkt_kg.utils import *
+
+
+class TestSubclassMap(unittest.TestCase):
+    """Class to test the subclass construction map index methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+        self.write_location = self.dir_loc + '/subclass_map_index'
+        os.mkdir(self.write_location)
+
+        # create subclass mapping data
+        self.subcls_map = {'2': ['SO_0001217'], '10': ['SO_0001217', 'PR_000013648'], 'R-HSA-1': {'PW_0000001'},
+                           'é': []}
+        self.pickle_file = self.write_location + '/subclass_construction_map.pkl'
+        with open(self.pickle_file, 'wb') as f: pickle.dump(self.subcls_map, f, protocol=4)
+
+        return None
+
+    def test_loads_subclass_map_index(self):
+        """Tests the loads_subclass_map_index and writes_subclass_map_index methods."""
+
+        # test creating the index
+        index = loads_subclass_map_index(self.pickle_file)
+        self.assertTrue(os.path.exists(self.write_location + '/subclass_construction_map.idx'))
+        self.assertIsInstance(index, SubclassMapIndex)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(list(index), ['10', '2', 'R-HSA-1', 'é'])
+        self.assertEqual(index['10'], ['SO_0001217', 'PR_000013648'])
+        self.assertEqual(index['R-HSA-1'], ['PW_0000001'])
+        self.assertEqual(index['é'], [])
+        self.assertEqual(dict(index), {k: sorted(v) if isinstance(v, set) else v for k, v in self.subcls_map.items()})
+        index.close()
+
+        # test re-using the index
+        mtime = os.stat(self.write_location + '/subclass_construction_map.idx').st_mtime_ns
+        index = loads_subclass_map_index(self.pickle_file); index.close()
+        self.assertEqual(os.stat(self.write_location + '/subclass_construction_map.idx').st_mtime_ns, mtime)
+
+        # test rebuilding the index when the pickled map changes
+        with open(self.pickle_file, 'wb') as f: pickle.dump({'9': ['SO_0001217']}, f, protocol=4)
+        index = loads_subclass_map_index(self.pickle_file)
+        self.assertEqual(dict(index), {'9': ['SO_0001217']})
+        index.close()
+
+        # test rebuilding an invalid index
+        with open(self.write_location + '/subclass_construction_map.idx', 'wb') as f: f.write(b'not an index')
+        index = loads_subclass_map_index(self.pickle_file)
+        self.assertEqual(dict(index), {'9': ['SO_0001217']})
+        index.close()
+
+        return None
+
+    def test_subclass_map_index(self):
+        """Tests the SubclassMapIndex class."""
+
+        # test an invalid index
+        with open(self.write_location + '/bad.idx', 'wb') as f: f.write(b'0' * 128)
+        self.assertRaises(ValueError, SubclassMapIndex, self.write_location + '/bad.idx')
+
+        # test lookups
+        writes_subclass_map_index(self.subcls_map, self.write_location + '/map.idx')
+        index = SubclassMapIndex(self.write_location + '/map.idx')
+        self.assertTrue('2' in index)
+        self.assertFalse('3' in index)
+        self.assertFalse(2 in index)
+        self.assertIsNone(index.get('3'))
+        self.assertEqual(index.get('3', []), [])
+        self.assertRaises(KeyError, index.__getitem__, '3')
+        # returned lists are copies
+        index['2'].append('SO_0000704')
+        self.assertEqual(index['2'], ['SO_0001217'])
+
+        # test pickling (e.g. sending the index to a worker process)
+        copied = pickle.loads(pickle.dumps(index))
+        self.assertEqual(copied.index_file, index.index_file)
+        self.assertEqual(dict(copied), dict(index))
+        copied.close(); index.close()
+
+        return None
+
+    def tearDown(self):
+        shutil.rmtree(self.write_location)
+
+        return None
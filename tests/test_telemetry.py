@@ -0,0 +1,72 @@
+import importlib
+import json
+import os
+import os.path
+import unittest
+
+from unittest import mock
+
+import pkt_kg.utils.telemetry
+from pkt_kg.utils import *
+
+
+class TestTelemetry(unittest.TestCase):
+    """Class to test the build telemetry methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+        self.log_file = self.dir_loc + '/TEST_build_telemetry.jsonl'
+
+        return None
+
+    def test_gets_resource_usage(self):
+        """Tests the gets_resource_usage method."""
+
+        cpu_time, peak_rss = gets_resource_usage()
+        self.assertIsInstance(cpu_time, float)
+        self.assertIsInstance(peak_rss, float)
+        self.assertTrue(peak_rss > 0)
+
+        return None
+
+    def test_records_build_step(self):
+        """Tests the records_build_step and writes_telemetry_record methods."""
+
+        # test a completed step
+        with records_build_step('split', 100, {'build': 'full'}, self.log_file) as record:
+            record['output_triples'] = 80
+        # test a step without triple counts
+        with records_build_step('relations', log_file=self.log_file): pass
+        # test a failed step
+        with self.assertRaises(ValueError):
+            with records_build_step('edges', 10, log_file=self.log_file): raise ValueError('test')
+
+        with open(self.log_file, 'r') as f: records = [json.loads(x) for x in f.readlines()]
+        self.assertEqual([x['step'] for x in records], ['split', 'relations', 'edges'])
+        self.assertEqual([x['status'] for x in records], ['completed', 'completed', 'failed'])
+        keys = ['started', 'pid', 'wall_time_sec', 'cpu_time_sec', 'peak_rss_delta_mb', 'triples_per_sec']
+        self.assertTrue(all(key in x for x in records for key in keys))
+        self.assertEqual(records[0]['build'], 'full')
+        self.assertEqual((records[0]['input_triples'], records[0]['output_triples']), (100, 80))
+        self.assertTrue(records[0]['triples_per_sec'] > 0)
+        self.assertIsNone(records[1]['triples_per_sec'])
+        self.assertEqual(records[2]['input_triples'], 10)
+
+        return None
+
+    def test_telemetry_log_environment(self):
+        """Tests setting the telemetry file with the PKT_TELEMETRY_LOG environment variable."""
+
+        with mock.patch.dict(os.environ, {'PKT_TELEMETRY_LOG': self.log_file}):
+            self.assertEqual(importlib.reload(pkt_kg.utils.telemetry).telemetry_log, self.log_file)
+        self.assertTrue(importlib.reload(pkt_kg.utils.telemetry).telemetry_log.endswith('/pkt_build_telemetry.jsonl'))
+
+        return None
+
+    def tearDown(self):
+        if os.path.exists(self.log_file): os.remove(self.log_file)
+
+        return None
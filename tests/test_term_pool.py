@@ -0,0 +1,63 @@
+import pickle
+import unittest
+
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, XSD
+
+from pkt_kg.utils import *
+
+
+class TestTermPool(unittest.TestCase):
+    """Class to test the term interning methods."""
+
+    def setUp(self):
+        self.pool = TermPool()
+
+        return None
+
+    def test_interns_uri(self):
+        """Tests the interns_uri method."""
+
+        uri = self.pool.interns_uri('http://purl.obolibrary.org/obo/RO_0002436')
+        self.assertIsInstance(uri, URIRef)
+        self.assertEqual(uri, URIRef('http://purl.obolibrary.org/obo/RO_0002436'))
+        self.assertIs(self.pool.interns_uri('http://purl.obolibrary.org/obo/' + 'RO_0002436'), uri)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 1))
+
+        return None
+
+    def test_interns_literal(self):
+        """Tests the interns_literal method."""
+
+        label = self.pool.interns_literal('BRCA1')
+        self.assertEqual(label, Literal('BRCA1'))
+        self.assertIs(self.pool.interns_literal('BRCA1'), label)
+        self.assertEqual(self.pool.interns_literal('BRCA1', lang='en'), Literal('BRCA1', lang='en'))
+        self.assertEqual(self.pool.interns_literal('1', str(XSD.integer)), Literal('1', datatype=XSD.integer))
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 3))
+
+        return None
+
+    def test_interns_triples(self):
+        """Tests the interns_term and interns_triples methods."""
+
+        uri = self.pool.interns_uri('https://www.ncbi.nlm.nih.gov/gene/2')
+        label = self.pool.interns_literal('1', str(XSD.integer))
+        bnode = BNode('N1')
+        # unpickled triples contain new copies of the terms
+        triples = pickle.loads(pickle.dumps([(uri, RDFS.label, label), (uri, RDF.type, bnode)]))
+        self.assertIsNot(triples[0][0], uri)
+        interned = self.pool.interns_triples(triples)
+        self.assertEqual(interned, triples)
+        self.assertIs(interned[0][0], uri); self.assertIs(interned[1][0], uri)
+        self.assertIs(interned[0][2], label)
+        self.assertIs(interned[0][1], self.pool.interns_uri(str(RDFS.label)))
+        self.assertIs(interned[1][2], triples[1][2])  # BNodes are not pooled
+
+        # test statistics
+        stats = self.pool.gets_statistics()
+        self.assertEqual(stats, {'terms': 4, 'hits': 4, 'misses': 4, 'hit_rate': 0.5})
+        self.pool.clears_pool()
+        self.assertEqual(self.pool.gets_statistics(), {'terms': 0, 'hits': 0, 'misses': 0, 'hit_rate': None})
+
+        return None
@@ -0,0 +1,177 @@
+import numpy as np  # type: ignore
+import os
+import os.path
+import unittest
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef  # type: ignore
+from rdflib.compare import isomorphic  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+
+from pkt_kg.utils import *
+
+# set global attributes
+obo = Namespace('http://purl.obolibrary.org/obo/')
+
+
+class TestIntegerStore(unittest.TestCase):
+    """Class to test the integer-encoded triple store."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data/ontologies')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # create test data
+        self.triples = [(obo.CHEBI_9444, RDF.type, OWL.Class),
+                        (obo.CHEBI_9444, RDFS.label, Literal('Teprotide', lang='en')),
+                        (obo.CHEBI_9444, RDFS.label, Literal('Teprotide')),
+                        (obo.CHEBI_9444, RDFS.subClassOf, BNode('N1')),
+                        (BNode('N1'), RDF.type, OWL.Restriction),
+                        (BNode('N1'), OWL.onProperty, obo.RO_0002200),
+                        (BNode('N1'), OWL.someValuesFrom, obo.HP_0000001),
+                        (obo.HP_0000001, RDF.type, OWL.Class)]
+        self.graph = Graph(store='Integer')
+        for x in self.triples: self.graph.add(x)
+
+        return None
+
+    def test_store_type(self):
+        """Tests the store plugin is used by the graph."""
+
+        self.assertIsInstance(self.graph.store, IntegerStore)
+        self.assertIsInstance(Graph(store=type(self.graph.store)()).store, IntegerStore)
+
+        return None
+
+    def test_add(self):
+        """Tests the add method."""
+
+        self.assertEqual(len(self.graph), 8)
+        self.assertEqual(set(self.graph), set(self.triples))
+
+        # test adding duplicate triples
+        self.graph.add(self.triples[0]); self.graph.addN([self.triples[1] + (self.graph,)])
+        self.assertEqual(len(self.graph), 8)
+
+        # test literals are kept distinct
+        self.assertEqual(len(list(self.graph.objects(obo.CHEBI_9444, RDFS.label))), 2)
+
+        return None
+
+    def test_triples(self):
+        """Tests the triples method for each triple pattern."""
+
+        memory_graph = Graph()
+        for x in self.triples: memory_graph.add(x)
+        for s, p, o in self.triples + [(obo.CHEBI_1, RDF.type, OWL.Class)]:
+            for pattern in [(s, None, None), (None, p, None), (None, None, o), (s, p, None), (None, p, o),
+                            (s, None, o), (s, p, o), (None, None, None)]:
+                self.assertEqual(set(self.graph.triples(pattern)), set(memory_graph.triples(pattern)))
+        self.assertIn((BNode('N1'), OWL.onProperty, obo.RO_0002200), self.graph)
+        self.assertNotIn((BNode('N1'), OWL.onProperty, obo.RO_0000001), self.graph)
+
+        return None
+
+    def test_remove(self):
+        """Tests the remove method."""
+
+        # test removing a single triple
+        self.graph.remove((obo.CHEBI_9444, RDFS.subClassOf, BNode('N1')))
+        self.assertEqual(len(self.graph), 7)
+        self.assertEqual(len(list(self.graph.triples((None, None, BNode('N1'))))), 0)
+
+        # test removing a pattern
+        self.graph.remove((None, RDF.type, None))
+        self.assertEqual(len(self.graph), 4)
+        self.assertEqual(len(list(self.graph.triples((None, RDF.type, None)))), 0)
+
+        # test removing a triple not in the graph
+        self.graph.remove((obo.CHEBI_1, RDF.type, OWL.Class))
+        self.assertEqual(len(self.graph), 4)
+
+        # test the removed triple can be added again
+        self.graph.add((obo.HP_0000001, RDF.type, OWL.Class))
+        self.assertEqual(len(self.graph), 5)
+
+        return None
+
+    def test_merges_triples(self):
+        """Tests the merges_triples method and matching triples before and after they are merged."""
+
+        memory_graph = Graph()
+        for x in self.triples: memory_graph.add(x)
+        self.graph.store.merges_triples()
+        self.assertEqual(len(self.graph), 8)
+        self.assertEqual(list(self.graph), [x for x in self.triples if x[0] == obo.CHEBI_9444] +
+                         [x for x in self.triples if x[0] != obo.CHEBI_9444])
+
+        # test added and removed triples are matched along with the merged triples
+        self.graph.add((obo.HP_0000001, RDFS.subClassOf, obo.HP_0000118))
+        memory_graph.add((obo.HP_0000001, RDFS.subClassOf, obo.HP_0000118))
+        self.graph.remove((None, RDFS.label, None)); memory_graph.remove((None, RDFS.label, None))
+        self.graph.add(self.triples[1]); memory_graph.add(self.triples[1])
+        for _ in range(2):
+            self.assertEqual(len(self.graph), 8)
+            for s, p, o in self.triples:
+                for pattern in [(s, None, None), (None, p, None), (None, None, o), (s, p, None), (None, p, o),
+                                (s, None, o), (s, p, o), (None, None, None)]:
+                    self.assertEqual(set(self.graph.triples(pattern)), set(memory_graph.triples(pattern)))
+            self.graph.store.merges_triples()
+
+        # test triples are merged while they are added
+        graph = Graph(store='Integer'); graph.store.merge_size = 2
+        for x in self.triples: graph.add(x)
+        for x in self.triples[:4]: graph.remove(x)
+        self.assertEqual(set(graph), set(self.triples[4:]))
+        for x in self.triples[:4]: graph.add(x)
+        self.assertEqual(set(graph), set(self.triples))
+        self.assertEqual(len(graph), 8)
+
+        # test removing triples that share a key with many other triples
+        graph = Graph(store='Integer'); classes = [obo['HP_{:07d}'.format(x)] for x in range(200)]
+        for x in reversed(classes): graph.add((x, RDF.type, OWL.Class))
+        graph.store.merges_triples()
+        for x in classes[::2]: graph.remove((x, RDF.type, OWL.Class))
+        graph.store.merges_triples()
+        self.assertEqual(set(graph.subjects(RDF.type, OWL.Class)), set(classes[1::2]))
+        self.assertIn((classes[1], RDF.type, OWL.Class), graph)
+        self.assertNotIn((classes[0], RDF.type, OWL.Class), graph)
+
+        return None
+
+    def test_loads_triples(self):
+        """Tests the loads_triples method."""
+
+        terms = list(set(x for y in self.triples for x in y))
+        triples = np.array([[terms.index(x) for x in y] for y in self.triples + self.triples[:1]], dtype=np.int32)
+
+        # test loading triples into an empty store
+        graph = Graph(store='Integer'); graph.store.loads_triples(terms, triples)
+        self.assertEqual(len(graph), 8)
+        self.assertEqual(set(graph), set(self.triples))
+        self.assertEqual(set(graph.triples((None, RDF.type, None))), set(self.graph.triples((None, RDF.type, None))))
+
+        # test loading triples into a store that already has triples
+        graph = Graph(store='Integer'); graph.add(self.triples[0]); graph.store.loads_triples(terms, triples)
+        self.assertEqual(len(graph), 8)
+        self.assertEqual(set(graph), set(self.triples))
+
+        return None
+
+    def test_serialize(self):
+        """Tests serializing and parsing a graph using the store."""
+
+        filepath = self.dir_loc + '/TEST_IntegerStore.nt'
+        self.graph.bind('obo', obo)
+        self.assertEqual(self.graph.store.namespace('obo'), URIRef(obo))
+        self.assertEqual(self.graph.store.prefix(URIRef(obo)), 'obo')
+        self.graph.serialize(filepath, format='nt')
+        graph = Graph(store='Integer').parse(filepath, format='nt')
+        self.assertEqual(len(graph), 8)
+        self.assertTrue(isomorphic(graph, self.graph))
+
+        # clean up environment
+        os.remove(filepath)
+
+        return None